@@ -38,6 +38,11 @@ class BaseChannelInitKwargs(TypedDict, total=False):
 class BaseChannel[N: Node](Entity):
     def __init__(self, name: str, **kwargs: Unpack[BaseChannelInitKwargs]):
         super().__init__(name=name)
+        self.id = -1
+        """
+        Dense integer identifier assigned by ``QuantumNetwork``, -1 if unassigned.
+        Quantum channels and classic channels are numbered separately, each starting from zero.
+        """
         self.node_list: list[N] = []
         self._next_send_time: Time
 
@@ -61,7 +66,7 @@ class BaseChannel[N: Node](Entity):
         super().install(simulator)
         self._next_send_time = simulator.ts
 
-    def _send(self, *, packet_repr: str, packet_len: int, next_hop: N) -> tuple[bool, Time]:
+    def _send(self, *, packet_repr: str, packet_len: int, next_hop: N, random_drop=True) -> tuple[bool, Time]:
         now = self.simulator.tc
 
         if next_hop not in self.node_list:
@@ -79,15 +84,22 @@ class BaseChannel[N: Node](Entity):
         else:
             send_time = now
 
-        # random drop
-        if self.drop_rate > 0 and rng.random() < self.drop_rate:
-            log.debug(f"{self}: drop {packet_repr} due to drop rate")
+        if random_drop and self.decide_random_drop(packet_repr):
             return True, Time.SENTINEL
 
         # add delay
         recv_time = send_time + self.delay.calculate()
         return False, recv_time
 
+    def decide_random_drop(self, packet_repr: str) -> bool:
+        """
+        Decide whether a packet is randomly dropped according to ``drop_rate``.
+        """
+        if self.drop_rate > 0 and rng.random() < self.drop_rate:
+            log.debug(f"{self}: drop {packet_repr} due to drop rate")
+            return True
+        return False
+
     def find_peer(self, own: N) -> N:
         """
         Return the node in node_list that is not ``own``.
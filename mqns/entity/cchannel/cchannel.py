@@ -28,13 +28,20 @@
 import json
 from typing import Any, Unpack, final, override
 
-from mqns.entity.base_channel import BaseChannel, BaseChannelInitKwargs
+from mqns.entity.base_channel import BaseChannel, BaseChannelInitKwargs, NextHopNotConnectionException
 from mqns.entity.node import Node
-from mqns.simulator import Event, Time
+from mqns.simulator import Event, Time, func_to_event
 
 
 class ClassicPacket:
-    """ClassicPacket is the message that transfer on a ClassicChannel"""
+    """
+    ClassicPacket is the message that transfer on a ClassicChannel.
+
+    Within the simulation, the message object is passed by reference and is never serialized.
+    Both sender and receivers must treat it as immutable; a receiver that needs to modify the message
+    should make a copy first.
+    JSON serialization only occurs when the packet crosses a ``ClassicConnector`` boundary.
+    """
 
     def __init__(self, msg: Any, *, src: Node, dest: Node):
         """
@@ -45,12 +52,21 @@ class ClassicPacket:
             dest: the destination of this message,
 
         """
-        self.is_json, self.msg = (False, msg) if isinstance(msg, (str, bytes)) else (True, json.dumps(msg))
+        self.is_json = not isinstance(msg, (str, bytes))
+        self.msg = msg
         self.src = src
         self.dest = dest
+        self.batch: list[ClassicPacket] | None = None
+        """
+        If this packet is a coalesced batch created by ``ClassicChannel``, the enclosed packets.
+        The receiving node would process each enclosed packet in order, as if they were sent separately.
+        """
+        self._len = -1
 
     def encode(self) -> bytes:
-        """Encode the self.msg if it is a ``str``."""
+        """Encode the message as ``bytes``, serializing as JSON if necessary."""
+        if self.is_json:
+            return json.dumps(self.msg).encode(encoding="utf-8")
         if isinstance(self.msg, str):
             return self.msg.encode(encoding="utf-8")
         assert isinstance(self.msg, bytes)
@@ -58,21 +74,48 @@ class ClassicPacket:
 
     def get(self) -> Any:
         """Get the message from packet."""
-        return json.loads(self.msg) if self.is_json else self.msg
+        return self.msg
 
     def __len__(self) -> int:
-        return len(self.msg)
+        """
+        Serialized length of the message.
+        It is computed upon first access, which only happens on a bandwidth-limited channel.
+        """
+        if self._len < 0:
+            if self.batch is not None:
+                self._len = sum(len(pkt) for pkt in self.batch)
+            else:
+                self._len = len(json.dumps(self.msg)) if self.is_json else len(self.msg)
+        return self._len
+
+
+class ClassicChannelInitKwargs(BaseChannelInitKwargs, total=False):
+    coalesce: bool
+    """
+    Whether to coalesce packets sent to the same next hop within the same time slot, defaults to False.
 
+    If enabled, packets are held until all other events in the current time slot have been processed,
+    and then transmitted as a single batch packet, which reduces event count and per-packet overhead.
+    The receiving node processes each enclosed packet in order, at the same time the batch packet arrives.
 
-class ClassicChannelInitKwargs(BaseChannelInitKwargs):
-    pass
+    The batch packet has the transmitting node as its source, while enclosed packets keep their own source.
+    Bandwidth and buffer limits apply to the batch as a whole, with its length being the sum of enclosed packets.
+    Random drop is still decided for each enclosed packet, so that losses are not correlated within a batch.
+    This option requires the channel to connect exactly two nodes.
+    """
 
 
 class ClassicChannel(BaseChannel[Node]):
     """ClassicChannel is the channel for classic message"""
 
+    COALESCE_PRIORITY = 0x7FFFFFFF
+    """Priority of the event that transmits coalesced packets, after regular events in the same time slot."""
+
     def __init__(self, name: str, **kwargs: Unpack[ClassicChannelInitKwargs]):
         super().__init__(name, **kwargs)
+        self.coalesce = kwargs.get("coalesce", False)
+        """Whether to coalesce packets sent to the same next hop within the same time slot."""
+        self._coalesce_pending: dict[Node, list[ClassicPacket]] = {}
 
     @override
     def handle(self, event: Event):
@@ -88,9 +131,51 @@ class ClassicChannel(BaseChannel[Node]):
             NextHopNotConnectionException: the next_hop is not connected to this channel
 
         """
+        if not self.coalesce:
+            self._send_packet(packet, next_hop)
+            return
+
+        if (pending := self._coalesce_pending.get(next_hop)) is not None:
+            pending.append(packet)
+            return
+
+        if next_hop not in self.node_list:
+            raise NextHopNotConnectionException(f"{self}: not connected to {next_hop}")
+        self._coalesce_pending[next_hop] = [packet]
+        event = func_to_event(self.simulator.tc, self._send_coalesced, next_hop)
+        event.priority = self.COALESCE_PRIORITY
+        self.simulator.add_event(event)
+
+    def _send_coalesced(self, next_hop: Node) -> None:
+        pending = self._coalesce_pending.pop(next_hop)
+        if len(pending) == 1:
+            self._send_packet(pending[0], next_hop)
+            return
+
+        packet = ClassicPacket(None, src=self.find_peer(next_hop), dest=next_hop)
+        packet.batch = pending
         drop, recv_time = self._send(
             packet_repr=f"packet {packet}",
-            packet_len=len(packet),
+            packet_len=len(packet) if self.bandwidth != 0 else 0,
+            next_hop=next_hop,
+            random_drop=False,
+        )
+
+        if drop:
+            return
+
+        packet.batch = [pkt for pkt in pending if not self.decide_random_drop(f"packet {pkt}")]
+        if not packet.batch:
+            return
+        packet.msg = [pkt.msg for pkt in packet.batch]
+
+        send_event = RecvClassicPacket(t=recv_time, cchannel=self, packet=packet, dest=next_hop)
+        self.simulator.add_event(send_event)
+
+    def _send_packet(self, packet: ClassicPacket, next_hop: Node) -> None:
+        drop, recv_time = self._send(
+            packet_repr=f"packet {packet}",
+            packet_len=len(packet) if self.bandwidth != 0 else 0,
             next_hop=next_hop,
         )
 
@@ -116,4 +201,9 @@ class RecvClassicPacket(Event):
 
     @override
     def invoke(self) -> None:
-        self.dest.handle(self)
+        if self.packet.batch is None:
+            self.dest.handle(self)
+            return
+
+        for packet in self.packet.batch:
+            self.dest.handle(RecvClassicPacket(t=self.t, name=self.name, cchannel=self.cchannel, packet=packet, dest=self.dest))
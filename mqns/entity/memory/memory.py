@@ -108,6 +108,12 @@ class QuantumMemory(Entity):
         Key is quantum channel assigned to qubits.
         Value is a sorted list of qubit addrs.
         """
+        self._by_epr_id: dict[int, int] = {}
+        """
+        Mapping from stored entanglement to qubit addr.
+        Key is ``Entanglement.id``.
+        Value is qubit addr.
+        """
 
     @override
     def install(self, simulator: Simulator) -> None:
@@ -179,6 +185,40 @@ class QuantumMemory(Entity):
             if (has is None or type(data) is has) and predicate(qubit, data):
                 yield (qubit, data)
 
+    @overload
+    def locate(self, epr_id: int) -> int | None:
+        """
+        Find the qubit that stores an entanglement.
+
+        Args:
+            epr_id: ``Entanglement.id``.
+
+        Returns:
+            Qubit address, or None if the entanglement is not stored.
+        """
+
+    @overload
+    def locate(self, epr_id: int, *, must: Literal[True]) -> int:
+        """
+        Find the qubit that stores an entanglement.
+
+        Args:
+            epr_id: ``Entanglement.id``.
+            must: True.
+
+        Returns:
+            Qubit address.
+
+        Raises:
+            IndexError: the entanglement is not stored.
+        """
+
+    def locate(self, epr_id: int, *, must=False) -> int | None:
+        addr = self._by_epr_id.get(epr_id)
+        if addr is None and must:
+            raise IndexError(f"{self}: cannot find EPR {epr_id}")
+        return addr
+
     def assign(self, ch: QuantumChannel, *, n=1) -> list[int]:
         """
         Assign n qubits to a particular quantum channel.
@@ -362,6 +402,8 @@ class QuantumMemory(Entity):
             qubit.set_event(QuantumMemory, None)  # cancel scheduled decoherence event
             self._usage -= 1
             self._storage[qubit.addr] = (qubit, None)
+            if isinstance(data, Entanglement):
+                self._by_epr_id.pop(data.id, None)
 
         return qubit, data
 
@@ -398,8 +440,11 @@ class QuantumMemory(Entity):
         self._storage[qubit.addr] = (qubit, data)
         if old is None:
             self._usage += 1
+        elif isinstance(old, Entanglement):
+            self._by_epr_id.pop(old.id, None)
 
         if isinstance(data, Entanglement):
+            self._by_epr_id[data.id] = qubit.addr
             self._schedule_decohere(qubit, data)
         elif old is not None:
             qubit.set_event(QuantumMemory, None)  # cancel old decoherence event
@@ -412,6 +457,7 @@ class QuantumMemory(Entity):
             qubit.reset_state()
             self._storage[qubit.addr] = (qubit, None)
         self._usage = 0
+        self._by_epr_id.clear()
 
     def _schedule_decohere(self, qubit: MemoryQubit, epr: Entanglement):
         from mqns.network.protocol.event import QubitDecoheredEvent  # noqa: PLC0415
@@ -49,6 +49,11 @@ class Node(Entity):
             apps: applications on the node.
         """
         super().__init__(name)
+        self.id = -1
+        """
+        Dense integer identifier assigned by ``QuantumNetwork``, -1 if unassigned.
+        Quantum nodes are numbered from zero in ``QuantumNetwork.nodes`` order, followed by the controller.
+        """
         self.cchannels: list["ClassicChannel"] = []
         """Classic channels connected to this node."""
         self._cchannel_by_dst = dict["Node", "ClassicChannel"]()
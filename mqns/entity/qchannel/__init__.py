@@ -1,5 +1,5 @@
 from mqns.entity.base_channel import NextHopNotConnectionException
-from mqns.entity.qchannel.link_arch import LinkArch, LinkArchAlways, LinkArchParameters
+from mqns.entity.qchannel.link_arch import LinkArch, LinkArchAlways, LinkArchBase, LinkArchParameters
 from mqns.entity.qchannel.link_arch_dim import LinkArchDimBk, LinkArchDimBkSeq, LinkArchDimDual
 from mqns.entity.qchannel.link_arch_sim import LinkArchSim
 from mqns.entity.qchannel.link_arch_sr import LinkArchSr
@@ -8,6 +8,7 @@ from mqns.entity.qchannel.qchannel import QuantumChannel, QuantumChannelInitKwar
 __all__ = [
     "LinkArch",
     "LinkArchAlways",
+    "LinkArchBase",
     "LinkArchDimBk",
     "LinkArchDimBkSeq",
     "LinkArchDimDual",
@@ -1,16 +1,19 @@
 import copy
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import NotRequired, Protocol, TypedDict, Unpack, override
+from collections.abc import Callable, Hashable
+from typing import ClassVar, NotRequired, Protocol, TypedDict, Unpack, override
 
 from mqns.entity.node import QNode
 from mqns.models.delay import DelayModel
 from mqns.models.epr import Entanglement, EntanglementInitKwargs, MixedStateEntanglement, WernerStateEntanglement
-from mqns.models.error import ErrorModel, TimeDecayFunc, time_decay_nop
+from mqns.models.error import ErrorModel, TimeDecayFunc, time_decay_key, time_decay_nop
 from mqns.simulator import Time
 
 type MakeEprFunc = Callable[[EntanglementInitKwargs], Entanglement]
 
+type _SetResult = tuple[float, float, float, float, MakeEprFunc]
+"""Cached ``LinkArchBase.set()`` result: success_prob, attempt_interval, d_notify_a, d_notify_b, make_epr."""
+
 
 class ChannelParameters(Protocol):
     """QuantumChannel parameters related to LinkArch."""
@@ -141,17 +144,68 @@ class LinkArch(Protocol):
 
 
 class LinkArchBase(ABC, LinkArch):
+    _set_cache: ClassVar[dict[Hashable, _SetResult]] = {}
+    """
+    Content-addressed cache of ``set()`` results, shared among all instances.
+
+    Many qchannels in a topology have identical parameters, and a qchannel is re-initialized each time
+    it is activated. The cache avoids recomputing probabilities, timings, and the mini simulation.
+    It holds at most ``_set_cache_size`` entries, evicting the oldest, and is cleared when a network
+    is installed into a simulator.
+    """
+    _set_cache_size: ClassVar[int] = 256
+
     def __init__(self, name: str):
         self.name = name
         self.success_prob = 0.0
         self.attempt_interval = 0.0
         self.d_notify_a = 0.0
         self.d_notify_b = 0.0
+        self._make_epr: MakeEprFunc
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Invalidate all cached ``set()`` results.
+
+        This should be called if a delay model, error model, or memory time-based decay function
+        has been modified in a way that is not reflected in the cache key, see ``_cache_key()``.
+        """
+        LinkArchBase._set_cache.clear()
+
+    def _cache_key(self, d: LinkArchParameters, tau_l: float) -> Hashable:
+        """
+        Compute cache key of ``set()`` parameters.
+        Subclass with additional constructor parameters should extend the key.
+
+        Error models are compared by ``ErrorModel.cache_key()``.
+        Memory time-based decay functions are compared by ``time_decay_key()``.
+        """
+        ch = d["ch"]
+        key = (type(self), ch.length, ch.alpha, tau_l, d["eta_s"], d["eta_d"], d["reset_time"], d["tau_0"], d["epr_type"])
+        if (init_fidelity := d.get("init_fidelity")) is not None:
+            return (*key, init_fidelity)
+        return (
+            *key,
+            d.get("t0", Time.SENTINEL).accuracy,
+            tuple(time_decay_key(f) for f in d.get("store_decays", (time_decay_nop, time_decay_nop))),
+            ch.transfer_error.cache_key(),
+            ch.bsa_error.cache_key(),
+        )
 
     @override
     def set(self, **kwargs: Unpack[LinkArchParameters]) -> None:
         ch = kwargs["ch"]
         tau_l = ch.delay.calculate()
+
+        key = self._cache_key(kwargs, tau_l)
+        if (cached := self._set_cache.get(key)) is None:
+            if len(self._set_cache) >= self._set_cache_size:
+                del self._set_cache[next(iter(self._set_cache))]
+            cached = self._set_cache[key] = self._set_compute(kwargs, ch, tau_l)
+        self.success_prob, self.attempt_interval, self.d_notify_a, self.d_notify_b, self._make_epr = cached
+
+    def _set_compute(self, kwargs: LinkArchParameters, ch: ChannelParameters, tau_l: float) -> _SetResult:
         for _ in range(16):
             assert ch.delay.calculate() == tau_l, "QuantumChannel.delay must be constant"
 
@@ -169,7 +223,7 @@ class LinkArchBase(ABC, LinkArch):
         )
 
         if (init_fidelity := kwargs.get("init_fidelity")) is None:
-            self._make_epr: MakeEprFunc = self._prepare_make_epr(kwargs, ch, tau_l)
+            make_epr = self._prepare_make_epr(kwargs, ch, tau_l)
         else:
             epr_type = kwargs["epr_type"]
             assert 0 <= init_fidelity <= 1
@@ -179,7 +233,9 @@ class LinkArchBase(ABC, LinkArch):
                 epr.fidelity = init_fidelity
                 return epr
 
-            self._make_epr = _make_epr_with_init_fidelity
+            make_epr = _make_epr_with_init_fidelity
+
+        return self.success_prob, self.attempt_interval, self.d_notify_a, self.d_notify_b, make_epr
 
     @abstractmethod
     def _compute_success_prob(self, *, length: float, alpha: float, eta_s: float, eta_d: float) -> float:
@@ -290,8 +346,10 @@ class LinkArchBase(ABC, LinkArch):
         mem_a, mem_b = src.memory, dst.memory
         epr = self._make_epr(
             EntanglementInitKwargs(
+                id=src.simulator.next_epr_id(),
                 decohere_time=t_epr_creation + min(mem_a.t_decohere, mem_b.t_decohere),
                 fidelity_time=t_epr_creation,
+                creation_time=t_epr_creation,
                 src=src,
                 dst=dst,
                 store_decays=(mem_a.time_decay, mem_b.time_decay),
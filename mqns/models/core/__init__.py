@@ -1,7 +1,15 @@
 from mqns.models.core.basis import BASIS_X, BASIS_Y, BASIS_Z, Basis, MeasureOutcome
+from mqns.models.core.kraus import KrausChannel
 from mqns.models.core.model import QuantumModel
 from mqns.models.core.operator import Operator
-from mqns.models.core.state import ATOL, QubitRho, QubitState
+from mqns.models.core.state import (
+    ATOL,
+    QubitRho,
+    QubitState,
+    ValidationLevel,
+    get_validation_level,
+    set_validation_level,
+)
 
 __all__ = [
     "ATOL",
@@ -9,11 +17,15 @@ __all__ = [
     "BASIS_Y",
     "BASIS_Z",
     "Basis",
+    "get_validation_level",
+    "KrausChannel",
     "MeasureOutcome",
     "Operator",
     "QuantumModel",
     "QubitRho",
     "QubitState",
+    "set_validation_level",
+    "ValidationLevel",
 ]
 
 for name in ("QuantumModel",):
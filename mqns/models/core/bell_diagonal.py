@@ -39,6 +39,46 @@ def make_bell_diagonal_probv(i: float, z: float, x: float, y: float) -> BellDiag
     return normalize_bell_diagonal_probv(np.array((i, z, x, y), dtype=np.float64))
 
 
+type BellDiagonalTuple = tuple[float, float, float, float]
+"""
+Bell-Diagonal probability vector as a tuple of Python floats.
+
+This has the same elements as ``BellDiagonalProbV``.
+For a single state, arithmetic on Python floats is much faster than on a 4-element numpy array.
+"""
+
+
+def normalize_bell_diagonal_tuple(i: float, z: float, x: float, y: float) -> BellDiagonalTuple:
+    """
+    Construct normalized Bell-Diagonal probability tuple.
+    """
+    total = i + z + x + y
+    if total <= ATOL:  # avoid divide-by-zero
+        return (0.0, 0.0, 0.0, 0.0)
+    return (i / total, z / total, x / total, y / total)
+
+
+def compose_bell_diagonal_tuple(a: BellDiagonalTuple, b: BellDiagonalTuple) -> BellDiagonalTuple:
+    """
+    Compose two Bell-Diagonal probability tuples.
+
+    This is equivalent to ``bell_diagonal_probv_to_pauli_transfer_mat(a) @ b``, which could mean either:
+
+    * Apply Pauli channel ``a`` onto Bell-Diagonal state ``b``.
+    * Entanglement swapping between Bell-Diagonal states ``a`` and ``b``.
+
+    The result is not normalized.
+    """
+    ai, az, ax, ay = a
+    bi, bz, bx, by = b
+    return (
+        ai * bi + az * bz + ax * bx + ay * by,
+        az * bi + ai * bz + ay * bx + ax * by,
+        ax * bi + ay * bz + ai * bx + az * by,
+        ay * bi + ax * bz + az * bx + ai * by,
+    )
+
+
 type PauliTransferMat = np.ndarray[tuple[Literal[4], Literal[4]], np.dtype[np.float64]]
 """
 Pauli Transfer Matrix (PTM).
@@ -0,0 +1,131 @@
+"""
+Quantum channel in Kraus operator representation.
+"""
+
+import functools
+from collections.abc import Iterable, Sequence
+from typing import final
+
+import numpy as np
+
+from mqns.models.core.bell_diagonal import BellDiagonalTuple, compose_bell_diagonal_tuple
+from mqns.models.core.operator import (
+    OPERATOR_PAULI_I,
+    OPERATOR_PAULI_X,
+    OPERATOR_PAULI_Y,
+    OPERATOR_PAULI_Z,
+    Operator,
+    _contract,
+)
+from mqns.models.core.state import ATOL, QubitRho
+
+_PAULI_IZXY = np.array([o.u for o in (OPERATOR_PAULI_I, OPERATOR_PAULI_Z, OPERATOR_PAULI_X, OPERATOR_PAULI_Y)])
+
+
+@final
+class KrausChannel:
+    """
+    Quantum channel ``rho -> sum_m K_m @ rho @ K_m^dagger`` on ``n`` qubits.
+
+    All Kraus operators are fused into a single superoperator tensor, so that the channel is applied
+    in one contraction over the target qubits, instead of one pass over the density matrix per operator.
+    A single-qubit Pauli channel additionally keeps its I,Z,X,Y probabilities; it is applied by mixing
+    blocks of the density matrix and composed by mixing probabilities, without any matrix product.
+    """
+
+    def __init__(self, kraus: Iterable[np.ndarray] | np.ndarray, n=1, *, pauli: BellDiagonalTuple | None = None):
+        """
+        Build a channel for ``n`` qubits.
+
+        Args:
+            kraus: Kraus operators, each is a (2**n, 2**n) matrix; sum of ``K^dagger @ K`` must be identity.
+            n: number of qubits.
+            pauli: probabilities of I,Z,X,Y if this is a single-qubit Pauli channel, see ``KrausChannel.pauli_channel``.
+        """
+        self.n = n
+        """Number of qubits this channel can be used with."""
+        self.kraus = np.array(list(kraus) if not isinstance(kraus, np.ndarray) else kraus, dtype=np.complex128)
+        """Kraus operators, stacked into a (m, 2**n, 2**n) array."""
+        self.pauli = pauli
+        """Probabilities of I,Z,X,Y if this is a single-qubit Pauli channel, otherwise None."""
+
+        dim = 2**n
+        assert self.kraus.shape[1:] == (dim, dim), f"Expected (m, {dim}, {dim}), got {self.kraus.shape}"
+        if pauli is None:
+            completeness = np.einsum("mji,mjk->ik", self.kraus.conj(), self.kraus)
+            is_tp = np.allclose(completeness, np.identity(dim, dtype=np.complex128), atol=ATOL)
+            assert is_tp, "Channel is not trace preserving (sum of K^dagger @ K != I)"
+
+    @classmethod
+    def pauli_channel(cls, probv: BellDiagonalTuple) -> "KrausChannel":
+        """
+        Build a single-qubit Pauli channel.
+
+        Args:
+            probv: probabilities of applying I,Z,X,Y gates; their sum must be 1.
+        """
+        assert abs(sum(probv) - 1) < ATOL, "sum of probabilities must be 1"
+        kraus = [np.sqrt(p) * u for p, u in zip(probv, _PAULI_IZXY) if p > 0]
+        return cls(kraus, 1, pauli=probv)
+
+    @functools.cached_property
+    def unitary(self) -> Operator | None:
+        """The channel as an operator if it has a single Kraus operator, otherwise None."""
+        if len(self.kraus) != 1:
+            return None
+        return Operator(self.kraus[0], self.n)
+
+    @functools.cached_property
+    def _superop(self) -> np.ndarray:
+        """
+        Superoperator ``sum_m K_m ⊗ conj(K_m)`` as a tensor, with ``2n`` output axes (rows, columns)
+        followed by ``2n`` input axes (rows, columns).
+        """
+        s = np.einsum("mac,mbd->abcd", self.kraus, self.kraus.conj())
+        return s.reshape((2,) * (4 * self.n))
+
+    def compose(self, other: "KrausChannel") -> "KrausChannel":
+        """
+        Compose with another channel into a single channel, which applies ``self`` then ``other``.
+        """
+        assert self.n == other.n, "cannot compose channels of different sizes"
+        if self.pauli is not None and other.pauli is not None:
+            return KrausChannel.pauli_channel(compose_bell_diagonal_tuple(other.pauli, self.pauli))
+        kraus = np.einsum("aij,bjk->abik", other.kraus, self.kraus).reshape((-1,) + self.kraus.shape[1:])
+        return KrausChannel(kraus[np.linalg.norm(kraus, axis=(1, 2)) > ATOL], self.n)
+
+    def apply(self, rho: QubitRho, targets: Sequence[int], n: int) -> QubitRho:
+        """
+        Apply the channel on some qubits of a larger state.
+
+        Args:
+            rho: density matrix for ``n`` qubits.
+            targets: indices of the ``self.n`` target qubits, in the order of operator inputs.
+            n: number of qubits in the density matrix.
+
+        Returns: Transformed density matrix.
+        """
+        assert len(targets) == self.n, "number of targets does not match channel size"
+        if self.pauli is not None:
+            return _apply_pauli(rho, self.pauli, targets[0], n)
+        axes = [*targets, *(n + i for i in targets)]
+        t = _contract(self._superop, rho.reshape((2,) * (2 * n)), axes)
+        return t.reshape(rho.shape)
+
+
+def _apply_pauli(rho: QubitRho, probv: BellDiagonalTuple, idx: int, n: int) -> QubitRho:
+    """
+    Apply a Pauli channel on the idx-th qubit of a density matrix.
+
+    With the target qubit as block index, I and Z keep the diagonal blocks while X and Y swap them;
+    I and X keep the sign of off-diagonal blocks while Z and Y negate them.
+    """
+    i, z, x, y = probv
+    t = rho.reshape((2**idx, 2, 2 ** (n - idx - 1)) * 2)
+    b00, b01, b10, b11 = t[:, 0, :, :, 0], t[:, 0, :, :, 1], t[:, 1, :, :, 0], t[:, 1, :, :, 1]
+    out = np.empty_like(t)
+    out[:, 0, :, :, 0] = (i + z) * b00 + (x + y) * b11
+    out[:, 1, :, :, 1] = (i + z) * b11 + (x + y) * b00
+    out[:, 0, :, :, 1] = (i - z) * b01 + (x - y) * b10
+    out[:, 1, :, :, 0] = (i - z) * b10 + (x - y) * b01
+    return out.reshape(rho.shape)
@@ -3,13 +3,27 @@ Definitions and constants for qubit operator.
 """
 
 import functools
-from typing import cast, final
+from collections.abc import Sequence
+from typing import NamedTuple, cast, final
 
 import numpy as np
 
 from mqns.models.core.state import ATOL, QubitRho, QubitState
 
 
+class OperatorCacheInfo(NamedTuple):
+    """Statistics of an operator cache, see ``Operator.cache_info``."""
+
+    hits: int
+    """Number of lookups that found a cached operator."""
+    misses: int
+    """Number of lookups that constructed a new operator."""
+    maxsize: int | None
+    """Capacity of the cache, None if unbounded."""
+    currsize: int
+    """Number of cached operators."""
+
+
 @final
 class Operator:
     def __init__(self, input: np.ndarray | list[list[complex]], n=1, *, check_unitary=True):
@@ -30,6 +44,33 @@ class Operator:
 
         self._validate(check_unitary)
 
+    @functools.cached_property
+    def _hash(self) -> int:
+        """Hash of matrix content, computed upon first use; the matrix should not be modified afterwards."""
+        return hash((self.n, self.u.tobytes()))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @staticmethod
+    def cache_info() -> dict[str, OperatorCacheInfo]:
+        """
+        Retrieve statistics of operator caches.
+
+        Returns:
+            * ``"controlled"``: cache of ``Operator.controlled`` results, keyed by operator content and number of qubits.
+            * ``"lift"``: cache of ``Operator.lift`` results, keyed by operator content, target index, and number of qubits.
+        """
+        return {
+            "controlled": OperatorCacheInfo(*_controlled.cache_info()),
+            "lift": OperatorCacheInfo(*_lift.cache_info()),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Operator):
+            return NotImplemented
+        return self is other or (self.n == other.n and np.array_equal(self.u, other.u))
+
     def _validate(self, check_unitary: bool) -> None:
         dim = 2**self.n
         assert self.u.shape == (dim, dim), f"Expected ({dim}, {dim}), got {self.u.shape}"
@@ -57,6 +98,38 @@ class Operator:
         else:  # density matrix
             return cast(T, self.u @ state @ self.u_dagger)
 
+    @functools.cached_property
+    def _tensor(self) -> np.ndarray:
+        """Operator matrix as a tensor, with ``n`` output axes followed by ``n`` input axes."""
+        return self.u.reshape((2,) * (2 * self.n))
+
+    @functools.cached_property
+    def _tensor_conj(self) -> np.ndarray:
+        """Complex conjugate of ``_tensor``."""
+        return self._tensor.conj()
+
+    def apply[T: (QubitState | QubitRho)](self, state: T, targets: Sequence[int], n: int) -> T:
+        """
+        Apply an operator on some qubits of a larger state.
+
+        The state is reshaped into a tensor with one axis per qubit, and the operator is contracted
+        over the target axes only, without constructing the full ``2**n`` matrix.
+
+        Args:
+            state: either a state vector or a density matrix for ``n`` qubits.
+            targets: indices of the ``self.n`` target qubits, in the order of operator inputs.
+            n: number of qubits in the state vector or density matrix.
+
+        Returns: Transformed state vector or density matrix.
+        """
+        assert len(targets) == self.n, "number of targets does not match operator size"
+        if state.shape[1] == 1:  # state vector
+            t = _contract(self._tensor, state.reshape((2,) * n), targets)
+        else:  # density matrix
+            t = _contract(self._tensor, state.reshape((2,) * (2 * n)), targets)
+            t = _contract(self._tensor_conj, t, [n + i for i in targets])
+        return cast(T, t.reshape(state.shape))
+
     def lift(self, i: int, n: int, *, check_unitary=True) -> "Operator":
         """
         Expand a single-qubit operator to apply on the i-th qubit of a n-qubit state.
@@ -77,12 +150,59 @@ class Operator:
             raise ValueError("i or n is out of range")
         if n == 1:
             return self
+        return _lift(self, i, n, check_unitary)
+
+    def controlled(self, n=2) -> "Operator":
+        """
+        Expand a single-qubit operator into a controlled operator.
+
+        The first ``n-1`` qubits are controllers and the last qubit is the target.
+        Results are cached and shared among callers, so their matrices are read-only.
+
+        Args:
+            self: single-qubit operator.
+            n: total number of qubits.
+
+        Raises:
+            AssertionError: this is not a single-qubit operator, or n is less than 2.
+
+        Returns: n-qubit operator.
+        """
+        assert self.n == 1, "can only control 1-qubit operator"
+        assert n >= 2, "controlled operator needs at least one controller"
+        return _controlled(self, n)
+
+
+_P1 = np.array([[0, 0], [0, 1]], dtype=np.complex128)
+"""Projector matrix ``|1><1|``."""
+
+
+def _freeze(op: Operator) -> Operator:
+    op.u.flags.writeable = False
+    op.u_dagger.flags.writeable = False
+    return op
+
+
+@functools.lru_cache(maxsize=256)
+def _lift(op: Operator, i: int, n: int, check_unitary: bool) -> Operator:
+    # full_matrix = I⊗..⊗U⊗..⊗I where the i-th matrix is U
+    mats = [OPERATOR_PAULI_I.u] * n
+    mats[i] = op.u
+    full_matrix = functools.reduce(np.kron, mats)
+    return _freeze(Operator(full_matrix, n, check_unitary=check_unitary))
+
+
+@functools.lru_cache(maxsize=256)
+def _controlled(op: Operator, n: int) -> Operator:
+    # controlled_op = (I - P)⊗I + P⊗U where P = |1..1><1..1| on the controllers
+    p = functools.reduce(np.kron, [_P1] * (n - 1))
+    return _freeze(Operator(np.identity(2**n, dtype=np.complex128) - np.kron(p, OPERATOR_PAULI_I.u) + np.kron(p, op.u), n))
+
 
-        # full_matrix = I⊗..⊗U⊗..⊗I where the i-th matrix is U
-        mats = [OPERATOR_PAULI_I.u] * n
-        mats[i] = self.u
-        full_matrix = functools.reduce(np.kron, mats)
-        return Operator(full_matrix, n, check_unitary=check_unitary)
+def _contract(op: np.ndarray, t: np.ndarray, axes: Sequence[int]) -> np.ndarray:
+    k = len(axes)
+    out = np.tensordot(op, t, axes=(list(range(k, 2 * k)), list(axes)))
+    return np.moveaxis(out, list(range(k)), list(axes))
 
 
 def OPERATOR_RX(theta: float):
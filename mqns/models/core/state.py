@@ -2,31 +2,84 @@
 Definitions and constants for qubit state vector and density matrix.
 """
 
+import os
+import warnings
 from collections.abc import Iterable
-from typing import Literal
+from typing import Literal, cast
 
 import numpy as np
 
 ATOL = 1e-9
 """Absolute numerical tolerance for floating-point calculations."""
 
+type ValidationLevel = Literal["off", "boundary", "full"]
+"""
+How thoroughly ``check_qubit_state`` and ``check_qubit_rho`` validate their input,
+and whether ``normalize_qubit_rho`` performs spectral clipping.
+
+* ``"full"``: validate every state, including intermediate results of gates, errors, and measurements.
+* ``"boundary"``: validate user-supplied states only; intermediate results computed from validated states are trusted.
+* ``"off"``: skip validation entirely, e.g. for production parameter sweeps.
+"""
+
+_VALIDATION_LEVELS = ("off", "boundary", "full")
+_validation_level: ValidationLevel = "full"
+
+
+def get_validation_level() -> ValidationLevel:
+    """Retrieve current validation level."""
+    return _validation_level
+
+
+def set_validation_level(level: ValidationLevel) -> None:
+    """
+    Configure validation level.
+
+    The initial level is taken from ``MQNS_VALIDATION`` environment variable if it contains a valid level.
+    Otherwise, the initial level is ``"full"``, and a warning is emitted if the variable is set to an invalid level.
+
+    Raises:
+        ValueError: ``level`` is not a valid level.
+    """
+    if level not in _VALIDATION_LEVELS:
+        raise ValueError(f"validation level must be one of {_VALIDATION_LEVELS}, got {level!r}")
+    global _validation_level
+    _validation_level = level
+
+
+def _should_validate(intermediate: bool) -> bool:
+    return _validation_level == "full" or (_validation_level == "boundary" and not intermediate)
+
+
+def _init_validation_level() -> None:
+    try:
+        set_validation_level(cast(ValidationLevel, os.getenv("MQNS_VALIDATION", "full")))
+    except ValueError as e:  # MQNS_VALIDATION is not a valid level
+        warnings.warn(f"ignoring MQNS_VALIDATION: {e}", stacklevel=2)
+
+
+_init_validation_level()
+
 type QubitState = np.ndarray[tuple[int, Literal[1]], np.dtype[np.complex128]]
 """Qubit state vector for N qubits, shape is (2**N, 1)."""
 
 
-def check_qubit_state(state: np.ndarray, n=1) -> QubitState:
+def check_qubit_state(state: np.ndarray, n=1, *, intermediate=False) -> QubitState:
     """
     Validate that ``state`` is a state vector for ``n`` qubits.
 
     Args:
         state: NDArray.
         n: expected number of qubits.
+        intermediate: if True, ``state`` is computed from validated states, and is only validated at ``"full"`` level.
 
     Raises:
         AssertionError: ``state`` has wrong shape or is not normalized.
 
     Returns: Validated input.
     """
+    if not _should_validate(intermediate):
+        return state
     # Complex Amplitudes: the entries of the vector must be complex numbers.
     assert np.iscomplexobj(state)
     # Dimensionality: the vector must reside in a Hilbert space of dimension 2**n.
@@ -85,7 +138,7 @@ def _check_rho_shape(rho: np.ndarray, n: int) -> None:
     assert rho.shape == (2**n, 2**n)
 
 
-def check_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False) -> QubitRho:
+def check_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False, intermediate=False) -> QubitRho:
     """
     Validate that ``rho`` is a density matrix for ``n`` qubits.
 
@@ -93,12 +146,15 @@ def check_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False) -> QubitRho:
         rho: NDArray.
         n: expected number of qubits.
         maybe_zero: if True, don't error if the matrix is all zeros.
+        intermediate: if True, ``rho`` is computed from validated states, and is only validated at ``"full"`` level.
 
     Raises:
         AssertionError: ``rho`` has wrong shape or is not normalized.
 
     Returns: Validated input.
     """
+    if not _should_validate(intermediate):
+        return rho
     _check_rho_shape(rho, n)
     # Unit Trace: the sum of the diagonal elements must be exactly 1,
     # representing a total probability of 100%.
@@ -115,7 +171,7 @@ def check_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False) -> QubitRho:
     return rho
 
 
-def normalize_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False) -> QubitRho:
+def normalize_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False, intermediate=False) -> QubitRho:
     """
     Normal ``rho`` to a density matrix for ``n`` qubits.
 
@@ -123,6 +179,8 @@ def normalize_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False) -> QubitRho:
         rho: NDArray.
         n: expected number of qubits.
         maybe_zero: if True, don't error if the matrix is all zeros.
+        intermediate: if True, ``rho`` is computed from validated states, and spectral clipping of
+                      negative eigenvalues from rounding errors is only performed at ``"full"`` level.
 
     Raises:
         AssertionError: ``rho`` has wrong shape.
@@ -135,10 +193,11 @@ def normalize_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False) -> QubitRho:
     rho = (rho + rho.conj().T) / 2
 
     # Force positive semi-definiteness (spectral clipping)
-    eigenvalues, eigenvectors = np.linalg.eigh(rho)
-    if np.any(eigenvalues < 0):
-        eigenvalues = np.maximum(eigenvalues, 0)
-        rho = (eigenvectors * eigenvalues) @ eigenvectors.conj().T  # V @ diag(λ) @ V_dagger
+    if _should_validate(intermediate):
+        eigenvalues, eigenvectors = np.linalg.eigh(rho)
+        if np.any(eigenvalues < 0):
+            eigenvalues = np.maximum(eigenvalues, 0)
+            rho = (eigenvectors * eigenvalues) @ eigenvectors.conj().T  # V @ diag(λ) @ V_dagger
 
     # Force unit trace
     trace = np.real(np.trace(rho))
@@ -152,7 +211,7 @@ def normalize_qubit_rho(rho: np.ndarray, n=1, *, maybe_zero=False) -> QubitRho:
 
 def qubit_state_to_rho(state: QubitState, n=1) -> QubitRho:
     """Convert qubit state vector to density matrix."""
-    return check_qubit_rho(np.outer(state, np.conj(state)), n)
+    return check_qubit_rho(np.outer(state, np.conj(state)), n, intermediate=True)
 
 
 def qubit_rho_to_state(rho: QubitRho, n=1) -> QubitState | None:
@@ -227,7 +286,7 @@ def qubit_rho_remove(rho: QubitRho, i: int, n: int) -> QubitRho:
     res: np.ndarray = res.trace(axis1=i, axis2=n + i)
     dim = 2 ** (n - 1)
     res = res.reshape((dim, dim))
-    return normalize_qubit_rho(res, n - 1, maybe_zero=True)
+    return normalize_qubit_rho(res, n - 1, maybe_zero=True, intermediate=True)
 
 
 QUBIT_STATE_0 = build_qubit_state((1, 0))
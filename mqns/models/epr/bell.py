@@ -15,7 +15,7 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Unpack, final, override
+from typing import ClassVar, Unpack, final, override
 
 from mqns.models.epr.entanglement import Entanglement, EntanglementInitKwargs
 
@@ -24,6 +24,8 @@ from mqns.models.epr.entanglement import Entanglement, EntanglementInitKwargs
 class BellStateEntanglement(Entanglement):
     """`BellStateEntanglement` is the ideal max entangled qubits. Its fidelity is always 1."""
 
+    _purify_certain: ClassVar[bool] = True
+
     @property
     @override
     def fidelity(self) -> float:
@@ -41,9 +43,13 @@ class BellStateEntanglement(Entanglement):
         return BellStateEntanglement(**kwargs)
 
     @override
-    def _do_purify(self, epr1: "BellStateEntanglement") -> bool:
+    def _purify_outcome(self, epr1: "BellStateEntanglement") -> tuple[float, None]:
         _ = epr1
-        return True
+        return 1.0, None
+
+    @override
+    def _purify_commit(self, state: None) -> None:
+        _ = state
 
     @override
     def apply_error(self, error) -> None:
@@ -25,16 +25,15 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import hashlib
 from abc import abstractmethod
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Self, TypedDict, Unpack, cast
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, Self, TypedDict, Unpack, cast
 
 import numpy as np
 
 from mqns.models.core import QuantumModel
 from mqns.models.core.operator import OPERATOR_PAULI_I, Operator
-from mqns.models.core.state import QUBIT_STATE_P, QubitRho, build_qubit_state, qubit_state_to_rho
+from mqns.models.core.state import ATOL, QUBIT_STATE_P, QubitRho, build_qubit_state, qubit_state_to_rho
 from mqns.models.error import ErrorModel, PerfectErrorModel, TimeDecayFunc, time_decay_nop
 from mqns.models.qubit import QState, Qubit
 from mqns.models.qubit.gate import CNOT, H, U, X, Y, Z
@@ -45,16 +44,33 @@ if TYPE_CHECKING:
     from mqns.entity.node import QNode
 
 
-_AUTOID = 0
+_AUTOID = -1
 """
-Automatically assigned ``Entanglement.name`` numeric portion.
+Automatically assigned ``Entanglement.id`` for entanglements created without an identifier.
+These are negative, so that they do not collide with ``Simulator.next_epr_id()``.
+"""
+
+_LINEAGE_MOD = (1 << 52) - 47
+_LINEAGE_BASE = 0x5BD1E9955BD1E
+_LINEAGE_ID_BIT = 1 << 52
+"""
+Polynomial hash parameters for deriving swapped entanglement identifiers.
+
+The hash of a sequence of elementary entanglements can be computed from the hashes of its two halves,
+so that a swapped entanglement gets the same identifier regardless of the order in which swaps were performed.
+``_LINEAGE_ID_BIT`` is set on swapped entanglement identifiers, so that they do not collide with elementary ones.
+
+The modulus is the largest prime below ``2**52``, so that every identifier is below ``2**53``
+and survives a JSON round trip through peers that decode numbers as IEEE 754 doubles.
 """
 
 
 class EntanglementInitKwargs(TypedDict, total=False):
+    id: int
     name: str | None
     decohere_time: Time
     fidelity_time: Time
+    creation_time: Time
     src: "QNode|None"
     dst: "QNode|None"
     store_decays: tuple[TimeDecayFunc | None, TimeDecayFunc | None]
@@ -86,30 +102,50 @@ class Entanglement(QuantumModel):
     Index of elementary entanglement in a path, smaller indices are on the left side.
     Negative means this is not an elementary entanglement.
     """
-    orig_eprs: list[Self] | None = None
-    """Elementary entanglements that swapped into this entanglement."""
+    parents: "tuple[Entanglement, Entanglement] | None" = None
+    """
+    Left and right entanglements that swapped into this entanglement.
+    None means this is an elementary entanglement.
+    """
+    _lineage: tuple[int, int] | None = None
+    """
+    Polynomial hash of elementary entanglements in the lineage tree, and base raised to their count.
+    This is computed on demand for elementary entanglements.
+    """
     tmp_path_ids: frozenset[int] | None = None
     """Possible path IDs, used by MuxSchemeStatistical and MuxSchemeDynamicEpr."""
+    _purify_certain: ClassVar[bool] = False
+    """Whether purification always succeeds, in which case no random number is drawn."""
 
     def __init__(self, **kwargs: Unpack[EntanglementInitKwargs]):
         """
         Constructor.
 
         Args:
-            name: Entanglement name, defaults to a random string.
+            id: Entanglement identifier, defaults to an automatically assigned negative integer.
+            name: Descriptive name, defaults to a string derived from ``id``.
             decohere_time: EPR decoherence time point, defaults to ``Time.SENTINEL``.
             fidelity_time: EPR creation or fidelity update time point, defaults to ``Time.SENTINEL``.
+            creation_time: EPR creation time point, defaults to ``fidelity_time``.
             src: Left node that holds one of the entangled qubits.
             dst: Right node that holds one of the entangled qubits.
             store_decays: Memory time-based decay functions at src and dst.
         """
-        name = kwargs.get("name")
-        if name is None:
+        epr_id = kwargs.get("id")
+        if epr_id is None:
             global _AUTOID
-            name = f"etg_{_AUTOID:028x}"
-            _AUTOID += 1
-        self.name = name
-        """Descriptive name."""
+            epr_id = _AUTOID
+            _AUTOID -= 1
+        self.id = epr_id
+        """
+        Entanglement identifier.
+
+        * An elementary entanglement created by a link architecture gets ``Simulator.next_epr_id()``.
+        * A swapped entanglement gets an identifier derived from its elementary entanglements.
+          Both end nodes can refer to the entanglement by this identifier in signaling messages,
+          even if parallel swaps were merged in different order at different nodes.
+        """
+        self._name = kwargs.get("name")
 
         self.decohere_time = kwargs.get("decohere_time", Time.SENTINEL)
         """
@@ -129,6 +165,14 @@ class Entanglement(QuantumModel):
         * This may be updated to the current time at any time, while ``store_decays`` is applied to the EPR.
         * Some operations are unavailable if this is ``Time.SENTINEL``.
         """
+        self.creation_time = kwargs.get("creation_time", self.fidelity_time)
+        """
+        EPR creation time point, used for latency statistics.
+
+        * Upon creating a memory-memory EPR, this is assigned according to the EPR creation time.
+        * Upon swapping, the oldest creation time point is used.
+        * Upon purification, the creation time point is unchanged.
+        """
 
         self.src = kwargs.get("src")
         """Left node that holds one of the entangled qubits."""
@@ -167,6 +211,15 @@ class Entanglement(QuantumModel):
         self.fidelity_time = now
         self.read = True
 
+    @property
+    def name(self) -> str:
+        """
+        Descriptive name, only intended for debugging.
+        """
+        if self._name is None:
+            return f"etg_{self.id:x}"
+        return self._name
+
     @staticmethod
     def swap[E: Entanglement](
         epr0: E,
@@ -194,30 +247,27 @@ class Entanglement(QuantumModel):
         assert type(epr0) is type(epr1)
         assert epr0.dst == epr1.src  # it's okay for src and dst to be None
 
-        orig_eprs: list[E] = []
-        for epr in (epr0, epr1):
-            epr.apply_store_decays(now)
-            if epr.orig_eprs:
-                orig_eprs.extend(cast(list[E], epr.orig_eprs))
-            else:
-                orig_eprs.append(epr)
+        epr0.apply_store_decays(now)
+        epr1.apply_store_decays(now)
 
-        orig_names = "-".join((e.name for e in orig_eprs))
-        name = hashlib.sha256(orig_names.encode()).hexdigest()[:32]  # same length as default name
+        (h0, p0), (h1, p1) = epr0._get_lineage(), epr1._get_lineage()
+        lineage = ((h0 * p1 + h1) % _LINEAGE_MOD, (p0 * p1) % _LINEAGE_MOD)
         ne = cast(
             E,
             type(epr0)._make_swapped(
                 epr0,
                 epr1,
-                name=name,
+                id=_LINEAGE_ID_BIT | lineage[0],
                 decohere_time=min(epr0.decohere_time, epr1.decohere_time),
                 fidelity_time=now,
+                creation_time=min(epr0.creation_time, epr1.creation_time),
                 src=epr0.src,
                 dst=epr1.dst,
                 store_decays=(epr0.store_decays[0], epr1.store_decays[1]),
             ),
         )
-        ne.orig_eprs = orig_eprs
+        ne.parents = (epr0, epr1)
+        ne._lineage = lineage
 
         local_failure = ps < 1.0 and rng.random() >= ps
         ne.is_decohered = epr0.is_decohered or epr1.is_decohered or local_failure
@@ -225,6 +275,36 @@ class Entanglement(QuantumModel):
             ne.apply_error(error)
         return ne, not local_failure
 
+    def _get_lineage(self) -> tuple[int, int]:
+        if self._lineage is None:
+            self._lineage = (self.id % (_LINEAGE_MOD - 1) + 1, _LINEAGE_BASE)  # leaf hash must be nonzero
+        return self._lineage
+
+    def iter_orig_eprs(self) -> Iterator["Entanglement"]:
+        """
+        Iterate over elementary entanglements that swapped into this entanglement, from left to right.
+
+        The lineage tree is traversed on demand; no list is stored on the entanglement.
+        Nothing is yielded if this is an elementary entanglement.
+        """
+        if self.parents is None:
+            return
+        stack: list[Entanglement] = [self.parents[1], self.parents[0]]
+        while stack:
+            epr = stack.pop()
+            if epr.parents is None:
+                yield epr
+            else:
+                stack += (epr.parents[1], epr.parents[0])
+
+    @property
+    def orig_eprs(self) -> list[Self]:
+        """
+        Elementary entanglements that swapped into this entanglement, from left to right.
+        This is empty if this is an elementary entanglement.
+        """
+        return cast(list[Self], list(self.iter_orig_eprs()))
+
     @staticmethod
     @abstractmethod
     def _make_swapped(epr0, epr1, **kwargs: Unpack[EntanglementInitKwargs]) -> "Entanglement":
@@ -246,25 +326,74 @@ class Entanglement(QuantumModel):
         Returns:
             Whether successful.
         """
+        _ = now
+        return self._purify(epr1, None)
+
+    @classmethod
+    def purify_batch(cls, kept: Sequence[Self], consumed: Sequence[Self], *, now: Time) -> list[bool]:
+        """
+        Perform purification on many pairs of entanglements.
 
+        This has the same effect as invoking ``kept[i].purify(consumed[i], now=now)`` on each pair,
+        except that random numbers for all pairs are drawn at once.
+        It is intended for purification studies outside of a network simulation.
+
+        Args:
+            kept: kept entanglements.
+            consumed: consumed entanglements, same length as ``kept``.
+            now: current timestamp.
+
+        Returns:
+            Whether each purification is successful.
+        """
+        assert len(kept) == len(consumed)
+        _ = now
+        draws: list[float | None] = [None] * len(kept) if cls._purify_certain else rng.random(len(kept)).tolist()
+        return [epr0._purify(epr1, draw) for epr0, epr1, draw in zip(kept, consumed, draws, strict=True)]
+
+    def _purify(self, epr1: Self, draw: float | None) -> bool:
+        """
+        Perform purification on ``self`` consuming ``epr1``.
+
+        Args:
+            draw: uniform random number in [0, 1), or None to draw one from ``rng`` if needed.
+        """
         assert type(self) is type(epr1)
         assert (self.src, self.dst) == (epr1.src, epr1.dst)  # it's okay for src and dst to be None
 
         if self.is_decohered or epr1.is_decohered:
             return False
 
-        _ = now
-        ok = self._do_purify(epr1)
+        p_succ, state = self._purify_outcome(epr1)
+        if self._purify_certain:
+            ok = True
+        else:
+            ok = p_succ > ATOL and (rng.random() if draw is None else draw) <= p_succ
 
-        if not ok:
+        if ok:
+            self._purify_commit(state)
+        else:
             self.is_decohered = True
         epr1.is_decohered = True
 
         return ok
 
     @abstractmethod
-    def _do_purify(self, epr1) -> bool:
-        pass
+    def _purify_outcome(self, epr1) -> tuple[float, Any]:
+        """
+        Compute the outcome of purification on ``self`` consuming ``epr1``.
+        Subclass implementation should memoize the computation when possible.
+
+        Returns:
+            [0]: Success probability.
+            [1]: State of ``self`` upon success, passed to ``_purify_commit``.
+        """
+
+    @abstractmethod
+    def _purify_commit(self, state) -> None:
+        """
+        Update ``self`` to the state returned from ``_purify_outcome`` after successful purification.
+        """
 
     def to_qubits(self) -> tuple[Qubit, Qubit]:
         """
@@ -338,9 +467,8 @@ def _describe(epr: Entanglement) -> Iterable[str]:
         yield f"dst={epr.dst.name}"
         if epr.ch_index >= 0:
             yield f"ch_index={epr.ch_index}"
-        elif epr.orig_eprs:
-            orig_eprs = ",".join(e.name for e in epr.orig_eprs)
-            yield f"orig_eprs=[{orig_eprs}]"
+        elif epr.parents:
+            yield f"parents=[{epr.parents[0].name},{epr.parents[1].name}]"
 
     if epr.tmp_path_ids:
         tmp_path_ids = ",".join(str(x) for x in epr.tmp_path_ids)
@@ -1,14 +1,16 @@
+import functools
 from collections.abc import Iterable
 from typing import Unpack, final, overload, override
 
+import numpy as np
+
 from mqns.models.core.bell_diagonal import (
     BellDiagonalProbV,
-    bell_diagonal_probv_to_pauli_transfer_mat,
-    make_bell_diagonal_probv,
-    normalize_bell_diagonal_probv,
+    BellDiagonalTuple,
+    compose_bell_diagonal_tuple,
+    normalize_bell_diagonal_tuple,
 )
 from mqns.models.core.state import (
-    ATOL,
     BELL_RHO_PHI_N,
     BELL_RHO_PHI_P,
     BELL_RHO_PSI_N,
@@ -17,12 +19,28 @@ from mqns.models.core.state import (
     check_qubit_rho,
 )
 from mqns.models.epr.entanglement import Entanglement, EntanglementInitKwargs
-from mqns.utils import rng
+
+
+@functools.lru_cache(maxsize=4096)
+def _purify_outcome(bell0: BellDiagonalTuple, bell1: BellDiagonalTuple) -> tuple[float, BellDiagonalTuple]:
+    i0, z0, x0, y0 = bell0
+    i1, z1, x1, y1 = bell1
+    p_succ = (i0 + y0) * (i1 + y1) + (z0 + x0) * (x1 + z1)
+    return p_succ, normalize_bell_diagonal_tuple(
+        i0 * i1 + y0 * y1,
+        z0 * z1 + x0 * x1,
+        z0 * x1 + x0 * z1,
+        i0 * y1 + y0 * i1,
+    )
 
 
 @final
 class MixedStateEntanglement(Entanglement):
-    """A pair of entangled qubits in Bell-Diagonal State with a hidden-variable."""
+    """
+    A pair of entangled qubits in Bell-Diagonal State with a hidden-variable.
+
+    The probability vector is stored as a tuple of Python floats, see ``BellDiagonalTuple``.
+    """
 
     @overload
     def __init__(self, *, fidelity=1.0, **kwargs: Unpack[EntanglementInitKwargs]):
@@ -68,69 +86,70 @@ class MixedStateEntanglement(Entanglement):
         if probv is not None:
             self.set_probv(probv)
         elif fidelity is None:
-            self.set_probv(make_bell_diagonal_probv(i, z, x, y), normalize=False)
-            """Probability vector: I,Z,X,Y."""
+            self.set_bell((i, z, x, y))
         else:
             self.fidelity = fidelity
 
     @property
     @override
     def fidelity(self) -> float:
-        return self.probv[0]
+        return self._bell[0]
 
     @fidelity.setter
     @override
     def fidelity(self, value: float):
         """Reset fidelity, turning into a Werner state."""
         zxy = (1 - value) / 3
-        self.set_probv(make_bell_diagonal_probv(value, zxy, zxy, zxy), normalize=False)
+        self.set_bell((value, zxy, zxy, zxy))
+
+    @property
+    def bell(self) -> BellDiagonalTuple:
+        """Probability tuple: I,Z,X,Y."""
+        return self._bell
+
+    def set_bell(self, bell: BellDiagonalTuple, *, normalize=True) -> None:
+        """
+        Update probability tuple.
+
+        Args:
+            bell: new probability tuple.
+            normalize: if False, assume ``bell`` is already normalized.
+        """
+        self._bell = normalize_bell_diagonal_tuple(*bell) if normalize else bell
 
     @property
     def probv(self) -> BellDiagonalProbV:
         """Probability vector: I,Z,X,Y."""
-        return self._probv
+        return np.array(self._bell, dtype=np.float64)
 
-    def set_probv(self, probv: BellDiagonalProbV, *, normalize=True, copy=True) -> None:
+    def set_probv(self, probv: BellDiagonalProbV, *, normalize=True) -> None:
         """
         Update probability vector.
 
         Args:
             probv: new probability vector.
             normalize: if False, assume ``probv`` is already normalized.
-            copy: if False, ``probv`` may be normalized in-place.
         """
-        if normalize:
-            if copy:
-                probv = probv.copy()
-            probv = normalize_bell_diagonal_probv(probv)
-        self._probv = probv
+        i, z, x, y = (float(v) for v in probv)
+        self.set_bell((i, z, x, y), normalize=normalize)
 
     @staticmethod
     @override
     def _make_swapped(epr0: "MixedStateEntanglement", epr1: "MixedStateEntanglement", **kwargs: Unpack[EntanglementInitKwargs]):
-        return MixedStateEntanglement(probv=bell_diagonal_probv_to_pauli_transfer_mat(epr0.probv) @ epr1.probv, **kwargs)
+        epr = MixedStateEntanglement(**kwargs)
+        epr.set_bell(compose_bell_diagonal_tuple(epr0._bell, epr1._bell))
+        return epr
 
     @override
-    def _do_purify(self, epr1: "MixedStateEntanglement") -> bool:
+    def _purify_outcome(self, epr1: "MixedStateEntanglement") -> tuple[float, BellDiagonalTuple]:
         """
         Perform distillation using BBPSSW protocol.
         """
-        i0, z0, x0, y0 = self.probv
-        i1, z1, x1, y1 = epr1.probv
-        p_succ = (i0 + y0) * (i1 + y1) + (z0 + x0) * (x1 + z1)
-        if p_succ <= ATOL or rng.random() > p_succ:
-            return False
-
-        self.set_probv(
-            make_bell_diagonal_probv(
-                i0 * i1 + y0 * y1,
-                z0 * z1 + x0 * x1,
-                z0 * x1 + x0 * z1,
-                i0 * y1 + y0 * i1,
-            ),
-            normalize=False,
-        )
-        return True
+        return _purify_outcome(self._bell, epr1._bell)
+
+    @override
+    def _purify_commit(self, state: BellDiagonalTuple) -> None:
+        self.set_bell(state, normalize=False)
 
     @override
     def apply_error(self, error) -> None:
@@ -138,12 +157,14 @@ class MixedStateEntanglement(Entanglement):
 
     @override
     def _to_qubits_rho(self) -> QubitRho:
-        i, z, x, y = self.probv
-        return check_qubit_rho(i * BELL_RHO_PHI_P + z * BELL_RHO_PHI_N + x * BELL_RHO_PSI_P + y * BELL_RHO_PSI_N, n=2)
+        i, z, x, y = self._bell
+        return check_qubit_rho(
+            i * BELL_RHO_PHI_P + z * BELL_RHO_PHI_N + x * BELL_RHO_PSI_P + y * BELL_RHO_PSI_N, n=2, intermediate=True
+        )
 
     @override
     def _describe_fidelity(self) -> Iterable[str]:
-        i, z, x, y = self.probv
+        i, z, x, y = self._bell
         yield f"i={i:.4f}"
         yield f"z={z:.4f}"
         yield f"x={x:.4f}"
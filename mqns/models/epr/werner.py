@@ -26,6 +26,8 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import functools
+import math
 from collections.abc import Iterable
 from typing import Unpack, final, overload, override
 
@@ -33,7 +35,8 @@ import numpy as np
 
 from mqns.models.core.state import BELL_RHO_PHI_P, QubitRho, check_qubit_rho
 from mqns.models.epr.entanglement import Entanglement, EntanglementInitKwargs
-from mqns.utils import rng
+from mqns.models.error import time_decay_werner_rate
+from mqns.simulator import Time
 
 
 def _fidelity_from_w(w: float) -> float:
@@ -44,6 +47,12 @@ def _fidelity_to_w(f: float) -> float:
     return (f * 4 - 1) / 3
 
 
+@functools.lru_cache(maxsize=4096)
+def _purify_outcome(fmin: float) -> tuple[float, float]:
+    p_succ = fmin**2 + 5 / 9 * (1 - fmin) ** 2 + 2 / 3 * fmin * (1 - fmin)
+    return p_succ, (fmin**2 + (1 - fmin) ** 2 / 9) / p_succ
+
+
 _w_0 = _fidelity_to_w(0.0)
 _w_1 = _fidelity_to_w(1.0)
 
@@ -75,6 +84,45 @@ class WernerStateEntanglement(Entanglement):
         assert 0.0 <= value <= 1.0
         self.w = _fidelity_to_w(value)
 
+    @property
+    def decay_rate(self) -> float | None:
+        """
+        Decay rate of Werner parameter per time slot, combining ``store_decays`` at both ends.
+
+        Memory time-based decay over ``t`` time slots multiplies the Werner parameter by ``exp(-decay_rate * t)``.
+        None if either decay function does not have this closed form.
+        """
+        rate0, rate1 = (time_decay_werner_rate(f) for f in self.store_decays)
+        if rate0 is None or rate1 is None:
+            return None
+        return rate0 + rate1
+
+    @override
+    def apply_store_decays(self, now: Time) -> None:
+        """
+        Apply memory time-based decays for both qubits in this EPR.
+
+        If the decay functions have a closed form, the Werner parameter is updated with a single exponential,
+        without invoking the error models.
+
+        Args:
+            now: Current time point.
+        """
+        if self.read:
+            return
+        rate = self.decay_rate
+        if rate is None:
+            super().apply_store_decays(now)
+        else:
+            assert now.accuracy == self.fidelity_time.accuracy
+            t = now.time_slot - self.fidelity_time.time_slot
+            if t == 0:
+                return
+            if rate > 0:
+                self.w *= math.exp(-rate * t)
+            self.fidelity_time = now
+            self.read = True
+
     @staticmethod
     @override
     def _make_swapped(
@@ -83,18 +131,15 @@ class WernerStateEntanglement(Entanglement):
         return WernerStateEntanglement(w=epr0.w * epr1.w, **kwargs)
 
     @override
-    def _do_purify(self, epr1: "WernerStateEntanglement") -> bool:
+    def _purify_outcome(self, epr1: "WernerStateEntanglement") -> tuple[float, float]:
         """
         Perform distillation using Bennett 96 protocol and estimate lower bound.
         """
-        fmin = min(self.fidelity, epr1.fidelity)
-        expr1 = fmin**2 + 5 / 9 * (1 - fmin) ** 2 + 2 / 3 * fmin * (1 - fmin)
-
-        if rng.random() > expr1:
-            return False
+        return _purify_outcome(min(self.fidelity, epr1.fidelity))
 
-        self.fidelity = (fmin**2 + (1 - fmin) ** 2 / 9) / expr1
-        return True
+    @override
+    def _purify_commit(self, state: float) -> None:
+        self.fidelity = state
 
     @override
     def apply_error(self, error) -> None:
@@ -102,7 +147,7 @@ class WernerStateEntanglement(Entanglement):
 
     @override
     def _to_qubits_rho(self) -> QubitRho:
-        return check_qubit_rho(self.w * BELL_RHO_PHI_P + (1 - self.w) / 4 * np.identity(4), n=2)
+        return check_qubit_rho(self.w * BELL_RHO_PHI_P + (1 - self.w) / 4 * np.identity(4), n=2, intermediate=True)
 
     @override
     def _describe_fidelity(self) -> Iterable[str]:
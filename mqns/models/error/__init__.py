@@ -3,7 +3,14 @@ from mqns.models.error.coherent import CoherentErrorModel
 from mqns.models.error.dissipation import DissipationErrorModel
 from mqns.models.error.error import ErrorModel, PerfectErrorModel
 from mqns.models.error.pauli import BitFlipErrorModel, DephaseErrorModel, DepolarErrorModel, PauliErrorModel
-from mqns.models.error.time_decay import TimeDecayFunc, TimeDecayInput, parse_time_decay, time_decay_nop
+from mqns.models.error.time_decay import (
+    TimeDecayFunc,
+    TimeDecayInput,
+    parse_time_decay,
+    time_decay_key,
+    time_decay_nop,
+    time_decay_werner_rate,
+)
 
 __all__ = [
     "BitFlipErrorModel",
@@ -16,7 +23,9 @@ __all__ = [
     "parse_time_decay",
     "PauliErrorModel",
     "PerfectErrorModel",
+    "time_decay_key",
     "time_decay_nop",
+    "time_decay_werner_rate",
     "TimeDecayFunc",
     "TimeDecayInput",
 ]
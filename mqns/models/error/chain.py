@@ -1,6 +1,8 @@
-from collections.abc import Iterable
-from typing import Self, override
+import functools
+from collections.abc import Hashable, Iterable
+from typing import Self, cast, override
 
+from mqns.models.core.kraus import KrausChannel
 from mqns.models.error.error import ErrorModel
 
 
@@ -39,10 +41,45 @@ class ChainErrorModel(ErrorModel):
     def _set(self, **kwargs) -> Self:
         for m in self.errors:
             m.set(**kwargs)
+
+        try:
+            del self._channel
+        except AttributeError:
+            pass
         return self
 
+    @override
+    def cache_key(self) -> tuple[Hashable, ...]:
+        return (ChainErrorModel, tuple(m.cache_key() for m in self.errors))
+
+    @property
+    @override
+    def channel(self) -> KrausChannel | None:
+        """
+        Composition of enclosed error models as a single channel.
+        None if any enclosed error model is not a fixed channel.
+        """
+        channels, composed = self._channel
+        if any(c is not m.channel for c, m in zip(channels, self.errors, strict=True)):
+            # an enclosed error model has been set directly
+            del self._channel
+            _, composed = self._channel
+        return composed
+
+    @functools.cached_property
+    def _channel(self) -> tuple[list[KrausChannel | None], KrausChannel | None]:
+        """Channels of enclosed error models, and their composition."""
+        channels = [m.channel for m in self.errors]
+        if not channels or None in channels:
+            return channels, None
+        return channels, functools.reduce(KrausChannel.compose, cast(list[KrausChannel], channels))
+
     @override
     def qubit(self, q) -> None:
+        channel = self.channel
+        if channel is not None:  # single pass over the density matrix
+            q.apply_channel(channel)
+            return
         for m in self.errors:
             m.qubit(q)
 
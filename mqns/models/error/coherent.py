@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import override
 
 import numpy as np
@@ -30,6 +31,10 @@ class CoherentErrorModel(ErrorModel):
         self._prepare()
         return self
 
+    @override
+    def cache_key(self) -> tuple[Hashable, ...]:
+        return (*super().cache_key(), self.standard_lkm, self.length)
+
     @override
     def _prepare(self) -> None:
         self._max_theta = (self.length / self.standard_lkm) * (np.pi / 4)
@@ -38,7 +43,7 @@ class CoherentErrorModel(ErrorModel):
     def qubit(self, q) -> None:
         theta = rng.uniform(0, self._max_theta)
         op = OPERATOR_RY(theta * 2)  # theta is physical radians, but RY uses Bloch Sphere radians
-        q.state.operate(op)
+        q.state.operate(op, [q.state.qubits.index(q)])
 
     @override
     def werner(self, q) -> None:
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 from typing import TYPE_CHECKING, Self, overload, override
 
 import numpy as np
 
+from mqns.models.core.kraus import KrausChannel
+
 if TYPE_CHECKING:
     from mqns.models.epr import MixedStateEntanglement, WernerStateEntanglement
     from mqns.models.qubit import Qubit
@@ -29,6 +32,11 @@ class ErrorModel(ABC):
         """Error probability."""
         return 1 - self._p_survival
 
+    @property
+    def rate(self) -> float:
+        """Decoherence rate most recently passed to ``set()``."""
+        return self._last_rate
+
     @overload
     def set(self, *, p_survival: float) -> Self:
         """
@@ -108,6 +116,22 @@ class ErrorModel(ABC):
         Subclass may override to precompute values.
         """
 
+    def cache_key(self) -> tuple[Hashable, ...]:
+        """
+        Compute a content key reflecting the type and current parameters of this error model.
+        Error models with equal keys have identical effects.
+        Subclass with additional parameters must extend the key.
+        """
+        return (type(self), self._p_survival, self._last_rate)
+
+    @property
+    def channel(self) -> KrausChannel | None:
+        """
+        Single-qubit quantum channel equivalent to ``qubit()``.
+        None if ``qubit()`` is not a fixed channel, e.g. it samples a random outcome.
+        """
+        return None
+
     @abstractmethod
     def qubit(self, q: "Qubit") -> None:
         """
@@ -135,6 +159,11 @@ class PerfectErrorModel(ErrorModel):
     def __init__(self, name="perfect"):
         super().__init__(name)
 
+    @property
+    @override
+    def channel(self) -> KrausChannel:
+        return _CHANNEL_IDENTITY
+
     @override
     def qubit(self, q) -> None:
         _ = q
@@ -146,3 +175,6 @@ class PerfectErrorModel(ErrorModel):
     @override
     def mixed(self, q) -> None:
         _ = q
+
+
+_CHANNEL_IDENTITY = KrausChannel.pauli_channel((1.0, 0.0, 0.0, 0.0))
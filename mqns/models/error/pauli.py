@@ -1,22 +1,20 @@
 import functools
 from abc import abstractmethod
-from collections.abc import Iterable
-from typing import Literal, cast, override
+from collections.abc import Hashable
+from typing import Literal, override
 
 import numpy as np
 
 from mqns.models.core.bell_diagonal import (
     BellDiagonalProbV,
-    PauliTransferMat,
-    bell_diagonal_probv_to_pauli_transfer_mat,
+    BellDiagonalTuple,
+    compose_bell_diagonal_tuple,
     make_bell_diagonal_probv,
 )
-from mqns.models.core.operator import OPERATOR_PAULI_I, OPERATOR_PAULI_X, OPERATOR_PAULI_Y, OPERATOR_PAULI_Z, Operator
+from mqns.models.core.kraus import KrausChannel
 from mqns.models.core.state import ATOL
 from mqns.models.error.error import ErrorModel
 
-OP_IZXY = [OPERATOR_PAULI_I, OPERATOR_PAULI_Z, OPERATOR_PAULI_X, OPERATOR_PAULI_Y]
-
 
 class PauliErrorModelBase(ErrorModel):
     _probv0 = make_bell_diagonal_probv(1, 0, 0, 0)
@@ -38,16 +36,19 @@ class PauliErrorModelBase(ErrorModel):
         self.probv = probv
 
         try:
-            del self._ptm
+            del self.bell
         except AttributeError:
             pass
 
+    @override
+    def cache_key(self) -> tuple[Hashable, ...]:
+        return (*super().cache_key(), self.probv.tobytes())
+
     @functools.cached_property
-    def _ptm(self) -> PauliTransferMat:
-        """
-        Construct the transition matrix for Bell-diagonal states.
-        """
-        return bell_diagonal_probv_to_pauli_transfer_mat(self.probv)
+    def bell(self) -> BellDiagonalTuple:
+        """Probability of I,Z,X,Y result, as a tuple of Python floats."""
+        i, z, x, y = (float(p) for p in self.probv)
+        return (i, z, x, y)
 
     @override
     def werner(self, q) -> None:
@@ -55,7 +56,7 @@ class PauliErrorModelBase(ErrorModel):
 
     @override
     def mixed(self, q) -> None:
-        q.set_probv(self._ptm @ q.probv, copy=False)
+        q.set_bell(compose_bell_diagonal_tuple(self.bell, q.bell))
 
 
 class PauliErrorModel(PauliErrorModelBase):
@@ -83,33 +84,32 @@ class PauliErrorModel(PauliErrorModelBase):
         else:
             self.ratios.fill(1 / 3)
 
+    @override
+    def cache_key(self) -> tuple[Hashable, ...]:
+        return (*super().cache_key(), self.ratios.tobytes())
+
     @override
     def _prepare(self) -> None:
         z, x, y = self.ratios * self.p_error
         self._set_probv(make_bell_diagonal_probv(self.p_survival, z, x, y))
 
         try:
-            del self._stochastic_ops
+            del self._channel
         except AttributeError:
             pass
 
+    @property
+    @override
+    def channel(self) -> KrausChannel:
+        return self._channel
+
     @functools.cached_property
-    def _stochastic_ops(self) -> tuple[list[Operator], list[float]]:
-        """
-        Construct the operators and probabilities for single qubit stochastic operations.
-        """
-        ops: list[Operator] = []
-        prob: list[float] = []
-        for o, p in zip(OP_IZXY, cast(Iterable[float], self.probv), strict=True):
-            if p > 0:
-                ops.append(o)
-                prob.append(p)
-        assert len(ops) > 0
-        return ops, prob
+    def _channel(self) -> KrausChannel:
+        return KrausChannel.pauli_channel(self.bell)
 
     @override
     def qubit(self, q) -> None:
-        q.stochastic_operate(*self._stochastic_ops)
+        q.apply_channel(self.channel)
 
 
 class DepolarErrorModel(PauliErrorModel):
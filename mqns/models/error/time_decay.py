@@ -1,9 +1,13 @@
-from collections.abc import Callable
-from typing import TYPE_CHECKING, TypedDict
-
-from mqns.models.error import ErrorModel
+import functools
+import math
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, TypedDict, cast, override
+
+from mqns.models.core.bell_diagonal import BellDiagonalTuple, compose_bell_diagonal_tuple
+from mqns.models.error.chain import ChainErrorModel
+from mqns.models.error.error import ErrorModel, PerfectErrorModel
 from mqns.models.error.input import ErrorModelConstructor, parse_error_str
-from mqns.models.error.pauli import DephaseErrorModel
+from mqns.models.error.pauli import DephaseErrorModel, PauliErrorModelBase
 from mqns.simulator import Time
 
 if TYPE_CHECKING:
@@ -51,13 +55,14 @@ def _set_rate(error: ErrorModel, value: float, accuracy: int):
     return error.set(t=0, rate=rate)
 
 
-def parse_time_decay(input: TimeDecayInput, t_cohere: Time) -> TimeDecayFunc:
+def parse_time_decay(input: TimeDecayInput, t_cohere: Time, *, cache_size=1024) -> TimeDecayFunc:
     """
     Parse TimeDecayFunc input.
 
     Args:
         input: input parameter.
         t_cohere: memory coherence time, used if ``input`` does not specify rate.
+        cache_size: how many distinct durations to keep precomputed decays for.
 
     Returns:
         TimeDecayFunc that accepts ``Time`` with same accuracy as ``t_cohere``.
@@ -91,8 +96,120 @@ def parse_time_decay(input: TimeDecayInput, t_cohere: Time) -> TimeDecayFunc:
         ctor, d = input if isinstance(input, tuple) else (DephaseErrorModel, input)
         error = _set_rate(ctor(), d["rate"] if "rate" in d else -d["t_cohere"], t_cohere.accuracy)
 
-    def apply_error_on(target: "QuantumModel", t: Time):
-        error.set(t=t.time_slot)
-        target.apply_error(error)
+    return _ErrorModelTimeDecay(error, cache_size)
+
+
+def _werner_rate(error: ErrorModel) -> float | None:
+    if isinstance(error, PerfectErrorModel):
+        return 0.0
+    if isinstance(error, PauliErrorModelBase):
+        # Every Pauli-based error model multiplies the Werner parameter by p_survival = exp(-rate * t).
+        return error.rate
+    if isinstance(error, ChainErrorModel):
+        rates = [_werner_rate(m) for m in error.errors]
+        return None if None in rates else sum(cast(list[float], rates))
+    return None
+
+
+def _pauli_channels(error: ErrorModel, t: int) -> list[BellDiagonalTuple] | None:
+    if isinstance(error, PerfectErrorModel):
+        return []
+    if isinstance(error, PauliErrorModelBase):
+        return [error.set(t=t).bell]
+    if isinstance(error, ChainErrorModel):
+        channels: list[BellDiagonalTuple] = []
+        for m in error.errors:
+            m_channels = _pauli_channels(m, t)
+            if m_channels is None:
+                return None
+            channels += m_channels
+        return channels
+    return None
+
+
+class _DecayTransfer(ErrorModel):
+    """
+    Time-based decay over a fixed duration, precomputed in closed form where possible.
+
+    * Werner state: the Werner parameter is multiplied by a scalar.
+    * Bell-diagonal state: the probability vector is transformed by precomputed Pauli channels.
+    * Otherwise: the underlying error model is applied.
+    """
+
+    def __init__(self, error: ErrorModel, werner_rate: float | None, t: int):
+        super().__init__(f"{error.name}@{t}")
+        self._error = error
+        self._t = t
+        self._werner_factor = None if werner_rate is None else math.exp(-werner_rate * t)
+        self._channels = _pauli_channels(error, t)
+
+    @override
+    def qubit(self, q) -> None:
+        self._error.set(t=self._t).qubit(q)
+
+    @override
+    def werner(self, q) -> None:
+        if self._werner_factor is None:
+            self._error.set(t=self._t).werner(q)
+        else:
+            q.w *= self._werner_factor
+
+    @override
+    def mixed(self, q) -> None:
+        if self._channels is None:
+            self._error.set(t=self._t).mixed(q)
+            return
+        for channel in self._channels:
+            q.set_bell(compose_bell_diagonal_tuple(channel, q.bell))
+
+
+class _ErrorModelTimeDecay:
+    """
+    TimeDecayFunc that applies a time-based error model.
+
+    The effect of each duration is computed once and kept in an LRU cache, because storage durations
+    recur frequently, e.g. with fixed-length SYNC timing phases.
+    """
+
+    def __init__(self, error: ErrorModel, cache_size: int):
+        self.error = error
+        self.werner_rate = _werner_rate(error)
+        """Decay rate of Werner parameter per time slot, None if unknown."""
+        self.key = error.set(t=0).cache_key()
+        """Content key of the error model at zero duration, see ``time_decay_key()``."""
+        self.transfer = functools.lru_cache(maxsize=cache_size)(self._make_transfer)
+        """Retrieve the decay over a duration in time slots."""
+
+    def _make_transfer(self, t: int) -> _DecayTransfer:
+        return _DecayTransfer(self.error, self.werner_rate, t)
+
+    def __call__(self, target: "QuantumModel", t: Time) -> None:
+        target.apply_error(self.transfer(t.time_slot))
 
-    return apply_error_on
+
+def time_decay_werner_rate(f: TimeDecayFunc) -> float | None:
+    """
+    Determine the closed form of a TimeDecayFunc applied to a Werner state entanglement.
+
+    Returns:
+        Rate per time slot, such that decay over ``t`` time slots multiplies the Werner parameter by ``exp(-rate * t)``.
+        None if the function does not have such a closed form.
+    """
+    if f is time_decay_nop:
+        return 0.0
+    if isinstance(f, _ErrorModelTimeDecay):
+        return f.werner_rate
+    return None
+
+
+def time_decay_key(f: TimeDecayFunc) -> Hashable:
+    """
+    Compute a content key of a TimeDecayFunc.
+
+    Functions returned by ``parse_time_decay`` are compared by their error model type and rate,
+    so that memories with the same decoherence parameters yield equal keys.
+    Other functions are compared by identity.
+    """
+    if isinstance(f, _ErrorModelTimeDecay):
+        return f.key
+    return f
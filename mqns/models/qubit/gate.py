@@ -1,4 +1,3 @@
-import functools
 from collections.abc import Callable
 
 import numpy as np
@@ -20,21 +19,16 @@ from mqns.models.core.operator import (
 from mqns.models.qubit.qubit import Qubit
 from mqns.models.qubit.state import QState
 
-_id = np.identity(2, dtype=np.complex128)
-_p0 = np.array([[1, 0], [0, 0]], dtype=np.complex128)  # projector matrix |0><0|
-_p1 = np.array([[0, 0], [0, 1]], dtype=np.complex128)  # projector matrix |1><1|
-
 
 def operate_single(qubit: Qubit, op: Operator) -> None:
     """
     Apply a single-qubit operator.
     """
     state = qubit.state
-    i, n = state.qubits.index(qubit), state.num
-    full_op = op.lift(i, n)
+    i = state.qubits.index(qubit)
 
     qubit.apply_error(qubit.operate_error)
-    state.operate(full_op)
+    state.operate(op, [i])
 
 
 def operate_controlled(q0: Qubit, q1: Qubit, op: Operator) -> None:
@@ -48,21 +42,14 @@ def operate_controlled(q0: Qubit, q1: Qubit, op: Operator) -> None:
     """
     assert op.n == 1
     state = QState.joint(q0, q1)
-    n = state.num
     i0, i1 = state.qubits.index(q0), state.qubits.index(q1)
     assert i0 != i1, "Qubits must be distinct"
 
-    mats0 = [_id] * n
-    mats1 = [_id] * n
-    mats0[i0] = _p0
-    mats1[i0] = _p1
-    mats1[i1] = op.u
-
-    full_op = functools.reduce(np.kron, mats0) + functools.reduce(np.kron, mats1)
+    controlled_op = op.controlled(2)
 
     for q in q0, q1:
         q.apply_error(q.operate_error)
-    state.operate(full_op)
+    state.operate(controlled_op, [i0, i1])
 
 
 def operate_cc(q0: Qubit, q1: Qubit, q2: Qubit, op: Operator) -> None:
@@ -78,29 +65,14 @@ def operate_cc(q0: Qubit, q1: Qubit, q2: Qubit, op: Operator) -> None:
     assert op.n == 1
     QState.joint(q0, q1)
     state = QState.joint(q0, q2)
-    n = state.num
     i0, i1, i2 = state.qubits.index(q0), state.qubits.index(q1), state.qubits.index(q2)
     assert len({i0, i1, i2}) == 3, "Qubits must be distinct"
 
-    mats_zz = [_id] * n
-    mats_zz[i0] = _p1
-    mats_zz[i1] = _p1
-
-    mats_11 = mats_zz.copy()
-    mats_11[i2] = op.u
-
-    # full_id         = (|00><00| + |01><01| + |10><10| + |11><11|)⊗I
-    # p11_on_controls = (|11><11|)⊗I
-    # u11_on_target   = (|11><11|)⊗U
-    # full_op         = (|00><00| + |01><01| + |10><10|)⊗I + (|11><11|)⊗U
-    full_id = np.identity(2**n, dtype=np.complex128)
-    p11_on_controls = functools.reduce(np.kron, mats_zz)
-    u11_on_target = functools.reduce(np.kron, mats_11)
-    full_op = full_id - p11_on_controls + u11_on_target
+    cc_op = op.controlled(3)
 
     for q in q0, q1, q2:
         q.apply_error(q.operate_error)
-    state.operate(full_op)
+    state.operate(cc_op, [i0, i1, i2])
 
 
 def _make_single(op: Operator):
@@ -17,11 +17,10 @@
 
 from typing import overload, override
 
-from mqns.models.core import QuantumModel
+from mqns.models.core import KrausChannel, QuantumModel
 from mqns.models.core.basis import BASIS_Z, MeasureOutcome
 from mqns.models.core.operator import Operator
 from mqns.models.core.state import (
-    QUBIT_RHO_0,
     QUBIT_STATE_0,
     QubitRho,
     QubitState,
@@ -76,13 +75,15 @@ class Qubit(QuantumModel):
         self,
         state: QubitState | None = None,
         *,
-        rho: QubitRho = QUBIT_RHO_0,
+        rho: QubitRho | None = None,
         operate_error: ErrorModelInputBasic = None,
         measure_error: ErrorModelInputBasic = None,
         name="",
     ):
         self.name = name
         """Descriptive name."""
+        if state is None and rho is None:
+            state = QUBIT_STATE_0
         self.state = QState([self], state=state, rho=rho)
         """QState that includes this qubit."""
         self.operate_error = parse_error(operate_error, DepolarErrorModel, -1)
@@ -111,9 +112,15 @@ class Qubit(QuantumModel):
             operators: a list of operators, each must operate on a single qubit.
             probabilities: the probability of applying each operator; their sum must be 1.
         """
-        i, n = self.state.qubits.index(self), self.state.num
-        full_operators: list[Operator] = [op.lift(i, n) for op in operators]
-        self.state.stochastic_operate(full_operators, probabilities)
+        i = self.state.qubits.index(self)
+        self.state.stochastic_operate(operators, probabilities, [i])
+
+    def apply_channel(self, channel: KrausChannel) -> None:
+        """
+        Apply a single-qubit quantum channel to the qubit.
+        """
+        i = self.state.qubits.index(self)
+        self.state.apply_channel(channel, [i])
 
     @override
     def apply_error(self, error) -> None:
@@ -1,23 +1,90 @@
-from typing import TYPE_CHECKING
+import functools
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, ClassVar, cast
 
 import numpy as np
 
-from mqns.models.core import ATOL, Basis, MeasureOutcome, Operator, QubitRho, QubitState
+from mqns.models.core import ATOL, BASIS_Z, Basis, KrausChannel, MeasureOutcome, Operator, QubitRho, QubitState
 from mqns.models.core.state import (
     QUBIT_STATE_0,
     check_qubit_rho,
+    check_qubit_state,
+    normalize_qubit_rho,
     qubit_rho_remove,
     qubit_rho_to_state,
+    qubit_state_normalize_phase,
     qubit_state_to_rho,
 )
+from mqns.models.qubit.tableau import StabilizerTableau, clifford_table
 from mqns.utils import rng
 
 if TYPE_CHECKING:
     from mqns.models.qubit.qubit import Qubit
 
 
+def _project_psi(tensor: np.ndarray, idx: int, s: QubitState) -> tuple[np.ndarray, float]:
+    """
+    Project a qubit of a state vector onto a single-qubit state.
+
+    Returns:
+        [0]: Unnormalized state vector of the remaining qubits.
+        [1]: Probability of the projection.
+    """
+    rest = np.tensordot(s.conj().ravel(), tensor, axes=(0, idx)).reshape((-1, 1))
+    return rest, float(np.vdot(rest, rest).real)
+
+
+def _project_rho(tensor: np.ndarray, idx: int, n: int, s: QubitState) -> tuple[np.ndarray, float]:
+    """
+    Project a qubit of a density matrix onto a single-qubit state.
+
+    Returns:
+        [0]: Unnormalized density matrix of the remaining qubits.
+        [1]: Probability of the projection.
+    """
+    rest = np.tensordot(s.conj().ravel(), tensor, axes=(0, idx))
+    rest = np.tensordot(rest, s.ravel(), axes=(n - 1 + idx, 0))
+    dim = 2 ** (n - 1)
+    rest = rest.reshape((dim, dim))
+    return rest, float(np.trace(rest).real)
+
+
+@functools.lru_cache(maxsize=16)
+def _basis_rotation(basis: Basis) -> Operator:
+    """Operator that rotates ``basis.s0`` to ``|0>`` and ``basis.s1`` to ``|1>``."""
+    return Operator(np.vstack((basis.s0.conj().T, basis.s1.conj().T)))
+
+
+def _sample_index(probabilities: Sequence[float] | np.ndarray) -> int:
+    """Draw an index with the given probabilities."""
+    i = int(np.searchsorted(np.cumsum(probabilities), rng.random(), side="right"))
+    return min(i, len(probabilities) - 1)
+
+
 class QState:
-    """QState tracks the state of one or more qubits."""
+    """
+    QState tracks the state of one or more qubits.
+
+    While the qubits are in a pure state, QState stores a state vector of ``2**n`` amplitudes,
+    so that gates and measurements operate on the state vector.
+    The state vector is promoted to a density matrix upon the first non-unitary operation,
+    such as a stochastic operation with more than one operator or tracing out an entangled qubit.
+
+    If ``QState.use_tableau`` is enabled, single-qubit stabilizer states are instead stored as
+    stabilizer tableaux, which remain tableaux while only Clifford operators are applied, so that
+    a joint state of hundreds of qubits is feasible.
+    A tableau is converted to a state vector upon the first operation that it cannot represent.
+    """
+
+    use_tableau: ClassVar[bool] = False
+    """
+    Whether new single-qubit states are stored as stabilizer tableaux where possible.
+
+    A tableau represents a pure state, so that noise is simulated by sampling trajectories:
+    a Pauli channel or a stochastic operation of Clifford operators applies one randomly chosen operator,
+    and tracing out a qubit measures it and discards the outcome.
+    Statistics over many runs agree with the density matrix, but each run consumes extra random numbers.
+    """
 
     @staticmethod
     def joint(q0: "Qubit", q1: "Qubit") -> "QState":
@@ -27,8 +94,16 @@ class QState:
         if q0.state is q1.state:
             return q0.state
         assert set(q0.state.qubits).isdisjoint(q1.state.qubits)
-        rho: np.ndarray = np.kron(q0.state.rho, q1.state.rho)
-        nq = QState(q0.state.qubits + q1.state.qubits, rho=rho)
+        qubits = q0.state.qubits + q1.state.qubits
+        tab0, tab1 = q0.state._tab, q1.state._tab
+        if tab0 is not None and tab1 is not None:
+            nq = QState(qubits, tableau=StabilizerTableau.kron(tab0, tab1))
+        elif (psi0 := q0.state._densify()) is not None and (psi1 := q1.state._densify()) is not None:
+            psi: np.ndarray = np.kron(psi0, psi1)
+            nq = QState(qubits, state=psi, intermediate=True)
+        else:
+            rho: np.ndarray = np.kron(q0.state.rho, q1.state.rho)
+            nq = QState(qubits, rho=rho, intermediate=True)
         for q in nq.qubits:
             q.state = nq
         return nq
@@ -39,27 +114,93 @@ class QState:
         *,
         state: QubitState | None = None,
         rho: QubitRho | None = None,
+        tableau: StabilizerTableau | None = None,
+        intermediate=False,
     ):
         """
         Args:
             qubits: list of qubits in this state.
-            state: state vector, required if ``rho`` is absent.
+            state: state vector, required if ``rho`` and ``tableau`` are absent.
             rho: density matrix, ignored if ``state`` is specified.
+            tableau: stabilizer tableau, which takes precedence over ``state`` and ``rho``.
+            intermediate: whether ``state`` or ``rho`` is computed from validated states, see ``ValidationLevel``.
         """
         self.qubits = qubits
         """List of qubits in this state."""
-        if state is None:
+        self._psi: QubitState | None = None
+        """State vector, None if this is stored as a density matrix."""
+        self._rho: QubitRho | None = None
+        """Density matrix, None if this is a pure state whose density matrix has not been computed."""
+        self._tab = tableau
+        """Stabilizer tableau, None if this is stored as a state vector or density matrix."""
+        if tableau is not None:
+            assert tableau.n == self.num
+        elif state is None:
             assert rho is not None
-            self.rho = check_qubit_rho(rho, self.num)
-            """Density matrix."""
+            self._rho = check_qubit_rho(rho, self.num, intermediate=intermediate)
         else:
-            self.rho = qubit_state_to_rho(state, self.num)
+            state = check_qubit_state(state, self.num, intermediate=intermediate)
+            if QState.use_tableau and self.num == 1:
+                self._tab = StabilizerTableau.from_state(state)
+            if self._tab is None:
+                self._psi = state
 
     @property
     def num(self) -> int:
         """Return number of qubits in this state."""
         return len(self.qubits)
 
+    @property
+    def is_pure(self) -> bool:
+        """Whether this is stored as a state vector or a stabilizer tableau."""
+        return self._psi is not None or self._tab is not None
+
+    @property
+    def is_tableau(self) -> bool:
+        """Whether this is stored as a stabilizer tableau."""
+        return self._tab is not None
+
+    @property
+    def rho(self) -> QubitRho:
+        """
+        Density matrix.
+
+        If this is stored as a state vector or a stabilizer tableau, the density matrix is computed on demand.
+        Assigning a density matrix promotes this to density matrix storage.
+        """
+        if self._rho is None:
+            psi = self._psi if self._tab is None else self._tab.to_state()
+            assert psi is not None
+            self._rho = qubit_state_to_rho(psi, self.num)
+        return self._rho
+
+    @rho.setter
+    def rho(self, value: QubitRho) -> None:
+        self._psi = None
+        self._tab = None
+        self._rho = value
+
+    def _set_psi(self, psi: QubitState) -> None:
+        self._psi = psi
+        self._tab = None
+        self._rho = None
+
+    def _densify(self) -> QubitState | None:
+        """
+        Convert stabilizer tableau to state vector.
+
+        Returns: The state vector, or None if this is stored as a density matrix.
+        """
+        if self._tab is not None:
+            self._set_psi(self._tab.to_state())
+        return self._psi
+
+    def _promote(self) -> QubitRho:
+        rho = self.rho
+        self._psi = None
+        self._tab = None
+        return rho
+
     def measure(self, qubit: "Qubit", basis: Basis) -> MeasureOutcome:
         """
         Measure a qubit using the specified basis.
@@ -75,29 +216,88 @@ class QState:
         except ValueError:
             raise RuntimeError("qubit not in state")
 
+        if self._tab is not None:
+            rotation = clifford_table(_basis_rotation(basis))
+            if rotation is not None:
+                self._tab.apply(rotation, [idx])
+                ret = self._tab.measure(idx, rng.random())
+                self._rho = None
+                self.qubits.remove(qubit)
+                qubit.state = QState([qubit], state=basis.s1 if ret else basis.s0)
+                return ret
+            self._densify()
+
+        n = self.num
+        if self._psi is not None:
+            project = functools.partial(_project_psi, self._psi.reshape((2,) * n), idx)
+        else:
+            project = functools.partial(_project_rho, self.rho.reshape((2,) * (2 * n)), idx, n)
+
         # Calculate probability with Born rule
-        full_m0 = basis.m0.lift(idx, self.num, check_unitary=False)
-        prob_0 = np.real(np.trace(full_m0.u @ self.rho))
+        rest, prob_0 = project(basis.s0)
         prob_0 = np.clip(prob_0, 0.0, 1.0)  # avoid out-of-range due to floating-point calculation
 
         # Assign outcome
         if rng.random() < prob_0:
-            ret = 0
-            ret_s = basis.s0
-            op = full_m0
+            ret, ret_s = 0, basis.s0
         else:
-            ret = 1
-            ret_s = basis.s1
-            op = basis.m1.lift(idx, self.num, check_unitary=False)
+            ret, ret_s = 1, basis.s1
+            rest, _ = project(basis.s1)
 
-        # Perform state collapse
-        collapsed = op(self.rho)
-        self.rho = collapsed / (np.trace(collapsed) or 1.0)
-
-        # Perform partial trace to delete measured qubit
-        self.trace_out(qubit, ret_s, idx=idx)
+        # After collapse, the measured qubit is separable, so that it can be removed by contraction.
+        self.qubits.remove(qubit)
+        if self._psi is not None:
+            self._set_psi(cast(QubitState, rest / (np.linalg.norm(rest) or 1.0)))
+        else:
+            self.rho = normalize_qubit_rho(rest, n - 1, maybe_zero=True, intermediate=True)
+        qubit.state = QState([qubit], state=ret_s)
         return ret
 
+    def probabilities(self, basis: Basis = BASIS_Z) -> np.ndarray:
+        """
+        Compute the outcome distribution of measuring every qubit, without collapsing the state.
+
+        Args:
+            basis: measurement basis of every qubit.
+
+        Returns: Probability of each outcome, shape is (2**n,).
+                 Outcome bits follow the order of ``self.qubits``, with the first qubit as the most significant bit.
+        """
+        n = self.num
+        rotation = _basis_rotation(basis)
+        targets = () if basis is BASIS_Z else range(n)
+        psi = self._psi if self._tab is None else self._tab.to_state()
+        if psi is not None:
+            for i in targets:
+                psi = rotation.apply(psi, [i], n)
+            prob = np.abs(psi.ravel()) ** 2
+        else:
+            rho = self.rho
+            for i in targets:
+                rho = rotation.apply(rho, [i], n)
+            prob = np.diagonal(rho).real
+        prob = np.clip(prob, 0.0, None)  # avoid out-of-range due to floating-point calculation
+        return prob / np.sum(prob)
+
+    def sample(self, shots: int, basis: Basis = BASIS_Z) -> np.ndarray:
+        """
+        Draw outcomes of measuring every qubit, without collapsing the state.
+
+        Each shot is an independent measurement, as if the state were prepared ``shots`` times.
+        The outcome distribution is computed once, and all shots are drawn at once.
+
+        Args:
+            shots: number of shots.
+            basis: measurement basis of every qubit.
+
+        Returns: Measurement outcomes, shape is (shots, n); columns follow the order of ``self.qubits``.
+        """
+        n = self.num
+        if self._tab is not None and (rotation := clifford_table(_basis_rotation(basis))) is not None:
+            return self._tab.sample(shots, rotation, rng.random((shots, n)))
+        outcomes = rng.choice(2**n, size=shots, p=self.probabilities(basis))
+        return ((outcomes[:, np.newaxis] >> np.arange(n - 1, -1, -1)) & 1).astype(np.uint8)
+
     def trace_out(self, qubit: "Qubit", state=QUBIT_STATE_0, *, idx: int | None = None) -> None:
         """
         Remove a qubit from state without measurement.
@@ -113,30 +313,61 @@ class QState:
             except ValueError:
                 raise RuntimeError("qubit not in state")
 
-        self.rho = qubit_rho_remove(self.rho, idx, self.num)
+        if self._tab is not None:
+            # reduced state is the mixture over measurement outcomes, sampled as one trajectory
+            self._tab.measure(idx, rng.random())
+            self._rho = None
+        elif self._psi is None:
+            self.rho = qubit_rho_remove(self.rho, idx, self.num)
+        else:
+            # reduced density matrix M @ M^dagger, where M has the removed qubit as its column index
+            m = np.moveaxis(self._psi.reshape((2,) * self.num), idx, -1).reshape((-1, 2))
+            self.rho = normalize_qubit_rho(m @ m.conj().T, self.num - 1, maybe_zero=True, intermediate=True)
         self.qubits.remove(qubit)
 
         qubit.state = QState([qubit], state=state)
 
-    def operate(self, op: Operator | np.ndarray) -> None:
+    def operate(self, op: Operator | np.ndarray, targets: Sequence[int] | None = None) -> None:
         """
         Apply an operator to the state.
 
         Args:
-            op: the operator or its matrix with the correct dimension.
+            op: the operator or its matrix.
+            targets: indices of target qubits in ``self.qubits``.
+                     If None, the operator must have the same dimension as the state.
         """
         if not isinstance(op, Operator):
-            op = Operator(op, self.num)
-        self.rho = op(self.rho)
+            op = Operator(op, self.num if targets is None else len(targets))
+        if self._tab is not None:
+            table = clifford_table(op)
+            if table is not None:
+                self._tab.apply(table, list(range(self.num) if targets is None else targets))
+                self._rho = None
+                return
+            self._densify()
 
-    def stochastic_operate(self, operators: list[Operator] = [], probabilities: list[float] = []) -> None:
+        if self._psi is None:
+            self.rho = self._apply(op, self.rho, targets)
+        else:
+            self._set_psi(self._apply(op, self._psi, targets))
+
+    def _apply[T: (QubitState | QubitRho)](self, op: Operator, state: T, targets: Sequence[int] | None) -> T:
+        if targets is None or (op.n == self.num and list(targets) == list(range(self.num))):
+            return op(state)
+        return op.apply(state, targets, self.num)
+
+    def stochastic_operate(
+        self, operators: list[Operator] = [], probabilities: list[float] = [], targets: Sequence[int] | None = None
+    ) -> None:
         """
         Apply a set of operators with associated probabilities to the state.
         It usually turns a pure state into a mixed state.
 
         Args:
-            operators: a list of operators, each must have the correct dimension.
+            operators: a list of operators.
             probabilities: the probability of applying each operator; their sum must be 1.
+            targets: indices of target qubits in ``self.qubits``.
+                     If None, each operator must have the same dimension as the state.
         """
         assert len(operators) == len(probabilities), "must have same number of operators and probabilities"
         prob = np.array(probabilities, dtype=np.float64)
@@ -144,10 +375,43 @@ class QState:
         assert np.all(prob <= 1), "each probability must be between 0 and 1"
         assert np.isclose(np.sum(prob), 1.0, atol=ATOL), "sum of probabilities must be 1"
 
-        new_rho: QubitRho = np.zeros_like(self.rho)
+        if len(operators) == 1:  # single operator is unitary and keeps a pure state pure
+            self.operate(operators[0], targets)
+            return
+
+        if self._tab is not None:
+            tables = [clifford_table(op) for op in operators]
+            if all(t is not None for t in tables):  # sample one operator, see ``QState.use_tableau``
+                self.operate(operators[_sample_index(prob)], targets)
+                return
+
+        rho = self._promote()
+        new_rho: QubitRho = np.zeros_like(rho)
         for op, p in zip(operators, prob):
-            new_rho += p * op(self.rho)
-        self.rho = check_qubit_rho(new_rho, self.num)
+            new_rho += p * self._apply(op, rho, targets)
+        self.rho = check_qubit_rho(new_rho, self.num, intermediate=True)
+
+    def apply_channel(self, channel: KrausChannel, targets: Sequence[int]) -> None:
+        """
+        Apply a quantum channel to the state.
+        A channel with a single Kraus operator keeps a pure state pure; otherwise the state is promoted.
+
+        Args:
+            channel: the channel.
+            targets: indices of target qubits in ``self.qubits``.
+        """
+        op = channel.unitary
+        if op is not None:
+            self.operate(op, targets)
+            return
+
+        if self._tab is not None and channel.pauli is not None:  # sample one Pauli, see ``QState.use_tableau``
+            k = _sample_index(channel.pauli)  # I,Z,X,Y
+            self._tab.apply_pauli(targets[0], int(k >= 2), int(k in (1, 3)))
+            self._rho = None
+            return
+
+        self.rho = check_qubit_rho(channel.apply(self._promote(), targets, self.num), self.num, intermediate=True)
 
     def state(self) -> QubitState | None:
         """
@@ -155,7 +419,12 @@ class QState:
 
         Returns: Either a state vector, or None if this is a mixed state.
         """
+        psi = self._psi if self._tab is None else self._tab.to_state()
+        if psi is not None:
+            return check_qubit_state(qubit_state_normalize_phase(psi), self.num, intermediate=True)
         return qubit_rho_to_state(self.rho, self.num)
 
     def __repr__(self) -> str:
+        if self._tab is not None:
+            return f"<stabilizer tableau of {self.num} qubits>"
         return str(self.rho)
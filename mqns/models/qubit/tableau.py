@@ -0,0 +1,237 @@
+"""
+Stabilizer tableau representation of pure states reachable by Clifford operations.
+"""
+
+import functools
+from typing import NamedTuple, Self, cast
+
+import numpy as np
+
+from mqns.models.core import ATOL, MeasureOutcome, Operator, QubitState
+from mqns.models.core.state import check_qubit_state
+
+
+class CliffordTable(NamedTuple):
+    """
+    Conjugation table of a Clifford operator ``U`` on ``k`` qubits.
+
+    Row ``L`` describes the image ``U @ P @ U^dagger = (-1)^s[L] * P(x[L], z[L])`` of the Hermitian Pauli
+    ``P(x, z) = ⊗ i^(x_j*z_j) X^x_j Z^z_j``, where ``L = sum(x_j << j) + sum(z_j << (k+j))``.
+    """
+
+    x: np.ndarray
+    """X bits of each image, shape is (4**k, k)."""
+    z: np.ndarray
+    """Z bits of each image, shape is (4**k, k)."""
+    s: np.ndarray
+    """Sign bit of each image, shape is (4**k,)."""
+
+
+def _pauli_bits(k: int) -> tuple[np.ndarray, np.ndarray]:
+    """X and Z bits of every ``k``-qubit Pauli, indexed as in ``CliffordTable``."""
+    idx = np.arange(4**k)[:, np.newaxis]
+    j = np.arange(k)
+    return ((idx >> j) & 1).astype(np.uint8), ((idx >> (k + j)) & 1).astype(np.uint8)
+
+
+_PAULI_XZ = [np.identity(2), np.array([[0, 1], [1, 0]]), np.array([[1, 0], [0, -1]]), np.array([[0, -1j], [1j, 0]])]
+"""Hermitian Pauli matrices indexed by ``x + 2*z``: I, X, Z, Y."""
+
+
+@functools.lru_cache(maxsize=256)
+def clifford_table(op: Operator) -> CliffordTable | None:
+    """
+    Compute the conjugation table of an operator.
+
+    Returns: The table, or None if the operator is not a Clifford operator.
+    """
+    k = op.n
+    if k > 3:
+        return None
+    xs, zs = _pauli_bits(k)
+    paulis = np.array([functools.reduce(np.kron, [_PAULI_XZ[xj + 2 * zj] for xj, zj in zip(x, z)]) for x, z in zip(xs, zs)])
+    images = op.u @ paulis @ op.u_dagger
+    # coefficients of each image in the Pauli basis; a Clifford image has a single coefficient of +1 or -1
+    coeffs = np.einsum("qji,pji->pq", paulis.conj(), images) / 2**k
+    found = np.argmax(np.abs(coeffs), axis=1)
+    signs = coeffs[np.arange(len(coeffs)), found]
+    if not (np.allclose(np.abs(signs.real), 1, atol=ATOL) and np.allclose(signs.imag, 0, atol=ATOL)):
+        return None
+    return CliffordTable(xs[found], zs[found], (signs.real < 0).astype(np.uint8))
+
+
+class StabilizerTableau:
+    """
+    Aaronson-Gottesman stabilizer tableau of an ``n``-qubit pure state.
+
+    Rows ``0..n-1`` are destabilizers and rows ``n..2n-1`` are stabilizers.
+    Each row is a Hermitian Pauli ``(-1)^r * P(x, z)``, see ``CliffordTable``.
+    Memory and time per operation are polynomial in ``n``, instead of exponential for a state vector.
+    """
+
+    def __init__(self, x: np.ndarray, z: np.ndarray, r: np.ndarray):
+        self.n = x.shape[1]
+        """Number of qubits."""
+        assert x.shape == z.shape == (2 * self.n, self.n)
+        assert r.shape == (2 * self.n,)
+        self.x = x
+        """X bits, shape is (2n, n)."""
+        self.z = z
+        """Z bits, shape is (2n, n)."""
+        self.r = r
+        """Sign bits, shape is (2n,)."""
+
+    @classmethod
+    def zero(cls, n: int) -> Self:
+        """Construct the tableau of ``|0...0>``."""
+        eye = np.identity(n, dtype=np.uint8)
+        zero = np.zeros((n, n), dtype=np.uint8)
+        return cls(np.vstack((eye, zero)), np.vstack((zero, eye)), np.zeros(2 * n, dtype=np.uint8))
+
+    @classmethod
+    def from_state(cls, state: QubitState) -> Self | None:
+        """
+        Construct the tableau of a single-qubit state.
+
+        Returns: The tableau, or None if the state is not a stabilizer state.
+        """
+        s0, s1 = state.ravel()
+        table = clifford_table(Operator([[s0, -np.conj(s1)], [s1, np.conj(s0)]]))
+        if table is None:
+            return None
+        tab = cls.zero(1)
+        tab.apply(table, [0])
+        return tab
+
+    @classmethod
+    def kron(cls, a: "StabilizerTableau", b: "StabilizerTableau") -> Self:
+        """Construct the tableau of the tensor product of two states."""
+        na, n = a.n, a.n + b.n
+        rows_a = np.r_[0:na, n : n + na]
+        rows_b = np.r_[na:n, n + na : 2 * n]
+        x, z = np.zeros((2 * n, n), dtype=np.uint8), np.zeros((2 * n, n), dtype=np.uint8)
+        r = np.zeros(2 * n, dtype=np.uint8)
+        x[rows_a, :na], z[rows_a, :na], r[rows_a] = a.x, a.z, a.r
+        x[rows_b, na:], z[rows_b, na:], r[rows_b] = b.x, b.z, b.r
+        return cls(x, z, r)
+
+    def apply(self, table: CliffordTable, targets: list[int]) -> None:
+        """
+        Apply a Clifford operator on target qubits.
+        """
+        k = len(targets)
+        weights = 1 << np.arange(2 * k)
+        idx = self.x[:, targets] @ weights[:k] + self.z[:, targets] @ weights[k:]
+        self.x[:, targets] = table.x[idx]
+        self.z[:, targets] = table.z[idx]
+        self.r ^= table.s[idx]
+
+    def apply_pauli(self, a: int, x: int, z: int) -> None:
+        """
+        Apply a Pauli ``P(x, z)`` on qubit ``a``, flipping the sign of every row that anticommutes with it.
+        """
+        self.r ^= (self.x[:, a] & z) ^ (self.z[:, a] & x)
+
+    def _rowsum(self, rows: np.ndarray, i: int) -> None:
+        """Multiply row ``i`` into each of ``rows``, tracking signs."""
+        x1, z1 = self.x[i].astype(np.int8), self.z[i].astype(np.int8)
+        x2, z2 = self.x[rows].astype(np.int8), self.z[rows].astype(np.int8)
+        # exponent of i contributed by each qubit, see Aaronson & Gottesman (2004) function g
+        g = x1 * z1 * (z2 - x2) + x1 * (1 - z1) * z2 * (2 * x2 - 1) + (1 - x1) * z1 * x2 * (1 - 2 * z2)
+        total = 2 * self.r[rows].astype(np.int64) + 2 * int(self.r[i]) + g.sum(axis=1)
+        self.r[rows] = (total % 4) // 2
+        self.x[rows] ^= self.x[i]
+        self.z[rows] ^= self.z[i]
+
+    def measure(self, a: int, draw: float) -> MeasureOutcome:
+        """
+        Measure qubit ``a`` in the Z basis and remove it from the tableau.
+
+        Args:
+            a: qubit index.
+            draw: uniform random number in [0, 1), outcome is 0 if it is less than the probability of 0.
+
+        Returns: Measurement outcome.
+        """
+        n, x, z, r = self.n, self.x, self.z, self.r
+        stabs = np.flatnonzero(x[n:, a]) + n
+        if len(stabs) > 0:  # random outcome: some stabilizer anticommutes with Z_a
+            p = int(stabs[0])
+            others = np.flatnonzero(x[:, a])
+            self._rowsum(others[others != p], p)
+            x[p - n], z[p - n], r[p - n] = x[p], z[p], r[p]
+            x[p], z[p] = 0, 0
+            z[p, a] = 1
+            outcome = 0 if draw < 0.5 else 1
+            r[p] = outcome
+        else:  # deterministic outcome: Z_a is a product of stabilizers, which is accumulated into one of them
+            destabs = np.flatnonzero(x[:n, a])
+            p = int(destabs[0]) + n
+            for j in destabs[1:]:
+                self._rowsum(np.array([p]), int(j) + n)
+            # keep destabilizers dual to the changed stabilizer
+            x[destabs[1:]] ^= x[p - n]
+            z[destabs[1:]] ^= z[p - n]
+            outcome = cast(MeasureOutcome, int(r[p]))
+
+        # row p is now (-1)^outcome Z_a and row p-n is the only row with X on qubit a,
+        # so that qubit a can be removed after clearing Z_a from the other rows
+        rows = np.flatnonzero(z[:, a])
+        self._rowsum(rows[(rows != p) & (rows != p - n)], p)
+        keep = np.ones(2 * n, dtype=np.bool_)
+        keep[[p - n, p]] = False
+        self.x, self.z, self.r = np.delete(x[keep], a, axis=1), np.delete(z[keep], a, axis=1), r[keep]
+        self.n = n - 1
+        return outcome
+
+    def sample(self, shots: int, rotation: CliffordTable, draws: np.ndarray) -> np.ndarray:
+        """
+        Draw outcomes of measuring every qubit, without modifying the tableau.
+
+        Since the outcome distribution has ``2**n`` entries, each shot measures a copy of the tableau instead.
+
+        Args:
+            shots: number of shots.
+            rotation: single-qubit Clifford operator applied to every qubit before measuring in the Z basis.
+            draws: uniform random numbers in [0, 1), shape is (shots, n).
+
+        Returns: Measurement outcomes, shape is (shots, n).
+        """
+        n = self.n
+        rotated = StabilizerTableau(self.x.copy(), self.z.copy(), self.r.copy())
+        for i in range(n):
+            rotated.apply(rotation, [i])
+        outcomes = np.empty((shots, n), dtype=np.uint8)
+        for s in range(shots):
+            tab = StabilizerTableau(rotated.x.copy(), rotated.z.copy(), rotated.r.copy())
+            for i in range(n):
+                outcomes[s, i] = tab.measure(0, draws[s, i])
+        return outcomes
+
+    def _pauli_state(self, row: int, psi: np.ndarray) -> np.ndarray:
+        """Apply the Pauli of a row onto a state tensor."""
+        x, z = self.x[row], self.z[row]
+        psi = psi.copy()
+        for j in np.flatnonzero(z):
+            psi[(slice(None),) * j + (1,)] *= -1
+        xa = tuple(int(j) for j in np.flatnonzero(x))
+        if xa:
+            psi = np.flip(psi, axis=xa)
+        return psi * (1j ** int(np.sum(x & z)) * (-1) ** int(self.r[row]))
+
+    def to_state(self) -> QubitState:
+        """
+        Convert to state vector, whose size is exponential in ``n``.
+
+        Starting from ``|0...0>``, the state is projected onto the +1 eigenspace of each stabilizer in turn.
+        If it is orthogonal to that eigenspace, the paired destabilizer moves it into the eigenspace
+        while preserving the eigenvalues of the other stabilizers.
+        """
+        n = self.n
+        psi = np.zeros((2,) * n, dtype=np.complex128)
+        psi[(0,) * n] = 1
+        for i in range(n):
+            proj = (psi + self._pauli_state(n + i, psi)) / 2
+            norm = np.linalg.norm(proj)
+            psi = self._pauli_state(i, psi) if norm < 0.5 else proj / norm
+        return check_qubit_state(psi.reshape((-1, 1)), n, intermediate=True)
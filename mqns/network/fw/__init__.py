@@ -2,7 +2,12 @@ from mqns.network.fw.controller import RoutingController
 from mqns.network.fw.cutoff import CutoffScheme, CutoffSchemeWaitTime, CutoffSchemeWaitTimeCounters
 from mqns.network.fw.fib import Fib, FibEntry
 from mqns.network.fw.forwarder import Forwarder, ForwarderCounters, ForwarderInitKwargs
-from mqns.network.fw.fw_classic import fw_control_cmd_handler, fw_signaling_cmd_handler
+from mqns.network.fw.fw_classic import (
+    SignalingMode,
+    SignalingObservationPacket,
+    fw_control_cmd_handler,
+    fw_signaling_cmd_handler,
+)
 from mqns.network.fw.message import MultiplexingVector, SwapSequence
 from mqns.network.fw.mux import MuxScheme
 from mqns.network.fw.mux_buffer_space import MuxSchemeBufferSpace
@@ -23,8 +28,11 @@ from mqns.network.fw.select import (
     select_purif_qubit_random,
 )
 from mqns.network.fw.swap_sequence import SwapPolicy, SwapSequenceInput, parse_swap_sequence
+from mqns.network.fw.timeseries import ConsumedSeriesKey, ConsumedTimeSeries
 
 __all__ = [
+    "ConsumedSeriesKey",
+    "ConsumedTimeSeries",
     "CutoffScheme",
     "CutoffSchemeWaitTime",
     "CutoffSchemeWaitTimeCounters",
@@ -52,6 +60,8 @@ __all__ = [
     "RoutingPathStatic",
     "select_purif_qubit_random",
     "SelectPurifQubit",
+    "SignalingMode",
+    "SignalingObservationPacket",
     "SwapPolicy",
     "SwapSequence",
     "SwapSequenceInput",
@@ -59,6 +69,7 @@ __all__ = [
 
 for name in __all__:
     if name in (
+        "ConsumedSeriesKey",
         "MemoryEprIterator",
         "MemoryEprTuple",
         "MultiplexingVector",
@@ -69,7 +69,7 @@ class CutoffScheme(ABC):
         msg: CutoffDiscardMsg = {
             "cmd": "CUTOFF_DISCARD",
             "path_id": fib_entry.path_id,
-            "epr": epr.name,
+            "epr": epr.id,
             "round": round,
         }
         fw.send_msg(partner, msg, fib_entry)
@@ -81,16 +81,16 @@ class CutoffScheme(ABC):
         This is called by ProactiveForwarder upon receiving a CUTOFF_DISCARD message.
         """
         fw = self.fw
-        epr_name = msg["epr"]
+        epr_id = msg["epr"]
         round = msg["round"]
 
         # find qubit
-        qm_tuple = fw.memory.read(epr_name, remove=True)
-        if qm_tuple is None:
-            log.debug(f"{self.node}: remote cutoff discard epr={epr_name} not exist")
+        addr = fw.memory.locate(epr_id)
+        if addr is None:
+            log.debug(f"{self.node}: remote cutoff discard epr={epr_id:x} not exist")
             return
-        qubit, _ = qm_tuple
-        log.debug(f"{self.node}: remote cutoff discard epr={epr_name} addr={qubit.addr} round={round}")
+        qubit, _ = fw.memory.read(addr, must=True, remove=True)
+        log.debug(f"{self.node}: remote cutoff discard epr={epr_id:x} addr={qubit.addr} round={round}")
 
         # discard secondary qubit
         fw.cnt.increment_n_cutoff(round, False)
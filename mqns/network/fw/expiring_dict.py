@@ -0,0 +1,135 @@
+import heapq
+from collections.abc import Callable, Hashable, Iterator
+
+from mqns.simulator import Time
+
+
+class ExpiringDict[K: Hashable, V]:
+    """
+    Dictionary whose entries expire at a deadline, with bounded size.
+
+    Each entry is inserted with a deadline, typically the decoherence time of an EPR referenced by the value.
+    Expired entries are removed by ``expire()``, which should be invoked periodically with the current time.
+    If the dictionary is full, inserting a new key evicts the entry with the earliest deadline,
+    or the oldest entry if no entry has a deadline.
+    """
+
+    def __init__(self, capacity: int, *, on_evict: Callable[[K, V], None] | None = None):
+        """
+        Args:
+            capacity: Maximum number of entries.
+            on_evict: Callback invoked with the key and value of each entry removed because the dictionary is full.
+        """
+        assert capacity > 0
+        self.capacity = capacity
+        """Maximum number of entries."""
+        self.on_evict = on_evict
+        """Callback invoked with the key and value of each entry removed because the dictionary is full."""
+        self.n_expired = 0
+        """How many entries were removed because their deadlines have passed."""
+        self.n_evicted = 0
+        """How many entries were removed because the dictionary is full."""
+
+        self._d: dict[K, tuple[V, int]] = {}
+        """Entries; each value is the stored value and its insertion sequence number."""
+        self._heap: list[tuple[Time, int, K]] = []
+        """Deadlines as a min-heap; each element is (deadline, sequence number, key)."""
+        self._seq = 0
+        """Next sequence number."""
+
+    def __len__(self) -> int:
+        return len(self._d)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._d
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._d)
+
+    def set(self, key: K, value: V, deadline: Time) -> None:
+        """
+        Insert or replace an entry.
+
+        Args:
+            key: Entry key.
+            value: Entry value.
+            deadline: Time point after which the entry expires.
+                      ``Time.SENTINEL`` means the entry does not expire but can still be evicted.
+        """
+        if key not in self._d and len(self._d) >= self.capacity:
+            self._evict_one()
+
+        seq = self._seq
+        self._seq += 1
+        self._d[key] = (value, seq)
+        if deadline is not Time.SENTINEL:
+            heapq.heappush(self._heap, (deadline, seq, key))
+
+        if len(self._heap) > 2 * len(self._d) + 64:
+            self._compact()
+
+    def get(self, key: K) -> V | None:
+        """
+        Retrieve an entry.
+
+        Returns:
+            The entry value, or None if it does not exist.
+        """
+        entry = self._d.get(key)
+        return None if entry is None else entry[0]
+
+    def pop(self, key: K) -> V | None:
+        """
+        Remove and return an entry.
+
+        Returns:
+            The entry value, or None if it does not exist.
+        """
+        entry = self._d.pop(key, None)
+        return None if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        Counters are not affected.
+        """
+        self._d.clear()
+        self._heap.clear()
+
+    def expire(self, now: Time) -> int:
+        """
+        Remove entries whose deadlines are before the current time.
+
+        Returns:
+            Number of removed entries.
+        """
+        n = 0
+        heap = self._heap
+        while heap and heap[0][0] < now:
+            _, seq, key = heapq.heappop(heap)
+            if self._is_current(key, seq):
+                del self._d[key]
+                n += 1
+        self.n_expired += n
+        return n
+
+    def _is_current(self, key: K, seq: int) -> bool:
+        entry = self._d.get(key)
+        return entry is not None and entry[1] == seq
+
+    def _evict_one(self) -> None:
+        self.n_evicted += 1
+        heap = self._heap
+        key = next(iter(self._d))
+        while heap:
+            _, seq, k = heapq.heappop(heap)
+            if self._is_current(k, seq):
+                key = k
+                break
+        value, _ = self._d.pop(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _compact(self) -> None:
+        self._heap = [item for item in self._heap if self._is_current(item[2], item[1])]
+        heapq.heapify(self._heap)
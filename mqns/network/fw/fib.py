@@ -16,13 +16,30 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from collections.abc import Callable, Iterator, Set
-from dataclasses import dataclass
-from typing import final
+from dataclasses import dataclass, field
+from typing import NamedTuple, final
 
+from mqns.entity.node import QNode
+from mqns.entity.qchannel import QuantumChannel
 from mqns.network.fw.message import SwapSequence
 from mqns.simulator import Time
 
 
+class FibRouteNode(NamedTuple):
+    """Precomputed information about a node in the route of a FIB entry."""
+
+    idx: int
+    """Node index in the route."""
+    swap_rank: int
+    """Swapping rank of the node, explained in ``PathInstructions``."""
+    node: QNode
+    """Node object."""
+    left: tuple[QNode, QuantumChannel] | None
+    """Left neighbor and qchannel toward it, None if the node is the left end node."""
+    right: tuple[QNode, QuantumChannel] | None
+    """Right neighbor and qchannel toward it, None if the node is the right end node."""
+
+
 @final
 @dataclass(frozen=True)
 class FibEntry:
@@ -40,11 +57,46 @@ class FibEntry:
     """Swap cutoff times."""
     purif: dict[str, int]
     """Purification scheme."""
+    nodes: list[QNode] = field(repr=False, compare=False)
+    """Node objects traversed by the path, same order as ``route``."""
+    qchannels: list[QuantumChannel] = field(repr=False, compare=False)
+    """Quantum channels between adjacent nodes in ``route``."""
+    route_nodes: dict[str, FibRouteNode] = field(init=False, repr=False, compare=False)
+    """Precomputed information of each node in ``route``, keyed by node name."""
+    purif_segments: dict[tuple[int, int], int] = field(init=False, repr=False, compare=False)
+    """
+    Precomputed purification scheme.
+    Key is (left node index, right node index) of a segment.
+    Value is the number of required purification rounds, segments requiring zero rounds are omitted.
+    """
+
+    def __post_init__(self):
+        assert len(self.nodes) == len(self.route) == len(self.qchannels) + 1
+        route_nodes: dict[str, FibRouteNode] = {}
+        for i, (name, node) in enumerate(zip(self.route, self.nodes)):
+            left = None if i == 0 else (self.nodes[i - 1], self.qchannels[i - 1])
+            right = None if i == len(self.qchannels) else (self.nodes[i + 1], self.qchannels[i])
+            route_nodes[name] = FibRouteNode(i, self.swap[i], node, left, right)
+        object.__setattr__(self, "route_nodes", route_nodes)
+
+        purif_segments: dict[tuple[int, int], int] = {}
+        for segment_name, rounds in self.purif.items():
+            name0, name1 = segment_name.split("-")
+            idx0, idx1 = route_nodes[name0].idx, route_nodes[name1].idx
+            assert idx0 < idx1
+            if rounds > 0:
+                purif_segments[(idx0, idx1)] = rounds
+        object.__setattr__(self, "purif_segments", purif_segments)
 
     @property
     def own_swap_rank(self) -> int:
         return self.swap[self.own_idx]
 
+    @property
+    def own(self) -> FibRouteNode:
+        """Precomputed information of own node."""
+        return self.route_nodes[self.route[self.own_idx]]
+
     @property
     def is_swap_disabled(self) -> bool:
         """
@@ -71,8 +123,47 @@ class FibEntry:
         Raises:
             IndexError: node does not exist in route.
         """
-        idx = self.route.index(node_name)
-        return idx, self.swap[idx]
+        rn = self.find_route_node(node_name)
+        return rn.idx, rn.swap_rank
+
+    def find_route_node(self, node_name: str) -> FibRouteNode:
+        """
+        Retrieve precomputed information of a node in the route.
+
+        Args:
+            node_name: a node name that exists in route.
+
+        Raises:
+            IndexError: node does not exist in route.
+        """
+        try:
+            return self.route_nodes[node_name]
+        except KeyError:
+            raise IndexError(f"node {node_name} does not exist in route of path_id={self.path_id}")
+
+    def want_purif_rounds(self, idx0: int, idx1: int) -> int:
+        """
+        Determine the required purification rounds of a segment.
+
+        Args:
+            idx0: Node index of one end of the segment.
+            idx1: Node index of the other end of the segment.
+        """
+        return self.purif_segments.get((idx0, idx1) if idx0 < idx1 else (idx1, idx0), 0)
+
+    def next_hop_toward(self, node_name: str) -> QNode:
+        """
+        Determine the adjacent node of own node, in the direction toward a node in the route.
+
+        Args:
+            node_name: a node name that exists in route, other than own node.
+
+        Raises:
+            IndexError: node does not exist in route.
+        """
+        idx = self.find_route_node(node_name).idx
+        assert idx != self.own_idx
+        return self.nodes[self.own_idx + 1] if idx > self.own_idx else self.nodes[self.own_idx - 1]
 
 
 class FibRequestGroup:
@@ -118,6 +209,12 @@ class Fib:
         Key is req_id.
         Value contains aggregated information.
         """
+        self.by_ends: dict[tuple[str, str], dict[int, FibRequestGroup]] = {}
+        """
+        Lookup table indexed by request end nodes.
+        Key is (src, dst) node names.
+        Value is a subset of ``by_req_id``, in the same order.
+        """
 
     def get(self, path_id: int) -> FibEntry:
         """
@@ -144,6 +241,7 @@ class Fib:
         else:
             rg = FibRequestGroup(entry)
             self.by_req_id[rg.req_id] = rg
+            self.by_ends.setdefault((rg.src, rg.dst), {})[rg.req_id] = rg
 
     def erase(self, path_id: int):
         """
@@ -159,6 +257,10 @@ class Fib:
         rg = self.by_req_id[entry.req_id]
         if rg.remove(entry):
             del self.by_req_id[entry.req_id]
+            ends = self.by_ends[(rg.src, rg.dst)]
+            del ends[rg.req_id]
+            if not ends:
+                del self.by_ends[(rg.src, rg.dst)]
 
     def list_path_ids_by_request_id(self, request_id: int) -> Set[int]:
         rg = self.by_req_id.get(request_id)
@@ -171,6 +273,22 @@ class Fib:
             if predicate(rg):
                 yield rg
 
+    def find_request_by_ends(self, src: str, dst: str) -> FibRequestGroup | None:
+        """
+        Find the first request between two end nodes.
+
+        Args:
+            src: source node name.
+            dst: destination node name.
+
+        Returns:
+            Same as ``next(self.find_request(lambda g: g.src == src and g.dst == dst), None)``, in constant time.
+        """
+        ends = self.by_ends.get((src, dst))
+        if ends is None:
+            return None
+        return next(iter(ends.values()))
+
     def __repr__(self):
         """Return a string representation of the forwarding table."""
         return "\n".join(
@@ -16,6 +16,7 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import copy
+import itertools
 from abc import abstractmethod
 from typing import TypedDict, Unpack, override
 
@@ -30,7 +31,12 @@ from mqns.models.error import PerfectErrorModel
 from mqns.models.error.input import ErrorModelInputBasic, parse_error
 from mqns.network.fw.cutoff import CutoffScheme, CutoffSchemeWaitTime
 from mqns.network.fw.fib import Fib, FibEntry
-from mqns.network.fw.fw_classic import ForwarderClassicMixin, fw_control_cmd_handler, fw_signaling_cmd_handler
+from mqns.network.fw.fw_classic import (
+    ForwarderClassicMixin,
+    SignalingMode,
+    fw_control_cmd_handler,
+    fw_signaling_cmd_handler,
+)
 from mqns.network.fw.fw_purif import ForwarderPurifProc
 from mqns.network.fw.fw_swap import ForwarderSwapProc
 from mqns.network.fw.message import (
@@ -43,10 +49,13 @@ from mqns.network.fw.message import (
 )
 from mqns.network.fw.mux import MuxScheme
 from mqns.network.fw.mux_buffer_space import MuxSchemeBufferSpace
+from mqns.network.fw.qubit_index import PurifCandidateIndex, SwapCandidateIndex
 from mqns.network.fw.select import SelectPurifQubit, call_select_purif_qubit
+from mqns.network.fw.timeseries import ConsumedTimeSeries
 from mqns.network.network import TimingPhase, TimingPhaseEvent
 from mqns.network.protocol.event import QubitEntangledEvent, QubitReleasedEvent
-from mqns.utils import json_encodable, log
+from mqns.simulator import Time
+from mqns.utils import StreamingStats, json_encodable, log
 
 
 class ForwarderInitKwargs(TypedDict, total=False):
@@ -62,13 +71,23 @@ class ForwarderInitKwargs(TypedDict, total=False):
     """Path multiplexing scheme, default is buffer-space."""
     select_purif_qubit: SelectPurifQubit
     """Qubit selection among purification candidates, default is picking first candidate."""
+    signaling: SignalingMode
+    """Signaling message delivery mode, default is hop-by-hop."""
+    series_bin: float
+    """Bin width in seconds of per-request time series in ``ForwarderCounters``, default is 0.1."""
+    swap_records_capacity: int
+    """Maximum number of entries in each table of swapping records, default is 65536."""
 
 
 @json_encodable
 class ForwarderCounters:
     """Counters of ``Forwarder``."""
 
-    def __init__(self):
+    def __init__(self, *, series_bin: float = 0.1):
+        """
+        Args:
+            series_bin: Bin width in seconds of ``consumed_series``.
+        """
         self.n_entg = 0
         """How many elementary entanglements received from link layer."""
         self.n_purif: list[int] = []
@@ -87,6 +106,21 @@ class ForwarderCounters:
         """Sum of fidelity of consumed entanglement.s"""
         self.consumed_fidelity_values: list[float] | None = None
         """Fidelity values of consumed entanglements, None disables collection."""
+        self.consumed_fidelity = StreamingStats.linear(0.0, 1.0, 1000)
+        """Streaming statistics of fidelity of consumed entanglements."""
+        self.consumed_latency = StreamingStats.logarithmic(1e-6, 1e3, 901)
+        """
+        Streaming statistics of latency of consumed entanglements, in seconds.
+        Latency is measured from creation of the oldest elementary entanglement until consumption.
+        """
+        self.consumed_series = ConsumedTimeSeries(series_bin)
+        """Windowed statistics of consumed entanglements, per request and path."""
+        self.n_swap_records_expired = 0
+        """How many swapping records were removed because their EPRs decohered."""
+        self.n_swap_records_evicted = 0
+        """How many swapping records were removed because a record table was full."""
+        self.n_signaling_observed = 0
+        """How many signaling messages passing through this node were observed in ``DIRECT_NOTIFY`` mode."""
         self.n_cutoff = [0, 0]
         """
         How many entanglements are discarded by CutoffScheme.
@@ -107,9 +141,12 @@ class ForwarderCounters:
             self.n_purif += [0] * (i + 1 - len(self.n_purif))
         self.n_purif[i] += 1
 
-    def increment_n_consumed(self, fidelity: float) -> None:
+    def increment_n_consumed(self, fidelity: float, latency: float | None = None) -> None:
         self.n_consumed += 1
         self.consumed_sum_fidelity += fidelity
+        self.consumed_fidelity.add(fidelity)
+        if latency is not None:
+            self.consumed_latency.add(latency)
         if self.consumed_fidelity_values is not None:
             self.consumed_fidelity_values.append(fidelity)
 
@@ -119,6 +156,39 @@ class ForwarderCounters:
             self.n_cutoff += [0] * (minlen - len(self.n_cutoff))
         self.n_cutoff[2 * round + (0 if local else 1)] += 1
 
+    def merge(self, other: "ForwarderCounters") -> None:
+        """
+        Merge counters of another forwarder into this instance.
+
+        This can combine counters of different nodes, or counters returned from different simulation processes.
+        Collected values are concatenated only if both instances have enabled collection.
+        """
+        self.n_entg += other.n_entg
+        for i, n in enumerate(other.n_purif):
+            if len(self.n_purif) <= i:
+                self.n_purif.append(0)
+            self.n_purif[i] += n
+        self.n_eligible += other.n_eligible
+        self.n_swapped_s += other.n_swapped_s
+        self.n_swapped_p += other.n_swapped_p
+        self.n_swap_conflict += other.n_swap_conflict
+        self.n_consumed += other.n_consumed
+        self.consumed_sum_fidelity += other.consumed_sum_fidelity
+        if self.consumed_fidelity_values is not None and other.consumed_fidelity_values is not None:
+            self.consumed_fidelity_values += other.consumed_fidelity_values
+        else:
+            self.consumed_fidelity_values = None
+        self.consumed_fidelity.merge(other.consumed_fidelity)
+        self.consumed_latency.merge(other.consumed_latency)
+        self.consumed_series.merge(other.consumed_series)
+        self.n_swap_records_expired += other.n_swap_records_expired
+        self.n_swap_records_evicted += other.n_swap_records_evicted
+        self.n_signaling_observed += other.n_signaling_observed
+        for i, n in enumerate(other.n_cutoff):
+            if len(self.n_cutoff) <= i:
+                self.n_cutoff.append(0)
+            self.n_cutoff[i] += n
+
     @property
     def n_swapped(self) -> int:
         """How many swaps succeeded."""
@@ -157,7 +227,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         and classical communication handling.
         """
         super().__init__()
-        self._init_classic_mixin()
+        self._init_classic_mixin(kwargs.get("signaling", SignalingMode.HOP_BY_HOP))
 
         self.cutoff: CutoffScheme = copy.deepcopy(kwargs.get("cutoff")) or CutoffSchemeWaitTime()
         """EPR age cut-off scheme."""
@@ -172,6 +242,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
             ps=kwargs.get("p_swap", 1.0),
             delay=parse_delay(kwargs.get("swap_delay", 0)),
             error=parse_error(kwargs.get("swap_error"), PerfectErrorModel, -1),
+            records_capacity=kwargs.get("swap_records_capacity", 65536),
         )
 
         self.add_handler(self.handle_sync_phase, TimingPhaseEvent)
@@ -183,7 +254,16 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         These are buffered until INTERNAL phase starts.
         """
 
-        self.cnt = ForwarderCounters()
+        self.eligible = SwapCandidateIndex()
+        """
+        ELIGIBLE qubits waiting for a swap candidate.
+        """
+        self.purif_waiting = PurifCandidateIndex()
+        """
+        PURIF qubits waiting for an auxiliary qubit, at the primary node of their segments.
+        """
+
+        self.cnt = ForwarderCounters(series_bin=kwargs.get("series_bin", 0.1))
         """
         Counters.
         """
@@ -198,6 +278,9 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         self.epr_type = self.network.epr_type
         """Network-wide entanglement type."""
 
+        te = self.simulator.te
+        self.cnt.consumed_series.align(self.simulator.ts.sec, None if te is None else te.sec)
+
         self.cutoff.install(self)
         self.mux.install(self)
         self.purif.install(self)
@@ -213,7 +296,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         Upon exiting INTERNAL phase:
 
-        1. Clear ``self.swap.remote_swapped``.
+        1. Clear ``self.swap.remote_swapped``, ``self.eligible``, and ``self.purif_waiting``.
            All memory qubits are being discarded by LinkLayer, so that these have become useless.
         """
         match event.action:
@@ -224,6 +307,9 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
                 self.waiting_etg.clear()
             case TimingPhase.INTERNAL, False:
                 self.swap.remote_swapped.clear()
+                self.swap.remote_evicted.clear()
+                self.eligible.clear()
+                self.purif_waiting.clear()
 
     @fw_control_cmd_handler("INSTALL_PATH")
     def handle_install_path(self, msg: InstallPathMsg):
@@ -248,14 +334,17 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
             swap=instructions["swap"],
             swap_cutoff=[None if t < 0 else self.simulator.time(time_slot=t) for t in instructions["swap_cutoff"]],
             purif=instructions["purif"],
+            nodes=[self.network.get_node(node_name) for node_name in route],
+            qchannels=[self.network.get_qchannel(name_a, name_b) for name_a, name_b in itertools.pairwise(route)],
         )
         self.fib.insert_or_replace(fib_entry)
 
         # identify left/right neighbors
         # associate path with qchannel and allocate qubits
-        if l_neighbor := self._find_neighbor(fib_entry, -1):
+        _, _, _, l_neighbor, r_neighbor = fib_entry.own
+        if l_neighbor:
             self.mux.install_path_neighbor(instructions, fib_entry, PathDirection.L, *l_neighbor)
-        if r_neighbor := self._find_neighbor(fib_entry, +1):
+        if r_neighbor:
             self.mux.install_path_neighbor(instructions, fib_entry, PathDirection.R, *r_neighbor)
 
         # call subclass specialization
@@ -285,9 +374,10 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         # identify left/right neighbors
         # disassociate path with qchannel and deallocate qubits
-        if l_neighbor := self._find_neighbor(fib_entry, -1):
+        _, _, _, l_neighbor, r_neighbor = fib_entry.own
+        if l_neighbor:
             self.mux.uninstall_path_neighbor(fib_entry, PathDirection.L, *l_neighbor)
-        if r_neighbor := self._find_neighbor(fib_entry, +1):
+        if r_neighbor:
             self.mux.uninstall_path_neighbor(fib_entry, PathDirection.R, *r_neighbor)
 
         # call subclass specialization
@@ -299,13 +389,6 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
             r_neighbor=r_neighbor,
         )
 
-    def _find_neighbor(self, fib_entry: FibEntry, route_offset: int) -> tuple[QNode, QuantumChannel] | None:
-        neigh_idx = fib_entry.own_idx + route_offset
-        if neigh_idx in (-1, len(fib_entry.route)):  # no left/right neighbor if own node is the left/right end node
-            return None
-        neigh = self.network.get_node(fib_entry.route[neigh_idx])
-        return neigh, self.node.get_qchannel(neigh)
-
     @abstractmethod
     def handle_path_change(
         self,
@@ -354,7 +437,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         The actual processing is handled by the multiplexing scheme.
 
-        If a SwapUpdate was received before processing this event and buffered in ``self.waiting_su``,
+        If a SwapUpdate was received before processing this event and buffered in ``self.swap.waiting_su``,
         it is re-processed at this time.
 
         Args:
@@ -382,8 +465,9 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         1. Determines the segment in which the qubit is entangled and number of required purification rounds.
         2. If the required rounds are completed, the qubit becomes eligible.
         3. Otherwise, check if own node is primary for the purification protocol.
-           If so, search for an auxiliary qubit to use, release the auxiliary qubit,
+           If so, search ``self.purif_waiting`` for an auxiliary qubit to use, release the auxiliary qubit,
            and send PURIF_SOLICIT to the partner node.
+           If no auxiliary qubit is available, the qubit is stored in ``self.purif_waiting``.
 
         Args:
             qubit: The memory qubit at PURIF state.
@@ -393,16 +477,17 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         assert qubit.state is QubitState.PURIF, f"unexpected state {qubit.state}"
         assert qubit.qchannel is not None
 
+        self.purif_waiting.discard(qubit)
+
         own_idx, own_rank = fib_entry.own_idx, fib_entry.own_swap_rank
         partner_idx, partner_rank = fib_entry.find_index_and_swap_rank(partner.name)
         if own_rank > partner_rank:
             # swapping order disallows initiating purif / swap / consumption
             return
 
-        segment_name = f"{self.node.name}-{partner.name}" if own_idx < partner_idx else f"{partner.name}-{self.node.name}"
-        want_rounds = fib_entry.purif.get(segment_name, 0)
+        want_rounds = fib_entry.want_purif_rounds(own_idx, partner_idx)
         log.debug(
-            f"{self.node}: segment {segment_name} (qubit {qubit.addr}) has "
+            f"{self.node}: segment with {partner.name} (qubit {qubit.addr}) has "
             + f"{qubit.purif_rounds} and needs {want_rounds} purif rounds"
         )
 
@@ -416,24 +501,19 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         is_primary = (own_rank, own_idx) < (partner_rank, partner_idx)
         if not is_primary:
-            log.debug(f"{self.node}: is not primary node for segment {segment_name} purif")
+            log.debug(f"{self.node}: is not primary node for segment with {partner.name} purif")
             return
 
-        candidates = self.memory.find(
-            lambda q, v: (
-                q.addr != qubit.addr  # not the same qubit
-                and q.state is QubitState.PURIF  # in PURIF state
-                and q.purif_rounds == qubit.purif_rounds  # with same number of purif rounds
-                and partner in (v.src, v.dst)  # with the same partner
-                and q.path_id == fib_entry.path_id  # on the same path_id
-            ),
-            has=self.epr_type,
-        )
+        # look for qubits with the same partner, on the same path_id, with same number of purif rounds
+        key = self.purif_waiting.add(qubit, partner.id, fib_entry.path_id)
+        candidates = (self.memory.read(q.addr, has=self.epr_type) for q in self.purif_waiting.find(key) if q.addr != qubit.addr)
         found = call_select_purif_qubit(self._select_purif_qubit, qubit, fib_entry, partner, candidates)
         if not found:
-            log.debug(f"{self.node}: no candidate EPR for segment {segment_name} purif round {1 + qubit.purif_rounds}")
+            log.debug(f"{self.node}: no candidate EPR for segment with {partner.name} purif round {1 + qubit.purif_rounds}")
             return
 
+        self.purif_waiting.discard(qubit)
+        self.purif_waiting.discard(found[0])
         self.purif.start(qubit, found[0], fib_entry, partner)
 
     def qubit_is_eligible(self, qubit: MemoryQubit, fib_entry: FibEntry | None):
@@ -445,8 +525,10 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         Otherwise, update the EPR age cut-off scheme, and then attempt entanglement swapping:
 
         1. Look for a matching eligible qubit to perform swapping.
+           Candidates are drawn from ``self.eligible`` groups selected by the multiplexing scheme.
         2. Generate a new EPR if successful.
         3. Notify adjacent nodes with SWAP_UPDATE messages.
+        4. Otherwise, store the qubit in ``self.eligible`` for future swapping.
 
         Args:
             qubit: The qubit that became eligible.
@@ -455,46 +537,63 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         assert qubit.state is QubitState.ELIGIBLE, f"unexpected state {qubit.state}"
         if not self.node.timing.is_internal():
             log.debug(f"{self.node}: INT phase is over -> stop swaps")
+            self.eligible.add(qubit)
             return
 
         _, epr = self.memory.read(qubit.addr, has=self.epr_type)
         if self.can_consume(fib_entry, epr):
-            self.consume_and_release(qubit)
+            self.consume_and_release(qubit, fib_entry)
             return
 
         self.cutoff.qubit_is_eligible(qubit, fib_entry)
 
-        swap_candidates = self.memory.find(
-            lambda q, _: (
-                q.state is QubitState.ELIGIBLE  # in ELIGIBLE state
-                and q.qchannel != qubit.qchannel  # assigned to a different channel
-                and self.cutoff.filter_swap_candidate(q)
-            ),
-            has=self.epr_type,
+        swap_candidates = (
+            self.memory.read(q.addr, has=self.epr_type)
+            for q in self.eligible.find(*self.mux.swap_candidate_keys(qubit, epr, fib_entry))
+            if q.qchannel != qubit.qchannel  # assigned to a different channel
+            and self.cutoff.filter_swap_candidate(q)
         )
         swap_candidate_tuple = self.mux.find_swap_candidate(qubit, epr, fib_entry, swap_candidates)
         mq1: MemoryQubit | None = None
         if swap_candidate_tuple:
             mq1, fib_entry = swap_candidate_tuple
+            self.eligible.discard(mq1)
             self.swap.start(qubit, mq1, fib_entry)
+        else:
+            self.eligible.add(qubit)
         self.cutoff.before_swap(qubit, mq1, fib_entry)
 
     def can_consume(self, fib_entry: FibEntry | None, epr: Entanglement) -> bool:
         if fib_entry is None:
             assert epr.src is not None
             assert epr.dst is not None
-            src, dst = epr.src.name, epr.dst.name
-            return next(self.fib.find_request(lambda g: g.src == src and g.dst == dst), None) is not None
+            return self.fib.find_request_by_ends(epr.src.name, epr.dst.name) is not None
 
         return fib_entry.is_swap_disabled or fib_entry.own_idx in (0, len(fib_entry.route) - 1)
 
-    def consume_and_release(self, qubit: MemoryQubit):
+    def consume_and_release(self, qubit: MemoryQubit, fib_entry: FibEntry | None = None):
         """
         Consume an entangled qubit.
+
+        Args:
+            qubit: The qubit to consume.
+            fib_entry: FIB entry (not available with MuxSchemeStatistical).
         """
         _, qm = self.memory.read(qubit.addr, has=self.epr_type, set_fidelity=True, remove=True)
         log.debug(f"{self.node}: consume EPR: {qm}")
-        self.cnt.increment_n_consumed(qm.fidelity)
+        now = self.simulator.tc
+        latency = None if qm.creation_time is Time.SENTINEL else (now - qm.creation_time).sec
+        self.cnt.increment_n_consumed(qm.fidelity, latency)
+
+        if fib_entry is not None:
+            series_key = (fib_entry.req_id, fib_entry.path_id)
+        else:
+            assert qm.src is not None
+            assert qm.dst is not None
+            rg = self.fib.find_request_by_ends(qm.src.name, qm.dst.name)
+            series_key = None if rg is None else (rg.req_id, None)
+        if series_key is not None:
+            self.cnt.consumed_series.add(series_key, now.sec, qm.fidelity, latency)
 
         self.release_qubit(qubit)
 
@@ -1,6 +1,7 @@
 import functools
 from collections.abc import Callable, Mapping
-from typing import Any, cast
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Any, cast
 
 from mqns.entity.cchannel import ClassicCommandDispatcherMixin, ClassicPacket, RecvClassicPacket, classic_cmd_handler
 from mqns.entity.node import Application, Node, QNode
@@ -8,6 +9,37 @@ from mqns.network.fw.fib import Fib, FibEntry
 from mqns.network.network import QuantumNetwork
 from mqns.utils import log
 
+if TYPE_CHECKING:
+    from mqns.network.fw.forwarder import ForwarderCounters
+
+
+class SignalingMode(Enum):
+    HOP_BY_HOP = auto()
+    """
+    Signaling messages are transmitted hop by hop along the path.
+    Each intermediate node receives the packet, looks up the FIB entry, and forwards it.
+    """
+    DIRECT = auto()
+    """
+    Signaling messages are delivered directly to the destination.
+    The delivery time is the sum of classic channel delays along the path, and the packet is lost
+    if any classic channel along the path drops it.
+    Intermediate nodes do not receive the packet.
+    Bandwidth limits of the classic channels are not considered.
+    """
+    DIRECT_NOTIFY = auto()
+    """
+    Same as ``DIRECT``, but each intermediate node also receives a ``SignalingObservationPacket``
+    at the time the packet would have passed through that node.
+    The intermediate node passes it to ``observe_signaling()`` instead of forwarding it.
+    """
+
+
+class SignalingObservationPacket(ClassicPacket):
+    """
+    Copy of a directly delivered signaling message, given to an intermediate node for observation only.
+    """
+
 
 def fw_control_cmd_handler(cmd: str):
     """
@@ -46,7 +78,10 @@ def fw_signaling_cmd_handler(cmd: str):
                 return True
 
             if pkt.dest != self.node:
-                self.send_msg(pkt.dest, msg, fib_entry, forward=True)
+                if isinstance(pkt, SignalingObservationPacket):
+                    self.observe_signaling(msg, fib_entry)
+                else:
+                    self.send_msg(pkt.dest, msg, fib_entry, forward=True)
                 return True
 
             log.debug(f"{self.node}: received signaling message from {pkt.src} | {msg}")
@@ -69,12 +104,15 @@ class ForwarderClassicMixin(ClassicCommandDispatcherMixin):
     node: QNode
     network: QuantumNetwork
     fib: Fib
+    cnt: "ForwarderCounters"
 
-    def _init_classic_mixin(self) -> None:
+    def _init_classic_mixin(self, signaling: SignalingMode) -> None:
         """
         Initializer, must be called from ``Forwarder.__init__()``.
         """
         cast(Application, self).add_handler(self.handle_classic_command, RecvClassicPacket)
+        self.signaling = signaling
+        """Signaling message delivery mode."""
 
     def send_ctrl(self, msg: Mapping):
         ctrl = self.network.get_controller()
@@ -85,12 +123,55 @@ class ForwarderClassicMixin(ClassicCommandDispatcherMixin):
         """
         Send/forward a signaling message along the path specified in FIB entry.
         """
-        dest_idx = fib_entry.route.index(dest.name)
-        nh = fib_entry.route[fib_entry.own_idx + 1] if dest_idx > fib_entry.own_idx else fib_entry.route[fib_entry.own_idx - 1]
-        next_hop = self.network.get_node(nh)
+        if self.signaling is not SignalingMode.HOP_BY_HOP:
+            self._send_msg_direct(dest, msg, fib_entry)
+            return
+
+        next_hop = fib_entry.next_hop_toward(dest.name)
 
         log.debug(
             f"{self.node}: {'forwarding' if forward else 'sending'} signaling message to {dest.name} via {next_hop.name}"
             f" | {msg}"
         )
         self.node.send_cpacket(next_hop, ClassicPacket(msg, src=self.node, dest=dest))
+
+    def observe_signaling(self, msg: dict, fib_entry: FibEntry) -> None:
+        """
+        Observe a signaling message passing through this intermediate node in ``DIRECT_NOTIFY`` mode.
+
+        The default implementation only counts the observation.
+        Subclass may override to react to messages of other nodes.
+        """
+        _ = fib_entry
+        self.cnt.n_signaling_observed += 1
+        log.debug(f"{self.node}: observed signaling message | {msg}")
+
+    def _send_msg_direct(self, dest: Node, msg: Mapping, fib_entry: FibEntry):
+        simulator = self.node.simulator
+        notify = self.signaling is SignalingMode.DIRECT_NOTIFY
+        own_idx = fib_entry.own_idx
+        dest_idx = fib_entry.find_route_node(dest.name).idx
+        step = 1 if dest_idx > own_idx else -1
+
+        events: list[RecvClassicPacket] = []
+        t = simulator.tc
+        node: Node = self.node
+        for idx in range(own_idx + step, dest_idx + step, step):
+            next_hop = fib_entry.nodes[idx]
+            cchannel = node.get_cchannel(next_hop)
+            if cchannel.decide_random_drop(f"signaling message {msg}"):
+                log.debug(f"{self.node}: signaling message to {dest.name} dropped on {cchannel} | {msg}")
+                break
+
+            t = t + cchannel.delay.calculate()
+            if idx == dest_idx:
+                pkt = ClassicPacket(msg, src=self.node, dest=dest)
+                events.append(RecvClassicPacket(t=t, cchannel=cchannel, packet=pkt, dest=dest))
+            elif notify:
+                pkt = SignalingObservationPacket(msg, src=self.node, dest=dest)
+                events.append(RecvClassicPacket(t=t, cchannel=cchannel, packet=pkt, dest=next_hop))
+            node = next_hop
+
+        log.debug(f"{self.node}: sending signaling message directly to {dest.name} | {msg}")
+        for event in events:
+            simulator.add_event(event)
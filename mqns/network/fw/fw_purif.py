@@ -61,8 +61,8 @@ class ForwarderPurifProc:
             "path_id": fib_entry.path_id,
             "purif_node": self.node.name,
             "partner": partner.name,
-            "epr": epr0.name,
-            "measure_epr": epr1.name,
+            "epr": epr0.id,
+            "measure_epr": epr1.id,
             "round": mq0.purif_rounds,
         }
         self.fw.send_msg(partner, msg, fib_entry)
@@ -87,8 +87,10 @@ class ForwarderPurifProc:
         """
         # mq0 is the "kept" memory whose fidelity would be increased if purification succeeds
         # mq1 is the "measured" memory that is consumed during purification
-        mq0, epr0 = self.memory.read(msg["epr"], has=self.epr_type, set_fidelity=True)
-        mq1, epr1 = self.memory.read(msg["measure_epr"], has=self.epr_type, set_fidelity=True, remove=True)
+        mq0, epr0 = self.memory.read(self.memory.locate(msg["epr"], must=True), has=self.epr_type, set_fidelity=True)
+        mq1, epr1 = self.memory.read(
+            self.memory.locate(msg["measure_epr"], must=True), has=self.epr_type, set_fidelity=True, remove=True
+        )
         # TODO: handle the exception case when an EPR is decohered and not found in memory
 
         for mq in (mq0, mq1):
@@ -96,7 +98,7 @@ class ForwarderPurifProc:
             assert mq.purif_rounds == msg["round"]
 
         assert msg["partner"] == self.node.name
-        primary = self.network.get_node(msg["purif_node"])
+        primary = fib_entry.find_route_node(msg["purif_node"]).node
         log.debug(
             f"{self.node}: perform purif qubit {mq0.addr} (F={epr0.fidelity}) and "
             + f"{mq1.addr} (F={epr1.fidelity}) for round {1 + mq0.purif_rounds} with primary {primary.name}"
@@ -149,7 +151,7 @@ class ForwarderPurifProc:
             fib_entry: FIB entry associated with path_id in the message.
 
         """
-        qubit, epr = self.memory.read(msg["epr"], has=self.epr_type)
+        qubit, epr = self.memory.read(self.memory.locate(msg["epr"], must=True), has=self.epr_type)
         # TODO: handle the exception case when an EPR is decohered and not found in memory
 
         result = msg["result"]
@@ -167,4 +169,4 @@ class ForwarderPurifProc:
         self.fw.cnt.increment_n_purif(qubit.purif_rounds)
         qubit.purif_rounds += 1
         qubit.state = QubitState.PURIF
-        self.fw.qubit_is_purif(qubit, fib_entry, self.network.get_node(msg["partner"]))
+        self.fw.qubit_is_purif(qubit, fib_entry, fib_entry.find_route_node(msg["partner"]).node)
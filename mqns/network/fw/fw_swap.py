@@ -6,6 +6,7 @@ from mqns.entity.node import QNode
 from mqns.models.delay import DelayModel
 from mqns.models.epr import Entanglement
 from mqns.models.error import ErrorModel
+from mqns.network.fw.expiring_dict import ExpiringDict
 from mqns.network.fw.fib import FibEntry
 from mqns.network.fw.message import SwapUpdateMsg
 from mqns.network.fw.mux import MuxScheme
@@ -46,7 +47,15 @@ class ForwarderSwapProc:
     memory: QuantumMemory
     mux: MuxScheme
 
-    def __init__(self, *, ps: float, delay: DelayModel, error: ErrorModel):
+    def __init__(self, *, ps: float, delay: DelayModel, error: ErrorModel, records_capacity=65536):
+        """
+        Args:
+            ps: Probability of successful entanglement swapping.
+            delay: Swapping delay model.
+            error: Swapping error model.
+            records_capacity: Maximum number of entries in each of
+                              ``waiting_su``, ``parallel_swappings``, and ``remote_swapped``.
+        """
         self.ps = ps
         """Probability of successful entanglement swapping."""
         assert 0.0 <= self.ps <= 1.0
@@ -55,24 +64,31 @@ class ForwarderSwapProc:
         self.error = error
         """Swapping error model."""
 
-        self.waiting_su: dict[int, tuple[SwapUpdateMsg, FibEntry]] = {}
+        self.waiting_su = ExpiringDict[int, tuple[SwapUpdateMsg, FibEntry]](records_capacity, on_evict=self._on_evict)
         """
         SwapUpdates received prior to QubitEntangledEvent.
 
         * Key: MemoryQubit addr.
         * Value: SwapUpdateMsg and FibEntry.
+
+        Each entry expires when the EPR stored in the qubit decoheres.
         """
 
-        self.parallel_swappings: dict[str, tuple[Entanglement, Entanglement, Entanglement]] = {}
+        self.parallel_swappings = ExpiringDict[int, tuple[Entanglement, Entanglement, Entanglement]](
+            records_capacity, on_evict=self._on_evict
+        )
         """
         Records for potential parallel swappings.
         See ``_su_parallel`` method.
+
+        Each entry expires when the locally swapped EPR decoheres.
         """
 
-        self.remote_swapped: dict[str, Entanglement] = {}
+        self.remote_swapped = ExpiringDict[int, Entanglement](records_capacity, on_evict=self._on_evict_remote_swapped)
         """
         EPRs that have been swapped remotely but the SwapUpdateMsg have not arrived.
-        Each key is an EPR name; each value is the EPR.
+        Each key is an EPR identifier; each value is the EPR.
+        Each entry expires when the EPR decoheres.
 
         When a remote forwarder performs a swapping in which this node is either src or dst of the new EPR,
         it deposits the swapped EPR here and transmits the corresponding SwapUpdateMsg.
@@ -81,6 +97,14 @@ class ForwarderSwapProc:
         XXX Current approach assumes cchannels do not have packet loss.
         """
 
+        self.remote_evicted = ExpiringDict[int, None](records_capacity)
+        """
+        Identifiers of EPRs evicted from ``remote_swapped`` due to capacity limit.
+        Each entry expires when the EPR decoheres.
+
+        This distinguishes an evicted EPR from a decohered EPR when its SwapUpdateMsg arrives.
+        """
+
     def install(self, fw: "Forwarder"):
         self.fw = fw
         self.simulator = fw.simulator
@@ -90,8 +114,26 @@ class ForwarderSwapProc:
         self.memory = fw.memory
         self.mux = fw.mux
 
+    def expire_records(self) -> None:
+        """
+        Remove swapping records whose EPRs have decohered.
+        """
+        now = self.simulator.tc
+        n = self.waiting_su.expire(now) + self.parallel_swappings.expire(now) + self.remote_swapped.expire(now)
+        self.remote_evicted.expire(now)
+        self.fw.cnt.n_swap_records_expired += n
+
+    def _on_evict(self, key: int, value: object) -> None:
+        _ = value
+        self.fw.cnt.n_swap_records_evicted += 1
+        log.debug(f"{self.node}: swapping record {key:x} evicted due to records capacity")
+
+    def _on_evict_remote_swapped(self, key: int, value: Entanglement) -> None:
+        self._on_evict(key, value)
+        self.remote_evicted.set(key, None, value.decohere_time)
+
     def _deposit_remote_swapped(self, target: QNode, epr: Entanglement):
-        target.get_app(type(self.fw)).swap.remote_swapped[epr.name] = epr
+        target.get_app(type(self.fw)).swap.remote_swapped.set(epr.id, epr, epr.decohere_time)
 
     def _send_su(self, target: SwapArm, opposite_name: str, fib_entry: FibEntry, new_epr: Entanglement | None):
         su_msg: SwapUpdateMsg = {
@@ -99,8 +141,8 @@ class ForwarderSwapProc:
             "path_id": fib_entry.path_id,
             "swapping_node": self.node.name,
             "partner": opposite_name,
-            "epr": target.epr.name,
-            "new_epr": new_epr and new_epr.name,
+            "epr": target.epr.id,
+            "new_epr": None if new_epr is None else new_epr.id,
         }
         self.fw.send_msg(target.partner, su_msg, fib_entry)
 
@@ -141,6 +183,8 @@ class ForwarderSwapProc:
         return SwapArm(partner, index, rank, qubit, epr)
 
     def finish_swap(self, mq0: MemoryQubit, mq1: MemoryQubit, fib_entry: FibEntry, swap_start: Time):
+        self.expire_records()
+
         # Read both qubits and remove them from memory.
         #
         # If either qubit is no longer in SWAPPING state, it implies that a SWAP_UPDATE message arrived that informs
@@ -165,9 +209,9 @@ class ForwarderSwapProc:
         prev, next = (arm0, arm1) if arm0.index < arm1.index else (arm1, arm0)
 
         # Save ch_index metadata field onto elementary EPR.
-        if not prev.epr.orig_eprs:
+        if prev.epr.parents is None:
             prev.epr.ch_index = fib_entry.own_idx - 1
-        if not next.epr.orig_eprs:
+        if next.epr.parents is None:
             next.epr.ch_index = fib_entry.own_idx
 
         # Attempt the swap.
@@ -192,7 +236,7 @@ class ForwarderSwapProc:
         if local_success:
             # Keep records to support potential parallel swapping.
             if fib_entry.own_swap_rank == target.rank:
-                self.parallel_swappings[target.epr.name] = (target.epr, opposite.epr, new_epr)
+                self.parallel_swappings.set(target.epr.id, (target.epr, opposite.epr, new_epr), new_epr.decohere_time)
 
             # Deposit swapped EPR at the partner.
             self._deposit_remote_swapped(target.partner, new_epr)
@@ -201,7 +245,7 @@ class ForwarderSwapProc:
         self._send_su(target, opposite.partner.name, fib_entry, new_epr if local_success else None)
 
     def pop_waiting_su(self, qubit: MemoryQubit):
-        su_args = self.waiting_su.pop(qubit.addr, None)
+        su_args = self.waiting_su.pop(qubit.addr)
         if (
             qubit.state is not QubitState.RELEASE  # qubit was released due to uninstalled path
             and su_args
@@ -229,29 +273,38 @@ class ForwarderSwapProc:
             log.debug(f"{self.node}: INT phase is over -> stop swaps")
             return
 
+        self.expire_records()
+
         _, sender_rank = fib_entry.find_index_and_swap_rank(msg["swapping_node"])
         if fib_entry.own_swap_rank < sender_rank:
             log.debug(f"### {self.node}: VERIFY -> rcvd SU from higher-rank node")
             return
 
-        new_epr_name = msg["new_epr"]
-        new_epr = None if new_epr_name is None else self.remote_swapped.pop(new_epr_name)
-
-        epr_name = msg["epr"]
-        qubit_pair = self.memory.read(epr_name)
-        if qubit_pair is not None:
-            qubit, _ = qubit_pair
+        new_epr_id = msg["new_epr"]
+        new_epr = None if new_epr_id is None else self.remote_swapped.pop(new_epr_id)
+        if new_epr_id is not None and new_epr is None:
+            if new_epr_id in self.remote_evicted:
+                self.remote_evicted.pop(new_epr_id)
+                log.debug(f"{self.node}: NEW EPR {new_epr_id:x} was evicted from swapping records due to capacity")
+            else:
+                log.debug(f"{self.node}: NEW EPR {new_epr_id:x} expired during SU transmissions")
+
+        epr_id = msg["epr"]
+        addr = self.memory.locate(epr_id)
+        if addr is not None:
+            qubit, epr = self.memory.read(addr, must=True)
             if qubit.state is QubitState.ENTANGLED0:
+                assert isinstance(epr, Entanglement)
                 if new_epr is not None:
-                    self.remote_swapped[cast(str, new_epr_name)] = new_epr
-                self.waiting_su[qubit.addr] = (msg, fib_entry)
+                    self.remote_swapped.set(new_epr.id, new_epr, new_epr.decohere_time)
+                self.waiting_su.set(qubit.addr, (msg, fib_entry), epr.decohere_time)
                 return
-            self.parallel_swappings.pop(epr_name, None)
+            self.parallel_swappings.pop(epr_id)
             self._su_sequential(msg, fib_entry, qubit, new_epr, maybe_purif=(fib_entry.own_swap_rank > sender_rank))
-        elif fib_entry.own_swap_rank == sender_rank and epr_name in self.parallel_swappings:
+        elif fib_entry.own_swap_rank == sender_rank and epr_id in self.parallel_swappings:
             self._su_parallel(msg, fib_entry, new_epr)
         else:
-            log.debug(f"### {self.node}: EPR {epr_name} decohered during SU transmissions")
+            log.debug(f"### {self.node}: EPR {epr_id:x} decohered during SU transmissions")
 
     def _su_sequential(
         self,
@@ -287,14 +340,16 @@ class ForwarderSwapProc:
             # it is our turn to purify the qubit and progress toward swapping.
             qubit.purif_rounds = 0
             qubit.state = QubitState.PURIF
-            partner = self.network.get_node(msg["partner"])
+            partner = fib_entry.find_route_node(msg["partner"]).node
             self.fw.qubit_is_purif(qubit, fib_entry, partner)
 
     def _su_parallel(self, msg: SwapUpdateMsg, fib_entry: FibEntry, new_epr: Entanglement | None):
         """
         Process SWAP_UPDATE message during parallel swapping.
         """
-        shared_epr, other_epr, my_new_epr = self.parallel_swappings.pop(msg["epr"])
+        record = self.parallel_swappings.pop(msg["epr"])
+        assert record is not None
+        shared_epr, other_epr, my_new_epr = record
         _ = shared_epr
 
         # safety in statistical mux to avoid conflictual swappings on different paths
@@ -329,7 +384,7 @@ class ForwarderSwapProc:
                 "path_id": msg["path_id"],
                 "swapping_node": msg["swapping_node"],
                 "partner": msg["partner"],
-                "epr": my_new_epr.name,
+                "epr": my_new_epr.id,
                 "new_epr": None,
             }
             self.fw.send_msg(destination, su_msg, fib_entry)
@@ -363,12 +418,12 @@ class ForwarderSwapProc:
             "path_id": msg["path_id"],
             "swapping_node": msg["swapping_node"],
             "partner": partner.name,
-            "epr": my_new_epr.name,
-            "new_epr": None if merged_epr is None else merged_epr.name,
+            "epr": my_new_epr.id,
+            "new_epr": None if merged_epr is None else merged_epr.id,
         }
         self.fw.send_msg(destination, su_msg, fib_entry)
 
         # Update records to support potential parallel swapping with "partner".
         _, p_rank = fib_entry.find_index_and_swap_rank(partner.name)
         if fib_entry.own_swap_rank == p_rank and merged_epr is not None:
-            self.parallel_swappings[new_epr.name] = (new_epr, other_epr, merged_epr)
+            self.parallel_swappings.set(new_epr.id, (new_epr, other_epr, merged_epr), merged_epr.decohere_time)
@@ -123,7 +123,7 @@ class UninstallPathMsg(TypedDict):
 class CutoffDiscardMsg(TypedDict):
     cmd: Literal["CUTOFF_DISCARD"]
     path_id: int
-    epr: str
+    epr: int
     round: int
 
 
@@ -131,8 +131,8 @@ class PurifMsgBase(TypedDict):
     path_id: int
     purif_node: str
     partner: str
-    epr: str
-    measure_epr: str
+    epr: int
+    measure_epr: int
     round: int
 
 
@@ -150,5 +150,5 @@ class SwapUpdateMsg(TypedDict):
     path_id: int
     swapping_node: str
     partner: str
-    epr: str
-    new_epr: str | None  # None means swapping failed
+    epr: int
+    new_epr: int | None  # None means swapping failed
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from mqns.entity.memory import MemoryQubit, PathDirection, QuantumMemory
@@ -7,6 +8,7 @@ from mqns.entity.qchannel import QuantumChannel
 from mqns.models.epr import Entanglement
 from mqns.network.fw.fib import Fib, FibEntry
 from mqns.network.fw.message import PathInstructions
+from mqns.network.fw.qubit_index import SwapCandidateKey
 from mqns.network.fw.select import MemoryEprIterator
 
 if TYPE_CHECKING:
@@ -90,6 +92,22 @@ class MuxScheme(ABC):
         This can only be invoked in ASYNC timing mode or INTERNAL phase.
         """
 
+    @abstractmethod
+    def swap_candidate_keys(
+        self, qubit: MemoryQubit, epr: Entanglement, fib_entry: FibEntry | None
+    ) -> Iterable[SwapCandidateKey]:
+        """
+        Determine which groups in ``fw.eligible`` may contain qubits to swap with an ELIGIBLE qubit.
+
+        Args:
+            qubit: A qubit in ELIGIBLE state.
+            epr: The EPR associated with this qubit. This is not an end-to-end entanglement.
+            fib_entry: FIB entry passed to ``fw.qubit_is_eligible()``.
+
+        Returns:
+            Group keys, in the order they should be searched.
+        """
+
     @abstractmethod
     def find_swap_candidate(
         self,
@@ -102,7 +120,8 @@ class MuxScheme(ABC):
         Find another qubit to swap with an ELIGIBLE qubit.
 
         Args:
-            input: Candidates iterator. They are in ELIGIBLE state and assigned to a different channel.
+            input: Candidates iterator. They are in ELIGIBLE state and belong to groups in ``swap_candidate_keys()``.
+                   They are ordered by ascending memory address.
             qubit: A qubit in ELIGIBLE state.
             epr: The EPR associated with this qubit. This is not an end-to-end entanglement.
             fib_entry: FIB entry passed to ``fw.qubit_is_eligible()``.
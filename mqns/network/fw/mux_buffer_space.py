@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, override
 
 from mqns.entity.memory import MemoryQubit, PathDirection, QubitState
@@ -9,6 +9,7 @@ from mqns.models.epr import Entanglement
 from mqns.network.fw.fib import FibEntry
 from mqns.network.fw.message import PathInstructions, validate_path_instructions
 from mqns.network.fw.mux import MuxScheme
+from mqns.network.fw.qubit_index import SwapCandidateKey
 from mqns.network.fw.select import MemoryEprIterator, MemoryEprTuple
 from mqns.utils import log, rng
 
@@ -21,6 +22,10 @@ class MuxSchemeFibBase(MuxScheme):
 
     SelectSwapQubit_random: SelectSwapQubit = lambda _fw, _mt, _fe, candidates: candidates[rng.choice(len(candidates))]
 
+    SelectSwapQubit_highest_fidelity: SelectSwapQubit = lambda _fw, _mt, _fe, candidates: max(
+        candidates, key=lambda mt: mt[1].fidelity
+    )
+
     def __init__(self, name: str, select_swap_qubit: SelectSwapQubit | None):
         super().__init__(name)
         self._select_swap_qubit = select_swap_qubit
@@ -132,17 +137,28 @@ class MuxSchemeBufferSpace(MuxSchemeFibBase):
         qubit.state = QubitState.PURIF
         self.fw.qubit_is_purif(qubit, fib_entry, neighbor)
 
+    @override
+    def swap_candidate_keys(
+        self, qubit: MemoryQubit, epr: Entanglement, fib_entry: FibEntry | None
+    ) -> Iterable[SwapCandidateKey]:
+        _ = epr
+        assert qubit.path_id is not None
+        assert fib_entry is not None
+
+        # qubits allocated to the same path_id, in the opposite path direction
+        _, _, _, l_neighbor, r_neighbor = fib_entry.own
+        if qubit.path_direction == PathDirection.L:
+            direction, neighbor = PathDirection.R, r_neighbor
+        else:
+            direction, neighbor = PathDirection.L, l_neighbor
+        if neighbor is None:
+            return ()
+        return ((fib_entry.path_id, neighbor[1].id, direction),)
+
     @override
     def list_swap_candidates(self, mq0: MemoryQubit, fib_entry: FibEntry, input: MemoryEprIterator):
-        assert mq0.path_id is not None
-        possible_path_ids = {fib_entry.path_id}
-
-        return (
-            (q, v)
-            for (q, v) in input
-            if q.path_id in possible_path_ids  # allocated to the same path_id or another path_id under the same request_id
-            and q.path_direction != mq0.path_direction  # in the opposite path direction
-        )
+        _ = mq0, fib_entry
+        return input  # swap_candidate_keys already selects the same path_id in the opposite path direction
 
     @override
     def swapping_succeeded(self, prev_epr: Entanglement, next_epr: Entanglement, new_epr: Entanglement) -> None:
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import override
 
 import numpy as np
@@ -9,6 +9,7 @@ from mqns.models.epr import Entanglement
 from mqns.network.fw.fib import Fib, FibEntry
 from mqns.network.fw.mux_buffer_space import MuxSchemeFibBase
 from mqns.network.fw.mux_statistical import MuxSchemeDynamicBase, has_intersect_tmp_path_ids
+from mqns.network.fw.qubit_index import SwapCandidateKey
 from mqns.network.fw.select import MemoryEprIterator
 from mqns.utils import log, rng
 
@@ -97,6 +98,21 @@ class MuxSchemeDynamicEpr(MuxSchemeFibBase, MuxSchemeDynamicBase):
         qubit.state = QubitState.PURIF
         self.fw.qubit_is_purif(qubit, fib_entry, neighbor)
 
+    @override
+    def swap_candidate_keys(
+        self, qubit: MemoryQubit, epr: Entanglement, fib_entry: FibEntry | None
+    ) -> Iterable[SwapCandidateKey]:
+        _ = epr
+        assert fib_entry is not None
+
+        # qubits assigned to the other qchannel of the selected path
+        _, _, _, l_neighbor, r_neighbor = fib_entry.own
+        return [
+            (None, neighbor[1].id, None)
+            for neighbor in (l_neighbor, r_neighbor)
+            if neighbor is not None and neighbor[1] is not qubit.qchannel
+        ]
+
     @override
     def list_swap_candidates(self, mq0: MemoryQubit, fib_entry: FibEntry, input: MemoryEprIterator):
         assert mq0.path_id is None
@@ -9,6 +9,7 @@ from mqns.models.epr import Entanglement
 from mqns.network.fw.fib import FibEntry
 from mqns.network.fw.message import PathInstructions, validate_path_instructions
 from mqns.network.fw.mux import MuxScheme
+from mqns.network.fw.qubit_index import SwapCandidateKey
 from mqns.network.fw.select import MemoryEprIterator, MemoryEprTuple
 from mqns.utils import log, rng
 
@@ -38,8 +39,8 @@ def intersect_tmp_path_ids(epr0: Entanglement, epr1: Entanglement) -> frozenset[
 class MuxSchemeDynamicBase(MuxScheme):
     def __init__(self, name: str):
         super().__init__(name)
-        self.qchannel_paths_map = defaultdict[str, list[int]](lambda: [])
-        """stores path-qchannel relationship"""
+        self.qchannel_paths_map = defaultdict[int, list[int]](lambda: [])
+        """stores path-qchannel relationship, keyed by ``QuantumChannel.id``"""
 
     @override
     def validate_path_instructions(self, instructions: PathInstructions):
@@ -58,7 +59,7 @@ class MuxSchemeDynamicBase(MuxScheme):
         _ = instructions
         _ = direction
         _ = neighbor
-        self.qchannel_paths_map[qchannel.name].append(fib_entry.path_id)
+        self.qchannel_paths_map[qchannel.id].append(fib_entry.path_id)
 
     @override
     def uninstall_path_neighbor(
@@ -70,10 +71,10 @@ class MuxSchemeDynamicBase(MuxScheme):
     ) -> None:
         _ = direction
         _ = neighbor
-        paths = self.qchannel_paths_map[qchannel.name]
+        paths = self.qchannel_paths_map[qchannel.id]
         paths.remove(fib_entry.path_id)
         if len(paths) == 0:
-            del self.qchannel_paths_map[qchannel.name]
+            del self.qchannel_paths_map[qchannel.id]
 
     @override
     def qubit_has_path_id(self) -> bool:
@@ -83,7 +84,7 @@ class MuxSchemeDynamicBase(MuxScheme):
         assert qubit.path_id is None
         assert qubit.qchannel is not None, f"{self.node}: No qubit-qchannel assignment. Not supported."
 
-        possible_path_ids = self.qchannel_paths_map.get(qubit.qchannel.name, [])
+        possible_path_ids = self.qchannel_paths_map.get(qubit.qchannel.id, [])
         if not possible_path_ids:
             log.debug(f"{self.node}: release entangled qubit {qubit.addr} due to uninstalled path")
             self.fw.release_qubit(qubit, need_remove=True)
@@ -100,6 +101,10 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
 
     SelectSwapQubit_random: SelectSwapQubit = lambda _fw, _mt, candidates: candidates[rng.choice(len(candidates))]
 
+    SelectSwapQubit_highest_fidelity: SelectSwapQubit = lambda _fw, _mt, candidates: max(
+        candidates, key=lambda mt: mt[1].fidelity
+    )
+
     type SelectPath = Callable[["Forwarder", Entanglement, Entanglement, list[int]], int | FibEntry]
 
     SelectPath_random: SelectPath = lambda _fw, _e0, _e1, candidates: candidates[rng.choice(len(candidates))]
@@ -127,6 +132,34 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
         self._select_swap_qubit = select_swap_qubit
         self._select_path = select_path
         self.coordinated_decisions = coordinated_decisions
+        self._matched_keys: dict[tuple[int, frozenset[int] | None], list[SwapCandidateKey]] = {}
+        """
+        Cached ``swap_candidate_keys`` results, keyed by (qchannel.id, tmp_path_ids).
+        This is cleared when a path is installed or uninstalled.
+        """
+
+    @override
+    def install_path_neighbor(
+        self,
+        instructions: PathInstructions,
+        fib_entry: FibEntry,
+        direction: PathDirection,
+        neighbor: QNode,
+        qchannel: QuantumChannel,
+    ) -> None:
+        super().install_path_neighbor(instructions, fib_entry, direction, neighbor, qchannel)
+        self._matched_keys.clear()
+
+    @override
+    def uninstall_path_neighbor(
+        self,
+        fib_entry: FibEntry,
+        direction: PathDirection,
+        neighbor: QNode,
+        qchannel: QuantumChannel,
+    ) -> None:
+        super().uninstall_path_neighbor(fib_entry, direction, neighbor, qchannel)
+        self._matched_keys.clear()
 
     @override
     def validate_path_instructions(self, instructions: PathInstructions):
@@ -175,26 +208,36 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
         assert min(rank_diff) == max(rank_diff)  # failure means one route is a substring of another route, unsupported
         return rank_diff[0] <= 0
 
+    @override
+    def swap_candidate_keys(
+        self, qubit: MemoryQubit, epr: Entanglement, fib_entry: FibEntry | None
+    ) -> Iterable[SwapCandidateKey]:
+        _ = fib_entry
+        assert qubit.qchannel is not None
+
+        cache_key = (qubit.qchannel.id, epr.tmp_path_ids)
+        keys = self._matched_keys.get(cache_key)
+        if keys is None:
+            # find qchannels whose qubits may be used with this qubit
+            # use path_ids to look for acceptable qchannels for swapping, excluding the qubit's qchannel
+            keys = self._matched_keys[cache_key] = [
+                (None, channel, None)
+                for channel, path_ids in self.qchannel_paths_map.items()
+                if channel != qubit.qchannel.id and has_intersect_tmp_path_ids(epr.tmp_path_ids, path_ids)
+            ]
+        return keys
+
     @override
     def find_swap_candidate(
         self, qubit: MemoryQubit, epr: Entanglement, fib_entry: FibEntry | None, input: MemoryEprIterator
     ) -> tuple[MemoryQubit, FibEntry] | None:
-        assert qubit.qchannel is not None
-
-        # find qchannels whose qubits may be used with this qubit
-        # use path_ids to look for acceptable qchannels for swapping, excluding the qubit's qchannel
-        matched_channels = {
-            channel
-            for channel, path_ids in self.qchannel_paths_map.items()
-            if channel != qubit.qchannel.name and has_intersect_tmp_path_ids(epr.tmp_path_ids, path_ids)
-        }
+        _ = qubit
 
-        # find another qubit to swap with
+        # find another qubit to swap with, among qubits assigned to matched channels
         candidates = (
             (q, v)
             for (q, v) in input
-            if (q.qchannel is not None and q.qchannel.name in matched_channels)  # assigned to a matched channel
-            and has_intersect_tmp_path_ids(epr.tmp_path_ids, v.tmp_path_ids)  # has overlapping tmp_path_ids
+            if has_intersect_tmp_path_ids(epr.tmp_path_ids, v.tmp_path_ids)  # has overlapping tmp_path_ids
         )
         mt1 = self._select_swap_candidate((qubit, epr), candidates)
         if mt1 is None:
@@ -0,0 +1,164 @@
+from collections.abc import Hashable, Iterator
+from typing import override
+
+from mqns.entity.memory import MemoryQubit, PathDirection, QubitState
+
+
+class QubitIndex[K: Hashable]:
+    """
+    Index of memory qubits in a particular state, grouped by key.
+
+    A qubit that has left the state, or whose key has changed, is pruned or moved lazily
+    when its group is iterated.
+    """
+
+    def __init__(self, state: QubitState):
+        """
+        Args:
+            state: Qubit state of indexed qubits.
+        """
+        self.state = state
+        """Qubit state of indexed qubits."""
+        self._groups: dict[K, dict[int, MemoryQubit]] = {}
+        """Qubits in each group, keyed by address."""
+        self._keys: dict[int, K] = {}
+        """Group key of each indexed qubit, keyed by address."""
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _add(self, qubit: MemoryQubit, key: K) -> None:
+        self.discard(qubit)
+        self._keys[qubit.addr] = key
+        self._groups.setdefault(key, {})[qubit.addr] = qubit
+
+    def discard(self, qubit: MemoryQubit) -> None:
+        """
+        Remove a qubit if it is indexed.
+        """
+        key = self._keys.pop(qubit.addr, None)
+        if key is None:
+            return
+        group = self._groups[key]
+        del group[qubit.addr]
+        if not group:
+            del self._groups[key]
+
+    def clear(self) -> None:
+        """
+        Remove all qubits.
+        """
+        self._groups.clear()
+        self._keys.clear()
+
+    def _current_key(self, qubit: MemoryQubit, key: K) -> K | None:
+        """
+        Determine the current group key of an indexed qubit that is still in ``self.state``.
+
+        Args:
+            qubit: Indexed qubit.
+            key: Group key at insertion time.
+
+        Returns:
+            Current group key, or None if the qubit should be removed.
+        """
+        _ = qubit
+        return key
+
+    def find(self, *keys: K) -> Iterator[MemoryQubit]:
+        """
+        Iterate over qubits in the specified groups.
+
+        Qubits are visited in ascending address order, same as a ``QuantumMemory.find()`` scan.
+        """
+        found: list[MemoryQubit] = []
+        for key in keys:
+            group = self._groups.get(key)
+            if group is None:
+                continue
+            for qubit in list(group.values()):
+                current = self._current_key(qubit, key) if qubit.state is self.state else None
+                if current is None:
+                    self.discard(qubit)
+                elif current != key:
+                    self._add(qubit, current)
+                else:
+                    found.append(qubit)
+        found.sort(key=lambda q: q.addr)
+        return iter(found)
+
+
+type SwapCandidateKey = tuple[int | None, int, PathDirection | None]
+"""
+Group key of an ELIGIBLE qubit in ``SwapCandidateIndex``.
+
+* [0]: ``qubit.path_id``, None if the multiplexing scheme does not assign qubits to paths.
+* [1]: ``qubit.qchannel.id``.
+* [2]: ``qubit.path_direction``, None if the multiplexing scheme does not assign qubits to paths.
+"""
+
+
+def swap_candidate_key(qubit: MemoryQubit) -> SwapCandidateKey:
+    """Compute the group key of a qubit."""
+    assert qubit.qchannel is not None
+    return (qubit.path_id, qubit.qchannel.id, qubit.path_direction)
+
+
+class SwapCandidateIndex(QubitIndex[SwapCandidateKey]):
+    """
+    Index of memory qubits in ELIGIBLE state, used for finding swap candidates.
+
+    Qubits are grouped by ``SwapCandidateKey``.
+    """
+
+    def __init__(self):
+        super().__init__(QubitState.ELIGIBLE)
+
+    def add(self, qubit: MemoryQubit) -> None:
+        """
+        Insert an ELIGIBLE qubit into its group.
+        If the qubit is already indexed, it is moved.
+        """
+        self._add(qubit, swap_candidate_key(qubit))
+
+    @override
+    def _current_key(self, qubit: MemoryQubit, key: SwapCandidateKey) -> SwapCandidateKey | None:
+        _ = key
+        return swap_candidate_key(qubit)
+
+
+type PurifCandidateKey = tuple[int, int, int]
+"""
+Group key of a PURIF qubit in ``PurifCandidateIndex``.
+
+* [0]: ``partner.id`` of the EPR partner node.
+* [1]: ``path_id`` of the FIB entry used for purification.
+* [2]: ``qubit.purif_rounds``.
+"""
+
+
+class PurifCandidateIndex(QubitIndex[PurifCandidateKey]):
+    """
+    Index of memory qubits in PURIF state, used for finding auxiliary qubits for purification.
+
+    Qubits are grouped by ``PurifCandidateKey``.
+    """
+
+    def __init__(self):
+        super().__init__(QubitState.PURIF)
+
+    def add(self, qubit: MemoryQubit, partner_id: int, path_id: int) -> PurifCandidateKey:
+        """
+        Insert a PURIF qubit into its group.
+        If the qubit is already indexed, it is moved.
+
+        Returns:
+            Group key of the qubit.
+        """
+        key = (partner_id, path_id, qubit.purif_rounds)
+        self._add(qubit, key)
+        return key
+
+    @override
+    def _current_key(self, qubit: MemoryQubit, key: PurifCandidateKey) -> PurifCandidateKey | None:
+        return key if qubit.purif_rounds == key[2] else None
@@ -204,11 +204,11 @@ class RoutingPathMulti(RoutingPath):
         routes = self._query_routes(net)
 
         # Count usage of each quantum channel across all paths
-        qchannel_use_count = defaultdict[str, int](lambda: 0)
+        qchannel_use_count = defaultdict[int, int](lambda: 0)
         for route in routes:
             for name_a, name_b in pairwise(route):
                 ch = net.get_qchannel(name_a, name_b)
-                qchannel_use_count[ch.name] += 1
+                qchannel_use_count[ch.id] += 1
 
         # Process each path
         for path_id_add, route in enumerate(routes):
@@ -222,7 +222,7 @@ class RoutingPathMulti(RoutingPath):
                 node_a = net.get_node(name_a)
                 node_b = net.get_node(name_b)
                 ch = net.get_qchannel(name_a, name_b)
-                shared = qchannel_use_count.get(ch.name)
+                shared = qchannel_use_count.get(ch.id)
                 assert shared is not None
 
                 qubits_a = sum(1 for _ in node_a.memory.find(lambda *_: True, qchannel=ch))
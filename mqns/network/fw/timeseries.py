@@ -0,0 +1,166 @@
+import math
+from typing import Any
+
+import numpy as np
+
+from mqns.utils import json_encodable
+
+type ConsumedSeriesKey = tuple[int, int | None]
+"""
+Key of a time series in ``ConsumedTimeSeries``.
+
+* [0]: ``req_id`` of the request.
+* [1]: ``path_id`` of the path, None if the multiplexing scheme does not identify the path.
+"""
+
+_N_ROWS = 4
+_ROW_COUNT, _ROW_SUM_FIDELITY, _ROW_N_LATENCY, _ROW_SUM_LATENCY = range(_N_ROWS)
+
+
+@json_encodable
+class ConsumedTimeSeries:
+    """
+    Windowed statistics of consumed entanglements, one time series per request and path.
+
+    Simulation time is divided into bins of ``bin_width`` seconds, starting from ``origin``.
+    Each bin records how many entanglements were consumed, and their mean fidelity and latency.
+    Arrays are preallocated for ``capacity`` bins and doubled when the simulation runs longer.
+    """
+
+    def __init__(self, bin_width: float, capacity: int = 64):
+        """
+        Args:
+            bin_width: Bin width in seconds.
+            capacity: Initial number of bins in each time series, typically the simulation duration divided by bin width.
+        """
+        assert bin_width > 0
+        assert capacity > 0
+        self.bin_width = bin_width
+        """Bin width in seconds."""
+        self.origin = 0.0
+        """Start time of the first bin in seconds, typically the simulation start time."""
+        self._capacity = capacity
+        self._n_bins = 0
+        self._data: dict[ConsumedSeriesKey, np.ndarray] = {}
+        """
+        Accumulators of each time series, each is a 2D array of ``_N_ROWS`` rows and one column per bin.
+        """
+
+    def align(self, start: float, end: float | None = None) -> None:
+        """
+        Align bins to a simulation that starts at ``start`` seconds, and optionally ensure capacity until ``end`` seconds.
+        This must be called before any entanglement is consumed.
+        """
+        assert self._n_bins == 0, "cannot align ConsumedTimeSeries after recording"
+        self.origin = start
+        if end is not None:
+            self._capacity = max(self._capacity, math.ceil((end - start) / self.bin_width) + 1)
+
+    def add(self, key: ConsumedSeriesKey, t: float, fidelity: float, latency: float | None) -> None:
+        """
+        Record a consumed entanglement.
+
+        Args:
+            key: Request and path.
+            t: Consumption time in seconds.
+            fidelity: Fidelity at consumption time.
+            latency: Latency in seconds, None if unknown.
+        """
+        assert t >= self.origin, "consumption time is before the first bin"
+        i = int((t - self.origin) / self.bin_width)
+        data = self._data.get(key)
+        if data is None:
+            self._capacity = max(self._capacity, i + 1)
+            data = self._data[key] = np.zeros((_N_ROWS, self._capacity), dtype=np.float64)
+        elif i >= data.shape[1]:
+            data = self._data[key] = self._grow(data, i + 1)
+
+        col = data[:, i]
+        col[_ROW_COUNT] += 1
+        col[_ROW_SUM_FIDELITY] += fidelity
+        if latency is not None:
+            col[_ROW_N_LATENCY] += 1
+            col[_ROW_SUM_LATENCY] += latency
+        self._n_bins = max(self._n_bins, i + 1)
+
+    def _grow(self, data: np.ndarray, n_bins: int) -> np.ndarray:
+        self._capacity = max(2 * self._capacity, n_bins)
+        grown = np.zeros((_N_ROWS, self._capacity), dtype=np.float64)
+        grown[:, : data.shape[1]] = data
+        return grown
+
+    def merge(self, other: "ConsumedTimeSeries") -> None:
+        """
+        Merge time series of another instance into this instance.
+        Both instances must have the same bin width and origin.
+        """
+        assert self.bin_width == other.bin_width, "cannot merge ConsumedTimeSeries with different bin width"
+        assert self.origin == other.origin, "cannot merge ConsumedTimeSeries with different origin"
+        for key, src in other._data.items():
+            n = min(src.shape[1], other._n_bins)
+            data = self._data.get(key)
+            if data is None:
+                data = self._data[key] = np.zeros((_N_ROWS, max(self._capacity, n)), dtype=np.float64)
+            elif n > data.shape[1]:
+                data = self._data[key] = self._grow(data, n)
+            data[:, :n] += src[:, :n]
+        self._n_bins = max(self._n_bins, other._n_bins)
+
+    def keys(self) -> list[ConsumedSeriesKey]:
+        """Requests and paths that have consumed entanglements."""
+        return list(self._data)
+
+    @property
+    def times(self) -> np.ndarray:
+        """Start time of each bin in seconds."""
+        return self.origin + np.arange(self._n_bins, dtype=np.float64) * self.bin_width
+
+    def _row(self, key: ConsumedSeriesKey, row: int) -> np.ndarray:
+        values = np.zeros(self._n_bins, dtype=np.float64)
+        data = self._data.get(key)
+        if data is not None:
+            n = min(data.shape[1], self._n_bins)
+            values[:n] = data[row, :n]
+        return values
+
+    def count(self, key: ConsumedSeriesKey) -> np.ndarray:
+        """Number of consumed entanglements in each bin."""
+        return self._row(key, _ROW_COUNT).astype(np.int64)
+
+    def throughput(self, key: ConsumedSeriesKey) -> np.ndarray:
+        """Consumed entanglements per second in each bin."""
+        return self._row(key, _ROW_COUNT) / self.bin_width
+
+    def mean_fidelity(self, key: ConsumedSeriesKey) -> np.ndarray:
+        """Mean fidelity of consumed entanglements in each bin, NaN if none was consumed."""
+        return self._mean(self._row(key, _ROW_SUM_FIDELITY), self._row(key, _ROW_COUNT))
+
+    def mean_latency(self, key: ConsumedSeriesKey) -> np.ndarray:
+        """Mean latency in seconds of consumed entanglements in each bin, NaN if none was consumed."""
+        return self._mean(self._row(key, _ROW_SUM_LATENCY), self._row(key, _ROW_N_LATENCY))
+
+    @property
+    def series(self) -> list[dict[str, Any]]:
+        """
+        All time series, in a form suitable for JSON encoding.
+        Mean values of empty bins are None, because NaN is not valid JSON.
+        """
+        return [
+            {
+                "req_id": key[0],
+                "path_id": key[1],
+                "count": self.count(key),
+                "mean_fidelity": self._nan_to_none(self.mean_fidelity(key)),
+                "mean_latency": self._nan_to_none(self.mean_latency(key)),
+            }
+            for key in self._data
+        ]
+
+    @staticmethod
+    def _nan_to_none(values: np.ndarray) -> list[float | None]:
+        return [None if math.isnan(v) else v for v in values.tolist()]
+
+    @staticmethod
+    def _mean(total: np.ndarray, n: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(n > 0, total / n, np.nan)
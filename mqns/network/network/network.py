@@ -30,7 +30,7 @@ from typing import cast, overload
 from mqns.entity.base_channel import BaseChannel
 from mqns.entity.cchannel import ClassicChannel
 from mqns.entity.node import Controller, Node, QNode
-from mqns.entity.qchannel import QuantumChannel
+from mqns.entity.qchannel import LinkArchBase, QuantumChannel
 from mqns.models.epr import Entanglement, WernerStateEntanglement
 from mqns.network.network.request import Request, RequestAttr
 from mqns.network.network.timing import TimingMode, TimingModeAsync
@@ -40,25 +40,28 @@ from mqns.simulator import Simulator
 from mqns.utils import rng
 
 
-def _save_channel[C: BaseChannel](l: list[C], d: dict[tuple[str, str], C], ch: C):
+def _save_channel[C: BaseChannel](l: list[C], by_name: dict[str, C], by_ends: dict[tuple[str, str], C], ch: C):
+    assert ch.name not in by_name, f"duplicate channel name {ch.name}"
+    ch.id = len(l)
     l.append(ch)
+    by_name[ch.name] = ch
     if len(ch.node_list) != 2:
         return
     a, b = sorted((node.name for node in cast(list[Node], ch.node_list)))
-    d[(a, b)] = ch
+    by_ends[(a, b)] = ch
 
 
-def _get_channel[C: BaseChannel](l: list[C], d: dict[tuple[str, str], C], q: tuple[str, ...]):
+def _get_channel[C: BaseChannel](by_name: dict[str, C], by_ends: dict[tuple[str, str], C], q: tuple[str, ...]):
     if len(q) == 1:
         name = q[0]
-        for ch in l:
-            if ch.name == name:
-                return ch
-        raise IndexError(f"channel {name} does not exist")
+        try:
+            return by_name[name]
+        except KeyError:
+            raise IndexError(f"channel {name} does not exist")
 
     a, b = sorted(q)
     try:
-        return d[(a, b)]
+        return by_ends[(a, b)]
     except KeyError:
         raise IndexError(f"channel between {a} and {b} does not exist")
 
@@ -93,13 +96,15 @@ class QuantumNetwork:
         self.controller: Controller | None = None
         """Controller node."""
         self.nodes: list[QNode] = []
-        """List of quantum nodes."""
+        """List of quantum nodes, indexed by ``QNode.id``."""
         self._node_by_name: dict[str, QNode] = {}
         self.qchannels: list[QuantumChannel] = []
-        """List of quantum channels."""
+        """List of quantum channels, indexed by ``QuantumChannel.id``."""
+        self._qchannel_by_name: dict[str, QuantumChannel] = {}
         self._qchannel_by_ends: dict[tuple[str, str], QuantumChannel] = {}
         self.cchannels: list[ClassicChannel] = []
-        """List of classic channels."""
+        """List of classic channels, indexed by ``ClassicChannel.id``."""
+        self._cchannel_by_name: dict[str, ClassicChannel] = {}
         self._cchannel_by_ends: dict[tuple[str, str], ClassicChannel] = {}
 
         if topo is not None:
@@ -145,10 +150,14 @@ class QuantumNetwork:
         self.simulator = simulator
         """Simulator instance."""
 
+        # cached LinkArch.set() results must not carry over from a previous simulation
+        LinkArchBase.clear_cache()
+
         self.all_nodes: list[Node] = []
-        """A collection of quantum nodes and the controller (if present)."""
+        """A collection of quantum nodes and the controller (if present), indexed by ``Node.id``."""
         self.all_nodes += self.nodes
         if self.controller:
+            self.controller.id = len(self.all_nodes)
             self.all_nodes.append(self.controller)
 
         self.timing.install(self)
@@ -162,6 +171,7 @@ class QuantumNetwork:
         """
         self._ensure_not_installed()
         assert node.name not in self._node_by_name, f"duplicate node name {node.name}"
+        node.id = len(self.nodes)
         self.nodes.append(node)
         self._node_by_name[node.name] = node
         node.add_network(self)
@@ -202,7 +212,7 @@ class QuantumNetwork:
         Add a QuantumChannel into this network.
         """
         self._ensure_not_installed()
-        _save_channel(self.qchannels, self._qchannel_by_ends, qchannel)
+        _save_channel(self.qchannels, self._qchannel_by_name, self._qchannel_by_ends, qchannel)
 
     @overload
     def get_qchannel(self, name: str, /) -> QuantumChannel:
@@ -223,14 +233,14 @@ class QuantumNetwork:
         """
 
     def get_qchannel(self, *q: str) -> QuantumChannel:
-        return _get_channel(self.qchannels, self._qchannel_by_ends, q)
+        return _get_channel(self._qchannel_by_name, self._qchannel_by_ends, q)
 
     def add_cchannel(self, cchannel: ClassicChannel):
         """
         Add a ClassicChannel into this network.
         """
         self._ensure_not_installed()
-        _save_channel(self.cchannels, self._cchannel_by_ends, cchannel)
+        _save_channel(self.cchannels, self._cchannel_by_name, self._cchannel_by_ends, cchannel)
 
     @overload
     def get_cchannel(self, name: str, /) -> ClassicChannel:
@@ -251,7 +261,7 @@ class QuantumNetwork:
         """
 
     def get_cchannel(self, *q: str) -> ClassicChannel:
-        return _get_channel(self.cchannels, self._cchannel_by_ends, q)
+        return _get_channel(self._cchannel_by_name, self._cchannel_by_ends, q)
 
     def build_route(self):
         """Build static route tables for each nodes"""
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import os
 import queue
 import threading
@@ -277,7 +278,7 @@ class ClassicBridge(Application[Node]):
 
     def inject(self, cbp: ClassicBridgePacket) -> None:
         dst = self.node.network.get_node(cbp.dst)
-        pkt = ClassicPacket(cbp.payload, src=self.node, dest=dst)
+        pkt = ClassicPacket(json.loads(cbp.payload) if cbp.is_json else cbp.payload, src=self.node, dest=dst)
         pkt.is_json = cbp.is_json
         log.debug(f"{self.node}: ClassicBridge injects packet to {cbp.dst} | {pkt.msg}")
         self.node.send_cpacket(dst, pkt)
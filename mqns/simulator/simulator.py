@@ -67,10 +67,22 @@ class Simulator:
         self._pool = pool_typ(self.ts.time_slot, None if self.te is None else self.te.time_slot)
         self.total_events = 0
         """How many events have been inserted into the simulator."""
+        self._next_epr_id = 0
 
         for install_target in install_to:
             install_target.install(self)
 
+    def next_epr_id(self) -> int:
+        """
+        Allocate an identifier for an elementary entanglement.
+
+        Identifiers are consecutive nonnegative integers starting from zero in each simulator,
+        so that repeated simulations with the same seed assign the same identifiers.
+        """
+        epr_id = self._next_epr_id
+        self._next_epr_id += 1
+        return epr_id
+
     @property
     def tc(self) -> Time:
         """
@@ -18,6 +18,7 @@
 from mqns.utils.json import json_default, json_encodable
 from mqns.utils.logger import log
 from mqns.utils.random import rng
+from mqns.utils.stats import StreamingStats
 from mqns.utils.timeout import WallClockTimeout
 
 __all__ = [
@@ -25,6 +26,7 @@ __all__ = [
     "json_encodable",
     "log",
     "rng",
+    "StreamingStats",
     "WallClockTimeout",
 ]
 
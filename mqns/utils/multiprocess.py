@@ -18,11 +18,12 @@
 import itertools
 import multiprocessing
 import signal
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import pandas as pd
 
-from mqns.utils.log import logger as log
+from mqns.utils.logger import log
+from mqns.utils.stats import StreamingStats
 
 
 class MPSimulations:
@@ -51,6 +52,13 @@ class MPSimulations:
 
         self.data = pd.DataFrame()
         self.aggregated_data = pd.DataFrame()
+        self.merged: Dict[int, Dict[str, Any]] = {}
+        """
+        Mergeable results of each setting group, keyed by ``_group`` and then by result key.
+
+        A result value that is a ``ForwarderCounters`` or ``StreamingStats`` is merged across repeats
+        of the same setting with its ``merge()`` method, instead of being placed in ``data``.
+        """
 
         self._setting_list = []
         self._current_simulation_count = 0
@@ -98,6 +106,8 @@ class MPSimulations:
             pool.terminate()
             pool.join()
 
+        from mqns.network.fw import ForwarderCounters  # noqa: PLC0415
+
         for r in result:
             try:
                 raw_data = r.get()
@@ -106,6 +116,13 @@ class MPSimulations:
                 continue
             new_result = {}
             for k, v in raw_data.items():
+                if isinstance(v, (ForwarderCounters, StreamingStats)):
+                    merged = self.merged.setdefault(raw_data["_group"], {})
+                    if k in merged:
+                        merged[k].merge(v)
+                    else:
+                        merged[k] = v
+                    continue
                 new_result[k] = [v]
             result_pd = pd.DataFrame(new_result)
             self.data = pd.concat([self.data, result_pd], ignore_index=True)
@@ -160,6 +177,18 @@ class MPSimulations:
         """
         return self.aggregated_data if self.aggregate else self.data
 
+    def get_merged(self, group: int) -> Dict[str, Any]:
+        """Get the mergeable results of a setting group, merged across its repeats.
+
+        Args:
+            group (int): the ``_group`` of the setting.
+
+        Returns:
+            a dictionary from result key to merged value, e.g. ``ForwarderCounters``
+
+        """
+        return self.merged.get(group, {})
+
     def get_raw_data(self):
         """Get the original raw results, no matter aggregate is ``True`` or not.
 
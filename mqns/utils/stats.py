@@ -0,0 +1,143 @@
+import math
+from collections.abc import Iterable
+from typing import Self
+
+import numpy as np
+
+from mqns.utils.json import json_encodable
+
+
+@json_encodable
+class StreamingStats:
+    """
+    Constant-memory statistics of a stream of values.
+
+    * Count, mean, and variance are computed with Welford's algorithm.
+    * Quantiles are estimated from a fixed-bin histogram, with error bounded by the bin width.
+
+    Two instances with the same bin edges can be merged, e.g. counters of different nodes
+    or counters returned from different simulation processes.
+
+    JSON encoding includes summary statistics but not the histogram.
+    """
+
+    def __init__(self, edges: Iterable[float]):
+        """
+        Args:
+            edges: Monotonically increasing histogram bin edges.
+                   Values below the first edge or at/above the last edge are counted in underflow/overflow bins.
+        """
+        self._edges = np.asarray(edges, dtype=np.float64)
+        assert self._edges.ndim == 1
+        assert len(self._edges) >= 2
+        assert np.all(np.diff(self._edges) > 0)
+        self._counts = np.zeros(len(self._edges) + 1, dtype=np.int64)
+        self.n = 0
+        """Number of values."""
+        self.mean = 0.0
+        """Mean of values, zero if there are no values."""
+        self._m2 = 0.0
+        self.min = math.inf
+        """Minimum value."""
+        self.max = -math.inf
+        """Maximum value."""
+
+    @classmethod
+    def linear(cls, lo: float, hi: float, n_bins: int) -> Self:
+        """
+        Construct with ``n_bins`` equal-width bins between ``lo`` and ``hi``.
+        """
+        return cls(np.linspace(lo, hi, n_bins + 1))
+
+    @classmethod
+    def logarithmic(cls, lo: float, hi: float, n_bins: int) -> Self:
+        """
+        Construct with ``n_bins`` bins between ``lo`` and ``hi`` whose widths grow geometrically.
+        This suits nonnegative values that span several orders of magnitude, such as latency.
+        """
+        return cls(np.concatenate(([0.0], np.geomspace(lo, hi, n_bins))))
+
+    def histogram(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve the histogram.
+
+        Returns:
+            [0]: Bin edges.
+            [1]: Counts, one more than the number of edges.
+                 ``[0]`` counts values below ``edges[0]``;
+                 ``[i]`` counts values in ``[edges[i-1], edges[i])``;
+                 ``[-1]`` counts values at or above ``edges[-1]``.
+        """
+        return self._edges, self._counts
+
+    def add(self, value: float) -> None:
+        """
+        Add a value.
+        """
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self._counts[np.searchsorted(self._edges, value, side="right")] += 1
+
+    def merge(self, other: "StreamingStats") -> None:
+        """
+        Merge values of another instance into this instance.
+        Both instances must have the same bin edges.
+        """
+        assert np.array_equal(self._edges, other._edges), "cannot merge StreamingStats with different bin edges"
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self._m2 += other._m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._counts += other._counts
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of values, zero if there are fewer than two values."""
+        if self.n < 2:
+            return 0.0
+        return self._m2 / (self.n - 1)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of values."""
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0.0, 1.0], e.g. 0.5 for median.
+
+        Returns:
+            Estimated quantile, interpolated linearly within the histogram bin and clamped to observed range.
+            NaN if there are no values.
+        """
+        assert 0.0 <= q <= 1.0
+        if self.n == 0:
+            return math.nan
+
+        rank = q * self.n
+        cum = np.cumsum(self._counts)
+        i = min(int(np.searchsorted(cum, rank, side="left")), len(self._counts) - 1)
+        if i == 0:
+            return self.min
+        if i == len(self._counts) - 1:
+            return self.max
+
+        lo, hi = self._edges[i - 1], self._edges[i]
+        below = cum[i - 1]
+        frac = (rank - below) / self._counts[i]
+        return float(min(max(lo + (hi - lo) * frac, self.min), self.max))
+
+    def __repr__(self) -> str:
+        return f"n={self.n} mean={self.mean} std={self.std} p50={self.quantile(0.5)} p95={self.quantile(0.95)}"
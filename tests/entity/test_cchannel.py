@@ -1,9 +1,12 @@
 from typing import override
 
+import pytest
+
 from mqns.entity.cchannel import ClassicChannel, ClassicPacket, RecvClassicPacket
 from mqns.entity.node import Node
 from mqns.models.delay import NormalDelayModel, UniformDelayModel
-from mqns.simulator import Event, Simulator, Time
+from mqns.simulator import Event, Simulator, Time, func_to_event
+from mqns.utils import rng
 
 
 class ClassicRecvNode(Node):
@@ -76,3 +79,114 @@ def test_cchannel_uniform_delay():
 
     s = Simulator(0, 10, accuracy=1000, install_to=(n1, n2))
     s.run()
+
+
+def test_classic_packet():
+    n1, n2 = Node("n1"), Node("n2")
+
+    msg = {"cmd": "PING", "seq": [1, 2]}
+    pkt = ClassicPacket(msg, src=n1, dest=n2)
+    assert pkt.is_json is True
+    assert pkt._len == -1
+    assert pkt.get() is msg
+    assert len(pkt) == len('{"cmd": "PING", "seq": [1, 2]}')
+    assert pkt.encode() == b'{"cmd": "PING", "seq": [1, 2]}'
+
+    pkt = ClassicPacket("ping", src=n1, dest=n2)
+    assert pkt.is_json is False
+    assert pkt.get() == "ping"
+    assert len(pkt) == 4
+    assert pkt.encode() == b"ping"
+
+
+def test_cchannel_no_serialization():
+    received: list[RecvClassicPacket] = []
+
+    class CollectNode(Node):
+        def handle(self, event: Event) -> None:
+            assert isinstance(event, RecvClassicPacket)
+            received.append(event)
+
+    n1, n2 = Node("n1"), CollectNode("n2")
+    l1 = ClassicChannel(name="l1", delay=0.1)
+    n1.add_cchannel(l1)
+    n2.add_cchannel(l1)
+
+    s = Simulator(0, 1, accuracy=1000, install_to=(n1, n2))
+    msg = {"cmd": "PING"}
+    pkt = ClassicPacket(msg, src=n1, dest=n2)
+    l1.send(pkt, n2)
+    s.run()
+
+    assert len(received) == 1
+    assert received[0].packet is pkt
+    assert received[0].packet.get() is msg
+    assert pkt._len == -1  # length is not computed on a channel without bandwidth limit
+
+
+def test_cchannel_coalesce():
+    received: list[tuple[Time, str]] = []
+
+    class CollectNode(Node):
+        def handle(self, event: Event) -> None:
+            assert isinstance(event, RecvClassicPacket)
+            received.append((event.t, event.packet.get()))
+
+    n1, n2 = Node("n1"), CollectNode("n2")
+    l1 = ClassicChannel(name="l1", bandwidth=1000, delay=0.1, coalesce=True)
+    n1.add_cchannel(l1)
+    n2.add_cchannel(l1)
+
+    def send(*msgs: str):
+        for msg in msgs:
+            l1.send(ClassicPacket(msg, src=n1, dest=n2), n2)
+
+    s = Simulator(0, 1, accuracy=1000, install_to=(n1, n2))
+    s.add_event(func_to_event(s.time(sec=0.2), send, "a", "b"))
+    s.add_event(func_to_event(s.time(sec=0.2), send, "c"))
+    s.add_event(func_to_event(s.time(sec=0.5), send, "d"))
+    s.run()
+
+    # 3 send events + 2 coalesced transmissions + 2 packet arrivals
+    assert s.total_events == 7
+    t_abc, t_d = s.time(sec=0.3), s.time(sec=0.6)
+    assert received == [(t_abc, "a"), (t_abc, "b"), (t_abc, "c"), (t_d, "d")]
+
+
+def test_cchannel_coalesce_batch(monkeypatch: pytest.MonkeyPatch):
+    received: list[tuple[Node, str | bytes]] = []
+
+    class CollectNode(Node):
+        def handle(self, event: Event) -> None:
+            assert isinstance(event, RecvClassicPacket)
+            received.append((event.packet.src, event.packet.get()))
+
+    n0, n1, n2 = Node("n0"), Node("n1"), CollectNode("n2")
+    l1 = ClassicChannel(name="l1", bandwidth=1000, delay=0.1, drop_rate=0.5, coalesce=True)
+    n1.add_cchannel(l1)
+    n2.add_cchannel(l1)
+
+    packet_lens: list[int] = []
+    send0 = l1._send
+
+    def send_wrapper(**kwargs):
+        packet_lens.append(kwargs["packet_len"])
+        return send0(**kwargs)
+
+    monkeypatch.setattr(l1, "_send", send_wrapper)
+    draws = iter([0.9, 0.1, 0.9])
+    monkeypatch.setattr(rng, "random", lambda: next(draws))
+
+    def send():
+        l1.send(ClassicPacket(b"aaa", src=n1, dest=n2), n2)
+        l1.send(ClassicPacket("bb", src=n0, dest=n2), n2)
+        l1.send(ClassicPacket(b"c", src=n1, dest=n2), n2)
+
+    s = Simulator(0, 1, accuracy=1000, install_to=(n1, n2))
+    s.add_event(func_to_event(s.time(sec=0.2), send))
+    s.run()
+
+    # batch length is the sum of enclosed packet lengths, including str and bytes messages
+    assert packet_lens == [6]
+    # random drop is decided per enclosed packet; enclosed packets keep their own source
+    assert received == [(n1, b"aaa"), (n1, b"c")]
@@ -6,10 +6,25 @@ import pytest
 from mqns.entity.base_channel import default_light_speed
 from mqns.entity.memory import QuantumMemory
 from mqns.entity.node import QNode
-from mqns.entity.qchannel import LinkArch, LinkArchDimBk, LinkArchDimBkSeq, LinkArchDimDual, LinkArchSim, LinkArchSr
+from mqns.entity.qchannel import (
+    LinkArch,
+    LinkArchBase,
+    LinkArchDimBk,
+    LinkArchDimBkSeq,
+    LinkArchDimDual,
+    LinkArchSim,
+    LinkArchSr,
+)
 from mqns.models.delay import ConstantDelayModel, DelayModel
 from mqns.models.epr import Entanglement, MixedStateEntanglement, WernerStateEntanglement
-from mqns.models.error import DepolarErrorModel, ErrorModel, parse_time_decay, time_decay_nop
+from mqns.models.error import (
+    BitFlipErrorModel,
+    DephaseErrorModel,
+    DepolarErrorModel,
+    ErrorModel,
+    parse_time_decay,
+    time_decay_nop,
+)
 from mqns.simulator import Simulator, Time
 
 
@@ -155,3 +170,92 @@ def test_realistic_error(LA: type[LinkArch], w_or_probv: float | tuple[float, fl
         assert epr.w == pytest.approx(w_or_probv, abs=1e-6)
     elif type(epr) is MixedStateEntanglement:
         assert epr.probv == pytest.approx(w_or_probv, abs=1e-6)
+
+
+def test_set_cache():
+    LinkArchBase.clear_cache()
+    t_cohere = Time.from_sec(0.100, accuracy=ACCURACY)
+
+    def set_link_arch(link_arch: LinkArch, ch: FakeQuantumChannel):
+        # each memory parses its own decay function, which must not prevent sharing
+        store_decay = parse_time_decay(None, t_cohere)
+        link_arch.set(
+            ch=ch,
+            eta_s=0.9,
+            eta_d=0.9,
+            reset_time=0,
+            tau_0=0.000001,
+            epr_type=WernerStateEntanglement,
+            t0=Time(0, accuracy=ACCURACY),
+            store_decays=(store_decay, store_decay),
+        )
+
+    la0, la1, la2 = LinkArchDimBk(), LinkArchDimBk(), LinkArchDimBk()
+    set_link_arch(la0, FakeQuantumChannel(50.0, transfer_error_rate=0.001))
+    set_link_arch(la1, FakeQuantumChannel(50.0, transfer_error_rate=0.001))
+    assert len(LinkArchBase._set_cache) == 1
+    assert la1.success_prob == la0.success_prob
+    assert la1.delays(3) == la0.delays(3)
+    assert la1._make_epr is la0._make_epr
+
+    # different error model parameters yield a separate cache entry
+    set_link_arch(la2, FakeQuantumChannel(50.0, transfer_error_rate=0.002))
+    assert len(LinkArchBase._set_cache) == 2
+    assert la2.success_prob == la0.success_prob
+    epr0, _, _ = make_epr(la0, t_cohere)
+    epr2, _, _ = make_epr(la2, t_cohere)
+    assert epr2.fidelity < epr0.fidelity
+
+    # different link architecture type yields a separate cache entry
+    la3 = LinkArchDimBkSeq()
+    set_link_arch(la3, FakeQuantumChannel(50.0, transfer_error_rate=0.001))
+    assert len(LinkArchBase._set_cache) == 3
+    assert la3.delays(3) != la0.delays(3)
+
+    LinkArchBase.clear_cache()
+    assert len(LinkArchBase._set_cache) == 0
+    set_link_arch(la1, FakeQuantumChannel(50.0, transfer_error_rate=0.001))
+    assert la1._make_epr is not la0._make_epr
+    assert la1.success_prob == la0.success_prob
+
+
+def test_set_cache_error_models():
+    LinkArchBase.clear_cache()
+
+    def set_link_arch(transfer_error: ErrorModel) -> LinkArch:
+        ch = FakeQuantumChannel(50.0)
+        ch.transfer_error = transfer_error.set(rate=0.01, length=0)
+        link_arch = LinkArchDimBk()
+        link_arch.set(
+            ch=ch,
+            eta_s=0.9,
+            eta_d=0.9,
+            reset_time=0,
+            tau_0=0.000001,
+            epr_type=MixedStateEntanglement,
+            t0=Time(0, accuracy=ACCURACY),
+        )
+        return link_arch
+
+    # same type and rate but different Pauli ratios must not share a cache entry
+    la_z = set_link_arch(DephaseErrorModel())
+    la_x = set_link_arch(BitFlipErrorModel())
+    assert len(LinkArchBase._set_cache) == 2
+    t_cohere = Time.from_sec(0.100, accuracy=ACCURACY)
+    epr_z, _, _ = make_epr(la_z, t_cohere)
+    epr_x, _, _ = make_epr(la_x, t_cohere)
+    assert isinstance(epr_z, MixedStateEntanglement)
+    assert isinstance(epr_x, MixedStateEntanglement)
+    assert epr_z.probv[1] > 0
+    assert epr_z.probv[2] == 0
+    assert epr_x.probv[2] > 0
+    assert epr_x.probv[1] == 0
+
+    # cache size is bounded, evicting the oldest entry
+    LinkArchBase._set_cache_size, size0 = 2, LinkArchBase._set_cache_size
+    try:
+        set_link_arch(DepolarErrorModel())
+        assert len(LinkArchBase._set_cache) == 2
+    finally:
+        LinkArchBase._set_cache_size = size0
+        LinkArchBase.clear_cache()
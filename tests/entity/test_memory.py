@@ -31,6 +31,7 @@ class TwoNodes:
 
     def make_epr(self, name: str) -> WernerStateEntanglement:
         return WernerStateEntanglement(
+            id=self.s.next_epr_id(),
             name=name,
             decohere_time=self.s.tc + self.m1.t_decohere,
             fidelity_time=self.s.tc,
@@ -57,6 +58,7 @@ def test_write_and_read_with_path_and_key():
     qubit = mem.write(key, epr1)
     assert qubit is not None
     assert qubit.addr == addr
+    assert mem.locate(epr1.id) == addr
 
     # Should fail to write another one in the same slot
     epr2 = scenario.make_epr("epr2")
@@ -67,6 +69,9 @@ def test_write_and_read_with_path_and_key():
     qubit, data = mem.read("epr1", has=WernerStateEntanglement, remove=True)
     assert data.name == "epr1"
     assert mem._usage == 0
+    assert mem.locate(epr1.id) is None
+    with pytest.raises(IndexError):
+        mem.locate(epr1.id, must=True)
 
     with pytest.raises(ValueError, match="data at 0 is not"):
         mem.read(qubit.addr, has=WernerStateEntanglement)
@@ -111,6 +116,7 @@ def test_decoherence_event_removes_qubit():
 
     res = mem.read("epr3")
     assert res is None
+    assert mem.locate(epr.id) is None
     assert qubit.state is QubitState.RELEASE, f"unexpected state {qubit.state}"
 
 
@@ -8,7 +8,7 @@ import pytest
 
 from mqns.entity.timer import Timer
 from mqns.models.epr import Entanglement, MixedStateEntanglement, WernerStateEntanglement
-from mqns.network.fw import RoutingPathSingle, RoutingPathStatic, SwapSequenceInput
+from mqns.network.fw import ForwarderCounters, RoutingPathSingle, RoutingPathStatic, SwapSequenceInput
 from mqns.network.network import TimingModeAsync, TimingModeSync
 from mqns.network.proactive import ProactiveForwarder
 from mqns.network.protocol.link_layer import LinkLayer
@@ -46,6 +46,26 @@ def test_4_swap(epr_type: type[Entanglement], timing_mode: str, swap: SwapSequen
     assert f4.cnt.n_consumed >= 16
     assert -4 <= f1.cnt.n_consumed - f4.cnt.n_consumed <= 4
 
+    # streaming statistics cover every consumed entanglement
+    assert f1.cnt.consumed_fidelity.n == f1.cnt.n_consumed
+    assert f1.cnt.consumed_latency.n == f1.cnt.n_consumed
+    assert f1.cnt.consumed_latency.min > 0.0
+    assert f1.cnt.consumed_fidelity.quantile(0.5) == pytest.approx(f1.cnt.consumed_avg_fidelity, abs=0.1)
+
+    # windowed time series per request and path
+    series = f1.cnt.consumed_series
+    assert len(series.keys()) == 1
+    count = series.count(series.keys()[0])
+    assert len(count) <= 31  # end time falls into its own bin
+    assert count.sum() == f1.cnt.n_consumed
+
+    merged = ForwarderCounters()
+    merged.merge(f1.cnt)
+    merged.merge(f4.cnt)
+    assert merged.n_consumed == f1.cnt.n_consumed + f4.cnt.n_consumed
+    assert merged.consumed_fidelity.n == merged.n_consumed
+    assert merged.n_purif == []
+
 
 def test_rect_uninstall_path():
     """Test uninstall_path in rectangle topology."""
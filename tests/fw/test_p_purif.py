@@ -6,6 +6,7 @@ import pytest
 
 from mqns.network.fw import RoutingPathSingle
 from mqns.network.proactive import ProactiveForwarder
+from mqns.simulator import func_to_event
 from mqns.utils import rng
 
 from .fw_common import (
@@ -68,6 +69,34 @@ def test_link_rounds(monkeypatch: pytest.MonkeyPatch, n_rounds: int, purif_succe
     assert f1.cnt.n_consumed == n_eligible == f2.cnt.n_consumed
 
 
+def test_purif_waiting(monkeypatch: pytest.MonkeyPatch):
+    """Test precomputed purification scheme and waiting qubits at the primary node."""
+    net, simulator = build_linear_network(3, qchannel_capacity=4, fw={"p_swap": 0.0})
+    n1, n2, n3 = (net.get_node(f"n{i}") for i in range(1, 4))
+    f1, f2, f3 = (node.get_app(ProactiveForwarder) for node in (n1, n2, n3))
+
+    rp = install_path(net, RoutingPathSingle("n1", "n3", swap=[0, 0, 0], purif={"n1-n2": 1, "n1-n3": 2, "n2-n3": 0}))
+    provide_entanglements(*((1.001 + i / 1000, f1, f2) for i in range(3)))
+    force_purify_outcome(monkeypatch, True)
+
+    def check_purif_waiting():
+        fib_entry = f2.fib.get(rp.path_id)
+        assert fib_entry.purif_segments == {(0, 1): 1, (0, 2): 2}
+        assert fib_entry.want_purif_rounds(1, 0) == 1
+        assert fib_entry.want_purif_rounds(0, 2) == 2
+        assert fib_entry.want_purif_rounds(2, 1) == 0
+
+        # first and second EPRs are being purified; third EPR is waiting at primary node
+        assert f1.cnt.n_entg == 3
+        assert len(f1.purif_waiting) == 1
+        (mq,) = f1.purif_waiting.find((n2.id, rp.path_id, 0))
+        assert mq.purif_rounds == 0
+        assert len(f2.purif_waiting) == 0
+
+    simulator.add_event(func_to_event(simulator.time(sec=1.005), check_purif_waiting))
+    simulator.run()
+
+
 def test_4_l2r(monkeypatch: pytest.MonkeyPatch):
     """Test multi-segment purification on 4-node topology with l2r swapping order."""
     net, simulator = build_linear_network(4, qchannel_capacity=8, fw={"p_swap": 1.0})
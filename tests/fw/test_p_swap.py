@@ -8,7 +8,7 @@ import pytest
 
 from mqns.entity.timer import Timer
 from mqns.models.delay import ConstantDelayModel
-from mqns.models.epr import Entanglement, MixedStateEntanglement
+from mqns.models.epr import Entanglement, MixedStateEntanglement, WernerStateEntanglement
 from mqns.models.error import PerfectErrorModel
 from mqns.network.fw import (
     Fib,
@@ -19,6 +19,7 @@ from mqns.network.fw import (
     QubitAllocationType,
     RoutingPathMulti,
     RoutingPathSingle,
+    SignalingMode,
 )
 from mqns.network.network import TimingModeSync
 from mqns.network.proactive import ProactiveForwarder
@@ -63,6 +64,28 @@ def test_3_disabled():
     assert f2.cnt.n_swapped == 0
 
 
+def test_fib_route_nodes():
+    """Test precomputed node information in FIB entry."""
+    net, simulator = build_linear_network(4)
+    n1, n2, n3, n4 = (net.get_node(f"n{i}") for i in range(1, 5))
+    ch12, ch23, ch34 = net.get_qchannel("n1", "n2"), net.get_qchannel("n2", "n3"), net.get_qchannel("n3", "n4")
+    rp = install_path(net, RoutingPathSingle("n1", "n4", swap=[2, 0, 1, 2]))
+
+    def check_fib_entry():
+        fib_entry = n2.get_app(ProactiveForwarder).fib.get(rp.path_id)
+        assert fib_entry.own == (1, 0, n2, (n1, ch12), (n3, ch23))
+        assert fib_entry.find_route_node("n1") == (0, 2, n1, None, (n2, ch12))
+        assert fib_entry.find_route_node("n4") == (3, 2, n4, (n3, ch34), None)
+        assert fib_entry.find_index_and_swap_rank("n3") == (2, 1)
+        assert fib_entry.next_hop_toward("n1") is n1
+        assert fib_entry.next_hop_toward("n4") is n3
+        with pytest.raises(IndexError):
+            fib_entry.find_route_node("n5")
+
+    simulator.add_event(func_to_event(simulator.time(sec=1.0), check_fib_entry))
+    simulator.run()
+
+
 @pytest.mark.parametrize(
     ("t_ext", "expected"),
     [
@@ -145,6 +168,59 @@ def test_4_asap(etg_ms: tuple[int, int, int], n_swapped_p: int):
     assert f2.cnt.n_swapped_p == n_swapped_p == f3.cnt.n_swapped_p
 
 
+def test_swap_records_capacity():
+    """Test capacity limit of swapping records, counted separately from expiry."""
+    net, simulator = build_linear_network(3, fw={"p_swap": 1.0, "swap_records_capacity": 1})
+    f1 = net.get_node("n1").get_app(ProactiveForwarder)
+    assert f1.swap.remote_swapped.capacity == 1
+
+    epr_a = WernerStateEntanglement(decohere_time=simulator.time(sec=2))
+    epr_b = WernerStateEntanglement(decohere_time=simulator.time(sec=1))
+    f1.swap.remote_swapped.set(epr_a.id, epr_a, epr_a.decohere_time)
+    f1.swap.remote_swapped.set(epr_b.id, epr_b, epr_b.decohere_time)
+    assert f1.cnt.n_swap_records_evicted == 1
+    assert epr_a.id in f1.swap.remote_evicted
+    assert epr_b.id in f1.swap.remote_swapped
+
+    simulator.add_event(func_to_event(simulator.time(sec=1.5), f1.swap.expire_records))
+    simulator.run()
+    assert f1.cnt.n_swap_records_expired == 1
+    assert f1.cnt.n_swap_records_evicted == 1
+    assert epr_b.id not in f1.swap.remote_swapped
+
+
+@pytest.mark.parametrize("signaling", [SignalingMode.DIRECT, SignalingMode.DIRECT_NOTIFY])
+def test_5_signaling(signaling: SignalingMode):
+    """Test direct signaling mode in 5-node topology, compared against hop-by-hop signaling."""
+
+    def run(signaling: SignalingMode):
+        net, simulator = build_linear_network(5, fw={"p_swap": 1.0, "signaling": signaling})
+        fws = [net.get_node(f"n{i}").get_app(ProactiveForwarder) for i in range(1, 6)]
+        install_path(net, RoutingPathSingle("n1", "n5", swap=[2, 0, 1, 0, 2]))
+        provide_entanglements(
+            (1.001, fws[0], fws[1]),
+            (1.002, fws[1], fws[2]),
+            (1.001, fws[2], fws[3]),
+            (1.002, fws[3], fws[4]),
+        )
+        simulator.run()
+        print_fw_counters(net)
+        n_observed = [fw.cnt.n_signaling_observed for fw in fws]
+        return simulator.total_events, [fw.node.get_app(QubitReleaseLoggerApp).history for fw in fws], n_observed
+
+    n_events_hop, history_hop, _ = run(SignalingMode.HOP_BY_HOP)
+    n_events_direct, history_direct, n_observed = run(signaling)
+    assert history_direct == history_hop
+    assert len(history_hop[0]) == 1  # end-to-end entanglement consumed
+    if signaling is SignalingMode.DIRECT:
+        assert n_events_direct < n_events_hop
+        assert n_observed == [0] * 5
+    else:
+        assert n_events_direct == n_events_hop
+        # n2 and n4 each observe the swap heralding that n3 sends toward n1 and n5
+        assert n_observed == [0, 1, 0, 1, 0]
+
+
 @pytest.mark.parametrize(
     ("ps3", "delay3", "n_swap2", "n_consumed", "t_release"),
     [
@@ -2,10 +2,20 @@
 Test suite for simple data structure objects in forwarding.
 """
 
+import json
+
+import numpy as np
 import pytest
 
-from mqns.network.fw import parse_swap_sequence
+from mqns.entity.memory import MemoryQubit, PathDirection, QubitState
+from mqns.entity.node import QNode
+from mqns.entity.qchannel import QuantumChannel
+from mqns.network.fw import ConsumedTimeSeries, Fib, FibEntry, parse_swap_sequence
+from mqns.network.fw.expiring_dict import ExpiringDict
 from mqns.network.fw.message import validate_path_instructions
+from mqns.network.fw.qubit_index import SwapCandidateIndex
+from mqns.simulator import Time
+from mqns.utils import json_default
 
 
 def test_parse_swap_sequence():
@@ -83,3 +93,196 @@ def test_path_validation():
         validate_path_instructions(
             {"req_id": 0, "route": route3, "swap": swap3, "swap_cutoff": scut3, "m_v": mv3, "purif": {"n3-n1": 1}}
         )
+
+
+def test_fib_find_request_by_ends():
+    """Test ``Fib.find_request_by_ends`` method."""
+    nodes = [QNode(name) for name in ("n1", "n2", "n3")]
+    qchannels = [QuantumChannel("ch0"), QuantumChannel("ch1")]
+
+    def make_entry(path_id: int, req_id: int, idx: list[int]) -> FibEntry:
+        return FibEntry(
+            path_id=path_id,
+            req_id=req_id,
+            route=[nodes[i].name for i in idx],
+            own_idx=0,
+            swap=[0] * len(idx),
+            swap_cutoff=[None] * len(idx),
+            purif={},
+            nodes=[nodes[i] for i in idx],
+            qchannels=qchannels[: len(idx) - 1],
+        )
+
+    fib = Fib()
+    fib.insert_or_replace(make_entry(1, 10, [0, 1, 2]))
+    fib.insert_or_replace(make_entry(2, 10, [0, 1, 2]))
+    fib.insert_or_replace(make_entry(3, 20, [0, 1, 2]))
+    fib.insert_or_replace(make_entry(4, 30, [1, 2]))
+
+    def by_scan(src: str, dst: str):
+        return next(fib.find_request(lambda g: g.src == src and g.dst == dst), None)
+
+    for src, dst in (("n1", "n3"), ("n2", "n3"), ("n3", "n1"), ("n1", "n2")):
+        assert fib.find_request_by_ends(src, dst) is by_scan(src, dst)
+    rg = fib.find_request_by_ends("n1", "n3")
+    assert rg is not None
+    assert rg.req_id == 10
+
+    fib.erase(1)
+    assert fib.find_request_by_ends("n1", "n3") is rg  # request 10 still has path 2
+    fib.erase(2)
+    rg = fib.find_request_by_ends("n1", "n3")
+    assert rg is not None
+    assert rg.req_id == 20
+    fib.erase(3)
+    fib.erase(4)
+    assert fib.find_request_by_ends("n1", "n3") is None
+    assert fib.by_ends == {}
+
+
+def test_swap_candidate_index():
+    """Test ``SwapCandidateIndex`` class."""
+
+    ch0, ch1 = QuantumChannel("ch0"), QuantumChannel("ch1")
+    ch0.id, ch1.id = 0, 1
+
+    def make_eligible(addr: int, ch: QuantumChannel, direction: PathDirection | None) -> MemoryQubit:
+        q = MemoryQubit(addr)
+        q.qchannel = ch
+        if direction is not None:
+            q.path_id, q.path_direction = 7, direction
+        for state in (
+            QubitState.ACTIVE,
+            QubitState.RESERVED,
+            QubitState.ENTANGLED0,
+            QubitState.ENTANGLED1,
+            QubitState.PURIF,
+            QubitState.ELIGIBLE,
+        ):
+            q.state = state
+        return q
+
+    index = SwapCandidateIndex()
+    q0 = make_eligible(0, ch0, None)
+    q1 = make_eligible(1, ch1, None)
+    q2 = make_eligible(2, ch1, None)
+    q3 = make_eligible(3, ch1, PathDirection.R)
+    for q in (q2, q0, q1, q3):
+        index.add(q)
+    assert len(index) == 4
+
+    # qubits are visited in ascending address order, regardless of group order and insertion order
+    assert list(index.find((None, 1, None), (None, 0, None))) == [q0, q1, q2]
+    assert list(index.find((7, 1, PathDirection.R))) == [q3]
+    assert list(index.find((7, 1, PathDirection.L))) == []
+
+    # re-adding an indexed qubit does not duplicate it
+    index.add(q2)
+    assert list(index.find((None, 1, None))) == [q1, q2]
+
+    # qubits that left ELIGIBLE state are pruned during iteration
+    q1.state = QubitState.SWAPPING
+    assert list(index.find((None, 1, None))) == [q2]
+    assert len(index) == 3
+
+    # qubits that have been reassigned are moved to their new group
+    q2.path_id, q2.path_direction = 7, PathDirection.R
+    assert list(index.find((None, 1, None))) == []
+    assert list(index.find((7, 1, PathDirection.R))) == [q2, q3]
+
+    index.discard(q3)
+    index.discard(q3)
+    assert list(index.find((7, 1, PathDirection.R))) == [q2]
+
+    index.clear()
+    assert len(index) == 0
+
+
+def test_expiring_dict():
+    """Test ``ExpiringDict`` class."""
+
+    def t(slot: int) -> Time:
+        return Time(slot, accuracy=1000)
+
+    evicted: list[tuple[str, int]] = []
+    d = ExpiringDict[str, int](3, on_evict=lambda key, value: evicted.append((key, value)))
+    d.set("a", 1, t(10))
+    d.set("b", 2, t(5))
+    d.set("c", 3, Time.SENTINEL)
+    assert len(d) == 3
+    assert d.get("a") == 1
+    assert "b" in d
+
+    # replacing existing key does not evict
+    d.set("a", 11, t(20))
+    assert len(d) == 3
+    assert d.n_evicted == 0
+
+    # full: evict entry with earliest deadline
+    d.set("d", 4, t(30))
+    assert "b" not in d
+    assert d.n_evicted == 1
+    assert evicted == [("b", 2)]
+
+    # entries expire after their deadlines; SENTINEL does not expire
+    assert d.expire(t(20)) == 0
+    assert d.expire(t(21)) == 1
+    assert "a" not in d
+    assert d.n_expired == 1
+    assert d.pop("d") == 4
+    assert d.pop("d") is None
+    assert d.expire(t(1000)) == 0
+    assert list(d) == ["c"]
+
+    # full without deadlines: evict oldest entry
+    d.set("e", 5, Time.SENTINEL)
+    d.set("f", 6, Time.SENTINEL)
+    d.set("g", 7, Time.SENTINEL)
+    assert list(d) == ["e", "f", "g"]
+    assert d.n_evicted == 2
+    assert evicted == [("b", 2), ("c", 3)]
+
+    d.clear()
+    assert len(d) == 0
+
+
+def test_consumed_time_series():
+    """Test ``ConsumedTimeSeries`` data structure."""
+    ts = ConsumedTimeSeries(0.5, capacity=2)
+    ts.add((1, 10), 0.1, 0.9, 0.01)
+    ts.add((1, 10), 0.2, 0.7, 0.03)
+    ts.add((1, 10), 1.6, 0.8, None)  # beyond capacity
+    ts.add((2, None), 0.6, 0.95, 0.02)
+
+    assert ts.keys() == [(1, 10), (2, None)]
+    assert ts.times.tolist() == [0.0, 0.5, 1.0, 1.5]
+    assert ts.count((1, 10)).tolist() == [2, 0, 0, 1]
+    assert ts.throughput((1, 10)).tolist() == [4.0, 0.0, 0.0, 2.0]
+    assert ts.mean_fidelity((1, 10))[[0, 3]].tolist() == pytest.approx([0.8, 0.8])
+    assert ts.mean_latency((1, 10))[0] == pytest.approx(0.02)
+    assert np.isnan(ts.mean_latency((1, 10))[3])
+    assert ts.count((2, None)).tolist() == [0, 1, 0, 0]
+    assert ts.count((3, None)).tolist() == [0, 0, 0, 0]
+
+    other = ConsumedTimeSeries(0.5)
+    other.add((2, None), 2.2, 0.85, 0.04)
+    ts.merge(other)
+    assert ts.count((2, None)).tolist() == [0, 1, 0, 0, 1]
+    assert ts.count((1, 10)).tolist() == [2, 0, 0, 1, 0]
+
+    with pytest.raises(AssertionError):
+        ts.merge(ConsumedTimeSeries(1.0))
+
+    # empty bins encode as null instead of NaN, which is not valid JSON
+    d = json.loads(json.dumps(ts, default=json_default, allow_nan=False))
+    assert d["series"][0]["mean_latency"][1:] == [None, None, None, None]
+
+    # bins are aligned to the simulation start time
+    aligned = ConsumedTimeSeries(0.5)
+    aligned.align(10.2, 12.0)
+    aligned.add((1, None), 10.3, 0.9, None)
+    aligned.add((1, None), 10.8, 0.9, None)
+    assert aligned.times.tolist() == pytest.approx([10.2, 10.7])
+    assert aligned.count((1, None)).tolist() == [1, 1]
+    with pytest.raises(AssertionError):
+        ts.merge(aligned)
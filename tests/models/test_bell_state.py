@@ -1,3 +1,5 @@
+import pytest
+
 from mqns.models.core.state import (
     BELL_RHO_PHI_P,
     BELL_STATE_PHI_P,
@@ -7,6 +9,8 @@ from mqns.models.core.state import (
 )
 from mqns.models.epr import BellStateEntanglement
 from mqns.models.qubit import Qubit
+from mqns.simulator import Time
+from mqns.utils import rng
 
 
 def test_teleportation():
@@ -35,3 +39,21 @@ def test_to_qubits():
     state = q0.state.state()
     assert state is not None  # pure state
     assert qubit_state_equal(BELL_STATE_PHI_P, state)
+
+
+def test_purify(monkeypatch: pytest.MonkeyPatch):
+    def random(*args):
+        raise AssertionError("certain purification should not draw a random number")
+
+    monkeypatch.setattr(rng, "random", random)
+    now = Time(0, accuracy=1000000)
+    e1 = BellStateEntanglement()
+    e2 = BellStateEntanglement()
+    assert e1.purify(e2, now=now) is True
+    assert not e1.is_decohered
+    assert e2.is_decohered
+
+    kept = [BellStateEntanglement() for _ in range(2)]
+    consumed = [BellStateEntanglement() for _ in range(2)]
+    kept[1].is_decohered = True
+    assert BellStateEntanglement.purify_batch(kept, consumed, now=now) == [True, False]
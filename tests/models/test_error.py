@@ -3,6 +3,7 @@ from collections.abc import Sequence
 import numpy as np
 import pytest
 
+from mqns.models.core import KrausChannel, Operator
 from mqns.models.core.state import (
     QUBIT_RHO_0,
     QUBIT_STATE_0,
@@ -205,6 +206,29 @@ def test_parse_time_decay():
     )
 
 
+def test_time_decay_transfer():
+    t10 = Time(10, accuracy=1000)
+    decay = parse_time_decay("DEPOLAR:50:DISSIPATION:-0.040", t10, cache_size=2)
+    transfer = getattr(decay, "transfer")
+
+    for t in (20, 30, 20, 40, 20):
+        we0, we1 = WernerStateEntanglement(w=0.9), WernerStateEntanglement(w=0.9)
+        decay(we0, Time(t, accuracy=1000))
+        we1.apply_error(DepolarErrorModel().set(t=t / 1000, rate=50))
+        we1.apply_error(DissipationErrorModel().set(t=t / 1000, rate=25))
+        assert we0.w == pytest.approx(we1.w, abs=1e-9)
+
+        me0, me1 = MixedStateEntanglement(fidelity=0.9), MixedStateEntanglement(fidelity=0.9)
+        decay(me0, Time(t, accuracy=1000))
+        me1.apply_error(DepolarErrorModel().set(t=t / 1000, rate=50))
+        me1.apply_error(DissipationErrorModel().set(t=t / 1000, rate=25))
+        assert me0.probv == pytest.approx(me1.probv, abs=1e-9)
+
+    # each duration is computed once; 30 is evicted when 40 is inserted
+    info = transfer.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (7, 3, 2)
+
+
 @pytest.mark.parametrize(
     ("error", "success", "success_atol"),
     [
@@ -322,3 +346,72 @@ def test_chain():
     me = MixedStateEntanglement()
     me.apply_error(chain)
     assert me.probv == pytest.approx([0.813333, 0.12, 0.033333, 0.033333], abs=1e-6)
+
+
+def test_channel():
+    def sequential(rho: np.ndarray, kraus_sets: Sequence[np.ndarray]) -> np.ndarray:
+        for kraus in kraus_sets:
+            rho = sum((k @ rho @ k.conj().T for k in kraus), np.zeros_like(rho))
+        return rho
+
+    def ghz_rho(n: int) -> np.ndarray:
+        qubits = [Qubit(rho=QUBIT_RHO_0, name=f"q{i}") for i in range(n)]
+        H(qubits[0])
+        for q in qubits[1:]:
+            CNOT(qubits[0], q)
+        return qubits[0].state.rho
+
+    gamma = 0.3
+    damping = KrausChannel([np.array([[1, 0], [0, np.sqrt(1 - gamma)]]), np.array([[0, np.sqrt(gamma)], [0, 0]])])
+    assert damping.pauli is None
+    assert damping.unitary is None
+    with pytest.raises(AssertionError):
+        KrausChannel([np.array([[1, 0], [0, 0.5]])])
+
+    depolar = DepolarErrorModel().set(p_error=0.3).channel
+    dephase = DephaseErrorModel().set(p_error=0.2).channel
+    assert depolar.pauli == pytest.approx((0.7, 0.1, 0.1, 0.1))
+
+    rho = ghz_rho(3)
+    for idx in range(3):  # Pauli fast path and superoperator path agree with explicit Kraus sums
+        lifted = [
+            np.array([Operator(k, check_unitary=False).lift(idx, 3, check_unitary=False).u for k in c.kraus])
+            for c in (depolar, damping)
+        ]
+        assert qubit_rho_equal(depolar.apply(rho, [idx], 3), sequential(rho, lifted[:1]))
+        assert qubit_rho_equal(damping.apply(rho, [idx], 3), sequential(rho, lifted[1:]))
+        assert qubit_rho_equal(depolar.compose(damping).apply(rho, [idx], 3), sequential(rho, lifted))
+
+    pauli = depolar.compose(dephase)
+    assert pauli.pauli is not None
+    assert qubit_rho_equal(pauli.apply(rho, [1], 3), dephase.apply(depolar.apply(rho, [1], 3), [1], 3))
+
+    chain = ChainErrorModel([DepolarErrorModel(), PerfectErrorModel(), DephaseErrorModel()]).set(p_error=0.2)
+    assert chain.channel is not None
+    q0, q1 = Qubit(rho=QUBIT_RHO_0), Qubit(rho=QUBIT_RHO_0)
+    for q in (q0, q1):
+        H(q)
+    q0.apply_error(chain)
+    for m in chain.errors:
+        m.qubit(q1)
+    assert qubit_rho_equal(q0.state.rho, q1.state.rho)
+
+    # composed channel is cached until the chain or an enclosed error model is set
+    depolar, _, dephase = chain.errors
+    assert isinstance(depolar, DepolarErrorModel)
+    assert isinstance(dephase, DephaseErrorModel)
+    channel = chain.channel
+    assert chain.channel is channel
+    for update in (chain, depolar):
+        update.set(p_error=0.1 if update is chain else 0.3)
+        composed = chain.channel
+        assert composed is not None
+        assert composed is not channel
+        assert composed.pauli == pytest.approx(depolar.channel.compose(dephase.channel).pauli)
+        channel = composed
+
+    assert ChainErrorModel([DepolarErrorModel(), DissipationErrorModel()]).channel is None
+    q2 = Qubit()
+    q2.apply_error(PerfectErrorModel())
+    q2.apply_channel(PerfectErrorModel().channel)
+    assert q2.state.is_pure
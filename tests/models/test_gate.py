@@ -3,7 +3,7 @@ from collections.abc import Iterable
 import numpy as np
 import pytest
 
-from mqns.models.core.operator import OPERATOR_RX, OPERATOR_RY
+from mqns.models.core.operator import OPERATOR_PAULI_I, OPERATOR_PAULI_X, OPERATOR_RX, OPERATOR_RY, OPERATOR_RZ, Operator
 from mqns.models.core.state import (
     QUBIT_STATE_0,
     QUBIT_STATE_1,
@@ -129,6 +129,30 @@ def test_toffoli(v0: int, v1: int, expected_q2: int):
     assert q2.measure() == expected_q2
 
 
+def test_operator_cache():
+    # repeated CNOT reuses the cached controlled operator
+    CNOT(*make_qubits(1, 0))
+    info = Operator.cache_info()["controlled"]
+    for _ in range(3):
+        CNOT(*make_qubits(1, 0))
+    after = Operator.cache_info()["controlled"]
+    assert (after.hits, after.misses) == (info.hits + 3, info.misses)
+
+    # operators with equal content share the cached result, which is read-only
+    cnot = Operator([[0, 1], [1, 0]]).controlled()
+    assert cnot is OPERATOR_PAULI_X.controlled()
+    assert np.array_equal(cnot.u, np.kron(np.diag([1, 0]), OPERATOR_PAULI_I.u) + np.kron(np.diag([0, 1]), OPERATOR_PAULI_X.u))
+    assert not cnot.u.flags.writeable
+    assert OPERATOR_PAULI_X.lift(1, 3) is Operator([[0, 1], [1, 0]]).lift(1, 3)
+
+    # cache is bounded
+    assert info.maxsize is not None
+    for i in range(info.maxsize + 10):
+        OPERATOR_RZ(i / 100).controlled()
+    after = Operator.cache_info()["controlled"]
+    assert after.currsize == after.maxsize
+
+
 def test_bsm():
     q0, q1, q2, q3 = make_qubits(0, 0, 0, 0)
 
@@ -1,5 +1,12 @@
+import numpy as np
 import pytest
 
+from mqns.models.core.bell_diagonal import (
+    bell_diagonal_probv_to_pauli_transfer_mat,
+    compose_bell_diagonal_tuple,
+    make_bell_diagonal_probv,
+    normalize_bell_diagonal_tuple,
+)
 from mqns.models.core.state import (
     BELL_RHO_PHI_N,
     BELL_RHO_PHI_P,
@@ -37,6 +44,23 @@ def test_fidelity_conversion():
     assert e.probv == pytest.approx((0.5, 0.25, 0.125, 0.125), abs=1e-9)
 
 
+def test_bell_tuple():
+    a = normalize_bell_diagonal_tuple(6, 2, 1, 1)
+    assert a == pytest.approx(make_bell_diagonal_probv(6, 2, 1, 1), abs=1e-12)
+    assert normalize_bell_diagonal_tuple(0, 0, 0, 0) == (0.0, 0.0, 0.0, 0.0)
+
+    b = normalize_bell_diagonal_tuple(7, 1, 0.5, 1.5)
+    expected = bell_diagonal_probv_to_pauli_transfer_mat(np.array(a)) @ np.array(b)
+    assert compose_bell_diagonal_tuple(a, b) == pytest.approx(expected, abs=1e-12)
+    assert compose_bell_diagonal_tuple(a, b) == pytest.approx(compose_bell_diagonal_tuple(b, a), abs=1e-12)
+
+    e = MixedStateEntanglement(probv=np.array((4, 2, 1, 1), dtype=np.float64))
+    assert e.bell == pytest.approx((0.5, 0.25, 0.125, 0.125), abs=1e-9)
+    assert all(type(p) is float for p in e.bell)
+    e.set_bell((1, 1, 1, 1))
+    assert e.probv == pytest.approx((0.25, 0.25, 0.25, 0.25), abs=1e-9)
+
+
 def test_swap():
     now = Time(0, accuracy=1000000)
     decohere = now + 5.0
@@ -0,0 +1,263 @@
+import numpy as np
+import pytest
+
+from mqns.models.core import get_validation_level, set_validation_level
+from mqns.models.core import state as core_state
+from mqns.models.core.basis import BASIS_X, BASIS_Z
+from mqns.models.core.operator import (
+    OPERATOR_CNOT,
+    OPERATOR_H,
+    OPERATOR_PAULI_I,
+    OPERATOR_PAULI_X,
+    OPERATOR_PAULI_Y,
+    Operator,
+)
+from mqns.models.core.state import (
+    QUBIT_RHO_0,
+    QUBIT_STATE_0,
+    QUBIT_STATE_1,
+    QUBIT_STATE_P,
+    build_qubit_state,
+    check_qubit_rho,
+    normalize_qubit_rho,
+    qubit_rho_equal,
+    qubit_state_equal,
+    qubit_state_to_rho,
+)
+from mqns.models.error import DepolarErrorModel
+from mqns.models.qubit import QState, Qubit
+from mqns.models.qubit.gate import CNOT, H, T
+from mqns.utils import rng
+
+
+def make_ghz(n: int, *, pure: bool) -> list[Qubit]:
+    qubits = [Qubit(name=f"q{i}") if pure else Qubit(rho=QUBIT_RHO_0, name=f"q{i}") for i in range(n)]
+    H(qubits[0])
+    for q in qubits[1:]:
+        CNOT(qubits[0], q)
+    return qubits
+
+
+def test_pure_backend():
+    qubits = make_ghz(3, pure=True)
+    state = qubits[0].state
+    assert state.is_pure
+
+    dense = make_ghz(3, pure=False)[0].state
+    assert not dense.is_pure
+    assert qubit_rho_equal(state.rho, dense.rho)
+
+    pure = state.state()
+    assert pure is not None
+    assert qubit_rho_equal(qubit_state_to_rho(pure, 3), dense.rho)
+
+
+@pytest.mark.parametrize("random", [0.0, 0.99])
+def test_pure_measure(monkeypatch: pytest.MonkeyPatch, random: float):
+    monkeypatch.setattr(rng, "random", lambda: random)
+    pure = make_ghz(3, pure=True)
+    dense = make_ghz(3, pure=False)
+
+    for basis in (BASIS_X, BASIS_Z):
+        p0, d0 = pure.pop(0), dense.pop(0)
+        assert p0.state.measure(p0, basis) == d0.state.measure(d0, basis)
+        assert p0.state.is_pure
+        assert qubit_rho_equal(p0.state.rho, d0.state.rho)
+        assert pure[0].state.is_pure
+        assert qubit_rho_equal(pure[0].state.rho, dense[0].state.rho)
+    assert pure[0].state.qubits == pure
+
+
+def test_promote():
+    q0, q1 = make_ghz(2, pure=True)
+    state = q0.state
+
+    # single operator keeps the state pure
+    state.stochastic_operate([OPERATOR_PAULI_X.lift(0, 2)], [1.0])
+    assert state.is_pure
+
+    # mixture promotes to density matrix
+    rho = state.rho
+    state.stochastic_operate([OPERATOR_PAULI_I.lift(0, 2), OPERATOR_PAULI_X.lift(0, 2)], [0.5, 0.5])
+    assert not state.is_pure
+    x_rho = OPERATOR_PAULI_X.lift(0, 2)(rho)
+    assert qubit_rho_equal(state.rho, (rho + x_rho) / 2)
+    assert state.state() is None
+
+    # joining a pure state with a mixed state yields a mixed state
+    q2 = Qubit(QUBIT_STATE_P)
+    joint = QState.joint(q0, q2)
+    assert not joint.is_pure
+    assert joint.rho.shape == (8, 8)
+
+    # tracing out an entangled qubit promotes to density matrix
+    q3, q4 = make_ghz(2, pure=True)
+    q3.state.trace_out(q3)
+    assert not q4.state.is_pure
+    assert qubit_rho_equal(q4.state.rho, np.identity(2, dtype=np.complex128) / 2)
+    assert q3.state.is_pure
+    assert qubit_rho_equal(q3.state.rho, qubit_state_to_rho(QUBIT_STATE_0))
+
+
+def test_operator_apply():
+    n = 4
+    psi = build_qubit_state(rng.normal(size=2**n) + 1j * rng.normal(size=2**n), n)
+    rho = qubit_state_to_rho(psi, n)
+
+    for i in range(n):
+        full = OPERATOR_H.lift(i, n)
+        assert qubit_state_equal(OPERATOR_H.apply(psi, [i], n), full(psi))
+        assert qubit_rho_equal(OPERATOR_H.apply(rho, [i], n), full(rho))
+
+    # CNOT with control on qubit 3 and target on qubit 1, in reversed order
+    p0, p1, x, i2 = np.diag([1, 0]), np.diag([0, 1]), OPERATOR_PAULI_X.u, OPERATOR_PAULI_I.u
+    full = np.kron(np.kron(i2, i2), np.kron(i2, p0)) + np.kron(np.kron(i2, x), np.kron(i2, p1))
+    assert qubit_state_equal(OPERATOR_CNOT.apply(psi, [3, 1], n), full @ psi)
+
+    full_cnot = OPERATOR_CNOT.u
+    for _ in range(n - 2):
+        full_cnot = np.kron(full_cnot, OPERATOR_PAULI_I.u)
+    assert qubit_state_equal(OPERATOR_CNOT.apply(psi, [0, 1], n), full_cnot @ psi)
+    assert qubit_rho_equal(OPERATOR_CNOT.apply(rho, [0, 1], n), full_cnot @ rho @ full_cnot.conj().T)
+
+
+def test_operator_equality():
+    op0 = Operator([[0, 1], [1, 0]])
+    op1 = Operator([[0, 1], [1, 0]])
+    assert op0 == op1 == OPERATOR_PAULI_X
+    assert hash(op0) == hash(op1)
+    assert op0 != OPERATOR_H
+    assert len({op0, op1, OPERATOR_PAULI_X, OPERATOR_H}) == 2
+
+
+def test_tableau(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(QState, "use_tableau", True)
+    tab = make_ghz(3, pure=True)
+    assert tab[0].state.is_tableau
+    dense = make_ghz(3, pure=False)
+    assert qubit_rho_equal(tab[0].state.rho, dense[0].state.rho)
+    pure = tab[0].state.state()
+    assert pure is not None
+    assert qubit_state_equal(pure, build_qubit_state((1, 0, 0, 0, 0, 0, 0, 1), 3))
+
+    monkeypatch.setattr(rng, "random", lambda: 0.99)
+    for basis in (BASIS_X, BASIS_Z):
+        t0, d0 = tab.pop(0), dense.pop(0)
+        assert t0.state.measure(t0, basis) == d0.state.measure(d0, basis)
+        assert t0.state.is_tableau
+        assert qubit_rho_equal(t0.state.rho, d0.state.rho)
+        assert tab[0].state.is_tableau
+        assert qubit_rho_equal(tab[0].state.rho, dense[0].state.rho)
+
+    # non-Clifford operator converts to state vector
+    q0, q1 = make_ghz(2, pure=True)
+    T(q0)
+    assert not q0.state.is_tableau
+    assert q0.state.is_pure
+
+    # joint state of many qubits
+    ghz = make_ghz(200, pure=True)
+    assert ghz[0].state.num == 200
+    assert len({q.measure() for q in ghz}) == 1
+
+
+def test_tableau_noise(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(QState, "use_tableau", True)
+    monkeypatch.setattr(rng, "random", lambda: 0.95)
+
+    # Pauli channel samples one Pauli: cumulative probabilities of I,Z,X,Y are 0.7,0.8,0.9,1.0
+    q0, q1 = make_ghz(2, pure=True)
+    DepolarErrorModel().set(p_error=0.3).qubit(q0)
+    assert q0.state.is_tableau
+    ghz = build_qubit_state((1, 0, 0, 1), 2)
+    assert qubit_rho_equal(q0.state.rho, OPERATOR_PAULI_Y.lift(0, 2)(qubit_state_to_rho(ghz, 2)))
+
+    # stochastic operation of Clifford operators samples one operator
+    q0.state.stochastic_operate([OPERATOR_PAULI_I, OPERATOR_PAULI_Y], [0.5, 0.5], [0])
+    assert qubit_rho_equal(q0.state.rho, qubit_state_to_rho(ghz, 2))
+
+    # tracing out measures and discards the outcome
+    q0.state.trace_out(q0)
+    assert q1.state.is_tableau
+    assert q1.state.qubits == [q1]
+    assert qubit_rho_equal(q1.state.rho, qubit_state_to_rho(QUBIT_STATE_1))
+
+
+@pytest.mark.parametrize("backend", ["dense", "pure", "tableau"])
+def test_sample(monkeypatch: pytest.MonkeyPatch, backend: str):
+    monkeypatch.setattr(QState, "use_tableau", backend == "tableau")
+    qubits = make_ghz(3, pure=backend != "dense")
+    state = qubits[0].state
+    rho = state.rho
+
+    prob_z = state.probabilities()
+    assert prob_z == pytest.approx([0.5, 0, 0, 0, 0, 0, 0, 0.5])
+    prob_x = state.probabilities(BASIS_X)  # even parity outcomes only
+    assert prob_x == pytest.approx([0.25, 0, 0, 0.25, 0, 0.25, 0.25, 0])
+
+    shots_z = state.sample(200)
+    assert shots_z.shape == (200, 3)
+    assert np.all(shots_z == shots_z[:, :1])
+    assert 50 < np.sum(shots_z[:, 0]) < 150
+    shots_x = state.sample(200, BASIS_X)
+    assert np.all(np.sum(shots_x, axis=1) % 2 == 0)
+
+    # state is not collapsed
+    assert state.qubits == qubits
+    assert qubit_rho_equal(state.rho, rho)
+
+
+def test_validation_level():
+    level = get_validation_level()
+    invalid = np.diag([0.5, 0.6]).astype(np.complex128)  # trace is not 1
+    try:
+        set_validation_level("full")
+        with pytest.raises(AssertionError):
+            check_qubit_rho(invalid, intermediate=True)
+
+        set_validation_level("boundary")
+        check_qubit_rho(invalid, intermediate=True)
+        with pytest.raises(AssertionError):
+            Qubit(rho=invalid)
+
+        set_validation_level("off")
+        check_qubit_rho(invalid)
+        Qubit(rho=invalid)
+
+        with pytest.raises(ValueError, match="validation level"):
+            set_validation_level("none")  # pyright: ignore[reportArgumentType]
+        assert get_validation_level() == "off"
+    finally:
+        set_validation_level(level)
+
+
+def test_validation_level_env(monkeypatch: pytest.MonkeyPatch):
+    level = get_validation_level()
+    try:
+        monkeypatch.setenv("MQNS_VALIDATION", "boundary")
+        core_state._init_validation_level()
+        assert get_validation_level() == "boundary"
+
+        monkeypatch.setenv("MQNS_VALIDATION", "none")
+        with pytest.warns(UserWarning, match="MQNS_VALIDATION"):
+            core_state._init_validation_level()
+        assert get_validation_level() == "boundary"
+    finally:
+        set_validation_level(level)
+
+
+def test_normalize_clipping():
+    level = get_validation_level()
+    rho = np.diag([1 + 1e-6, -1e-6]).astype(np.complex128)  # rounding error yields a negative eigenvalue
+    try:
+        set_validation_level("full")
+        assert np.all(np.linalg.eigvalsh(normalize_qubit_rho(rho, intermediate=True)) >= 0)
+
+        set_validation_level("boundary")
+        assert np.all(np.linalg.eigvalsh(normalize_qubit_rho(rho)) >= 0)
+        assert np.linalg.eigvalsh(normalize_qubit_rho(rho, intermediate=True))[0] < 0
+
+        set_validation_level("off")
+        assert np.linalg.eigvalsh(normalize_qubit_rho(rho))[0] < 0
+    finally:
+        set_validation_level(level)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from mqns.models.core.state import (
@@ -8,7 +9,7 @@ from mqns.models.core.state import (
     qubit_state_equal,
 )
 from mqns.models.epr import Entanglement, WernerStateEntanglement
-from mqns.models.error import parse_time_decay
+from mqns.models.error import TimeDecayFunc, parse_time_decay, time_decay_nop, time_decay_werner_rate
 from mqns.simulator import Time
 from mqns.utils import rng
 
@@ -70,6 +71,57 @@ def test_swap_fidelity():
     assert ne2.fidelity == pytest.approx(0.965373043, abs=1e-6)
 
 
+def test_swap_lineage():
+    """
+    Validate lineage tree and identifier derivation after swaps.
+    """
+    now = micros(0)
+    e1, e2, e3, e4 = (WernerStateEntanglement(fidelity_time=now, decohere_time=now + 1.0) for _ in range(4))
+    assert e1.parents is None
+    assert e1.orig_eprs == []
+
+    # (e1 x e2) x (e3 x e4)
+    ne12, _ = Entanglement.swap(e1, e2, now=now)
+    ne34, _ = Entanglement.swap(e3, e4, now=now)
+    ne_a, _ = Entanglement.swap(ne12, ne34, now=now)
+    assert ne_a.parents == (ne12, ne34)
+    assert ne_a.orig_eprs == [e1, e2, e3, e4]
+
+    # ((e1 x e2) x e3) x e4
+    ne123, _ = Entanglement.swap(ne12, e3, now=now)
+    ne_b, _ = Entanglement.swap(ne123, e4, now=now)
+    assert list(ne_b.iter_orig_eprs()) == [e1, e2, e3, e4]
+
+    # same elementary entanglements yield same identifier, regardless of swapping order
+    assert ne_a.id == ne_b.id
+    assert ne_a.name == ne_b.name
+    assert len({e1.id, e2.id, e3.id, e4.id, ne12.id, ne34.id, ne123.id, ne_a.id}) == 8
+
+    # identifiers are exactly representable as IEEE 754 doubles, e.g. in JSON messages
+    assert all(abs(e.id) < 2**53 for e in (e1, ne12, ne34, ne123, ne_a))
+
+    # different order of elementary entanglements yields different identifier
+    ne21, _ = Entanglement.swap(e2, e1, now=now)
+    assert ne21.id != ne12.id
+
+
+def test_epr_id():
+    """
+    Validate identifier and name assignment.
+    """
+    e1 = WernerStateEntanglement(id=7)
+    assert e1.id == 7
+    assert e1.name == "etg_7"
+
+    e2 = WernerStateEntanglement(id=8, name="debug")
+    assert e2.name == "debug"
+
+    e3, e4 = WernerStateEntanglement(), WernerStateEntanglement()
+    assert e3.id < 0
+    assert e4.id < 0
+    assert e3.id != e4.id
+
+
 def test_swap_failure(monkeypatch: pytest.MonkeyPatch):
     now = micros(0)
     decohere = now + 1.0
@@ -129,6 +181,43 @@ def test_purify_decohered_input():
     assert e1.is_decohered
 
 
+def test_purify_batch(monkeypatch: pytest.MonkeyPatch):
+    now = Time(0, accuracy=1000000)
+    kept = [WernerStateEntanglement(fidelity=0.85) for _ in range(4)]
+    consumed = [WernerStateEntanglement(fidelity=f) for f in (0.85, 0.9, 0.85, 0.85)]
+    kept[3].is_decohered = True
+
+    draws: list[int] = []
+
+    def random(n: int):
+        draws.append(n)
+        return np.array([0.1, 0.1, 0.99, 0.1])
+
+    monkeypatch.setattr(rng, "random", random)
+    assert WernerStateEntanglement.purify_batch(kept, consumed, now=now) == [True, True, False, False]
+    assert draws == [4]
+
+    # same minimum fidelity yields same outcome
+    assert kept[0].fidelity == kept[1].fidelity > 0.85
+    assert kept[2].is_decohered
+    assert all(e.is_decohered for e in consumed[:3])
+
+
+def test_purify_perfect(monkeypatch: pytest.MonkeyPatch):
+    now = Time(0, accuracy=1000000)
+    draws: list[float] = []
+
+    def random():
+        draws.append(0.5)
+        return 0.5
+
+    monkeypatch.setattr(rng, "random", random)
+    e1 = WernerStateEntanglement(fidelity=1.0)
+    e2 = WernerStateEntanglement(fidelity=1.0)
+    assert e1.purify(e2, now=now) is True
+    assert draws == [0.5]  # a random number is drawn even if success is certain
+
+
 def test_to_qubits_maximal():
     e = WernerStateEntanglement()
     q0, q1 = e.to_qubits()
@@ -169,3 +258,42 @@ def test_to_qubits_decohered():
         state = q.state.state()
         assert state is not None
         assert qubit_state_equal(QUBIT_STATE_P, state)
+
+
+def test_time_decay_werner_rate():
+    t_cohere = micros(1000000)
+    assert time_decay_werner_rate(time_decay_nop) == 0.0
+    assert time_decay_werner_rate(parse_time_decay(None, t_cohere)) == pytest.approx(1e-6)
+    assert time_decay_werner_rate(parse_time_decay("DEPOLAR:2:DEPHASE:-0.5", t_cohere)) == pytest.approx(4e-6)
+    assert time_decay_werner_rate(parse_time_decay("PERFECT", t_cohere)) == 0.0
+    assert time_decay_werner_rate(lambda target, t: None) is None
+
+
+@pytest.mark.parametrize(
+    "decay_input",
+    [None, "DEPOLAR:50", "DEPHASE:20:BITFLIP:-0.1", "DISSIPATION:30", "PERFECT"],
+)
+def test_closed_form_decay(decay_input: str | None):
+    decay = parse_time_decay(decay_input, micros(100000))
+
+    def decay_wrapped(target, t):
+        decay(target, t)  # hides the closed form
+
+    def make(f0: TimeDecayFunc, f1: TimeDecayFunc):
+        return WernerStateEntanglement(
+            fidelity=0.97, fidelity_time=micros(0), decohere_time=micros(1000000), store_decays=(f0, f1)
+        )
+
+    closed = make(decay, time_decay_nop), make(decay, decay)
+    generic = make(decay_wrapped, time_decay_nop), make(decay_wrapped, decay_wrapped)
+    assert closed[0].decay_rate is not None
+    assert generic[0].decay_rate is None
+
+    now = micros(7000)
+    ne_closed, _ = Entanglement.swap(*closed, now=now)
+    ne_generic, _ = Entanglement.swap(*generic, now=now)
+    for c, g in zip(closed, generic, strict=True):
+        assert c.fidelity == pytest.approx(g.fidelity, abs=1e-12)
+        assert c.fidelity_time == g.fidelity_time == now
+        assert c.read
+    assert ne_closed.fidelity == pytest.approx(ne_generic.fidelity, abs=1e-12)
@@ -1,6 +1,6 @@
 from mqns.entity.node import Application, Controller, Node
 from mqns.network.network import QuantumNetwork, TimingModeSync, TimingPhase, TimingPhaseEvent
-from mqns.network.topology import BasicTopology
+from mqns.network.topology import BasicTopology, ClassicTopology, LinearTopology
 from mqns.simulator import Simulator
 
 
@@ -38,3 +38,26 @@ def test_timing_mode_sync():
         app = node.get_app(SyncCheckApp)
         assert app.enters == 12
         assert app.exits == 11
+
+
+def test_dense_ids():
+    topo = LinearTopology(4)
+    topo.controller = Controller("ctrl")
+    net = QuantumNetwork(topo, classic_topo=ClassicTopology.Follow)
+    topo.connect_controller(net.nodes)
+
+    for i, node in enumerate(net.nodes):
+        assert node.id == i
+        assert net.get_node(node.name) is node
+    for i, ch in enumerate(net.qchannels):
+        assert ch.id == i
+        assert net.get_qchannel(ch.name) is ch
+    for i, ch in enumerate(net.cchannels):
+        assert ch.id == i
+        assert net.get_cchannel(ch.name) is ch
+
+    ctrl = net.get_controller()
+    assert ctrl.id == -1
+    Simulator(0.0, 1.0, install_to=(net,))
+    assert ctrl.id == len(net.nodes)
+    assert net.all_nodes[ctrl.id] is ctrl
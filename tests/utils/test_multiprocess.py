@@ -0,0 +1,37 @@
+from typing import override
+
+import pytest
+
+from mqns.network.fw import ForwarderCounters
+from mqns.utils import StreamingStats
+from mqns.utils.multiprocess import MPSimulations
+
+
+class CountingSimulations(MPSimulations):
+    @override
+    def run(self, setting={}):
+        cnt = ForwarderCounters()
+        cnt.n_entg = setting["n"]
+        cnt.increment_n_consumed(0.9, 0.001 * (1 + setting["_repeat"]))
+        stats = StreamingStats.linear(0.0, 1.0, 10)
+        stats.add(0.1 * setting["_repeat"])
+        return {"n_entg": cnt.n_entg, "cnt": cnt, "stats": stats}
+
+
+def test_merge_counters():
+    sims = CountingSimulations(settings={"n": [1, 5]}, iter_count=3, cores=2)
+    sims.start()
+
+    # mergeable results are kept out of the DataFrame
+    assert list(sims.get_raw_data().columns) == ["n", "_repeat", "_group", "_id", "n_entg"]
+    assert sims.get_data()["n_entg_mean"].tolist() == [1, 5]
+
+    for group, n in enumerate([1, 5]):
+        merged = sims.get_merged(group)
+        cnt = merged["cnt"]
+        assert isinstance(cnt, ForwarderCounters)
+        assert cnt.n_entg == 3 * n
+        assert cnt.n_consumed == 3
+        assert cnt.consumed_latency.n == 3
+        assert merged["stats"].n == 3
+        assert merged["stats"].mean == pytest.approx(0.1)
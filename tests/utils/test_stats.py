@@ -0,0 +1,54 @@
+import json
+import math
+
+import numpy as np
+import pytest
+
+from mqns.utils import StreamingStats, json_default
+
+
+def test_streaming_stats():
+    values = np.random.default_rng(1).uniform(0.5, 1.0, 10000)
+
+    s = StreamingStats.linear(0.0, 1.0, 1000)
+    assert s.n == 0
+    assert math.isnan(s.quantile(0.5))
+    for value in values:
+        s.add(value)
+
+    assert s.n == len(values)
+    assert s.mean == pytest.approx(np.mean(values))
+    assert s.variance == pytest.approx(np.var(values, ddof=1))
+    assert s.min == np.min(values)
+    assert s.max == np.max(values)
+    for q in (0.0, 0.05, 0.5, 0.95, 1.0):
+        assert s.quantile(q) == pytest.approx(np.quantile(values, q), abs=0.002)
+
+    d = json.loads(json.dumps(s, default=json_default))
+    assert d["n"] == len(values)
+    assert d["std"] == pytest.approx(s.std)
+
+
+def test_streaming_stats_merge():
+    values = np.random.default_rng(2).exponential(0.01, 3000)
+
+    whole = StreamingStats.logarithmic(1e-6, 1e3, 901)
+    parts = [StreamingStats.logarithmic(1e-6, 1e3, 901) for _ in range(3)]
+    for i, value in enumerate(values):
+        whole.add(value)
+        parts[i % 3].add(value)
+
+    merged = StreamingStats.logarithmic(1e-6, 1e3, 901)
+    for part in parts:
+        merged.merge(part)
+
+    assert merged.n == whole.n
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.variance == pytest.approx(whole.variance)
+    assert merged.min == whole.min
+    assert merged.max == whole.max
+    assert np.array_equal(merged.histogram()[1], whole.histogram()[1])
+    assert merged.quantile(0.9) == pytest.approx(np.quantile(values, 0.9), rel=0.03)
+
+    with pytest.raises(AssertionError):
+        merged.merge(StreamingStats.linear(0.0, 1.0, 10))